@@ -94,6 +94,18 @@ class TestAPIServerCoverage:
             assert call_args[1]["port"] == 8000
             assert call_args[1]["reload"] is True
 
+    def test_server_main_disables_reload_in_production(self) -> None:
+        """Should not run the reloader outside development."""
+        with (
+            patch.dict("os.environ", {"ENVIRONMENT": "production"}),
+            patch("vtt_transcribe.api.server.uvicorn.run") as mock_run,
+        ):
+            from vtt_transcribe.api.server import main
+
+            main()
+
+            assert mock_run.call_args[1]["reload"] is False
+
 
 class TestAPIServer100Coverage:
     """Tests to achieve 100% coverage on api/server.py."""
@@ -229,6 +241,45 @@ class TestAPIAppLifespan:
 
             # Success if no exception was raised
 
+    @pytest.mark.asyncio
+    async def test_lifespan_sizes_default_executor(self) -> None:
+        """Should install a default executor sized by DEFAULT_EXECUTOR_WORKERS."""
+        import asyncio
+        import importlib
+
+        app_module = importlib.import_module("vtt_transcribe.api.app")
+        loop = asyncio.get_running_loop()
+
+        with (
+            patch.object(app_module, "init_db", new_callable=AsyncMock),
+            patch.object(app_module, "DEFAULT_EXECUTOR_WORKERS", 7),
+            patch.object(loop, "set_default_executor") as mock_set_executor,
+        ):
+            async with app_module.lifespan(MagicMock()):
+                pass
+
+        executor = mock_set_executor.call_args.args[0]
+        assert executor._max_workers == 7
+
+    @pytest.mark.asyncio
+    async def test_lifespan_shuts_down_default_executor(self) -> None:
+        """Should shut down the installed executor without waiting when the app stops."""
+        import asyncio
+        import importlib
+
+        app_module = importlib.import_module("vtt_transcribe.api.app")
+        loop = asyncio.get_running_loop()
+
+        with (
+            patch.object(app_module, "init_db", new_callable=AsyncMock),
+            patch.object(loop, "set_default_executor") as mock_set_executor,
+        ):
+            async with app_module.lifespan(MagicMock()):
+                executor = mock_set_executor.call_args.args[0]
+                assert not executor._shutdown
+
+        assert executor._shutdown
+
 
 class TestAPIModels:
     """Test vtt_transcribe/api/models.py __repr__ methods."""
@@ -409,3 +409,22 @@ class TestOAuthHelpers:
         assert not validate_frontend_url("not-a-url")
         assert not validate_frontend_url("")
         assert not validate_frontend_url("javascript:alert(1)")
+
+    async def test_github_user_info_requests_endpoints_concurrently(self, mock_oauth_client):
+        """Should request /user and /user/emails together and fall back to the primary email."""
+        from vtt_transcribe.api.routes.oauth import get_user_info_from_github
+
+        user_response = MagicMock(status_code=200)
+        user_response.json.return_value = {"login": "testuser", "email": None}
+        emails_response = MagicMock(status_code=200)
+        emails_response.json.return_value = [
+            {"email": "other@example.com", "primary": False},
+            {"email": "primary@example.com", "primary": True},
+        ]
+        mock_oauth_client.get = AsyncMock(side_effect=[user_response, emails_response])
+
+        email = await get_user_info_from_github(mock_oauth_client, {"access_token": "test-token"})
+
+        assert email == "primary@example.com"
+        requested_urls = [call.args[0] for call in mock_oauth_client.get.call_args_list]
+        assert requested_urls == ["https://api.github.com/user", "https://api.github.com/user/emails"]
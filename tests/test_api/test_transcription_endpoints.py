@@ -102,6 +102,19 @@ class TestJobStatusEndpoint:
         response = client.get(f"/api/jobs/{job_id}")
         assert response.status_code != 404
 
+    def test_job_status_matches_response_model(self, client):
+        """GET /jobs/{job_id} should return every job field except the progress queue."""
+        from vtt_transcribe.api.routes.transcription import Job, jobs
+
+        job_id = "status-model-job"
+        jobs.add(Job(job_id=job_id, filename="test.mp3", status="completed", result="done"))
+
+        response = client.get(f"/api/jobs/{job_id}")
+
+        assert response.status_code == 200
+        assert response.json() == jobs.get(job_id).to_dict()
+        assert "progress_updates" not in response.json()
+
     def test_job_status_returns_not_found_for_invalid_id(self, client):
         """GET /jobs/{job_id} should return 404 for non-existent job."""
         response = client.get("/api/jobs/nonexistent-job-id")
@@ -151,6 +164,63 @@ class TestSupportedFileTypes:
 
         assert response.status_code in [200, 201, 202]
 
+    def test_job_slots_work_across_event_loops(self) -> None:
+        """Contended job slots should not stay bound to the first event loop that used them."""
+        from vtt_transcribe.api.routes import transcription
+        from vtt_transcribe.api.routes.transcription import Job, jobs
+
+        async def contend(prefix: str) -> None:
+            release = asyncio.Event()
+
+            async def fake_job() -> None:
+                await release.wait()
+
+            tasks = []
+            for i in range(3):
+                job_id = f"{prefix}-{i}"
+                jobs.add(Job(job_id=job_id, filename="test.mp3"))
+                tasks.append(asyncio.create_task(transcription._run_with_job_slot(job_id, fake_job())))
+                await asyncio.sleep(0)
+            release.set()
+            await asyncio.gather(*tasks)
+
+        with patch.object(transcription, "MAX_CONCURRENT_JOBS", 1):
+            asyncio.run(contend("first-loop"))
+            asyncio.run(contend("second-loop"))
+
+        for prefix in ("first-loop", "second-loop"):
+            for i in range(3):
+                jobs.remove(f"{prefix}-{i}")
+
+    @pytest.mark.parametrize(
+        ("filename", "expected"),
+        [
+            ("Test.MP3", ".mp3"),
+            ("archive.tar.webm", ".webm"),
+            ("noextension", ""),
+            ("trailingdot.", ""),
+            (".mp3", ""),
+            ("..mp3", ".mp3"),
+        ],
+    )
+    def test_get_file_extension_matches_suffix_semantics(self, filename, expected):
+        """_get_file_extension should agree with Path(filename).suffix.lower()."""
+        from pathlib import Path
+
+        from vtt_transcribe.api.routes.transcription import _get_file_extension
+
+        assert _get_file_extension(filename) == Path(filename).suffix.lower() == expected
+
+    def test_unsupported_type_lists_supported_extensions(self, client):
+        """Rejected uploads should list the supported extensions in sorted order."""
+        from vtt_transcribe.api.routes.transcription import SUPPORTED_EXTENSIONS
+
+        files = {"file": ("test.txt", io.BytesIO(b"data"), "text/plain")}
+        response = client.post("/api/transcribe", files=files, data={"api_key": "test-api-key"})
+
+        assert response.status_code == 400
+        assert ", ".join(sorted(SUPPORTED_EXTENSIONS)) in response.json()["detail"]
+
 
 class TestAPITranscriptionCoverage:
     """Tests to cover missing lines in api/routes/transcription.py."""
@@ -270,7 +340,7 @@ class TestTranscriptionAsyncPaths:
         """Test _process_diarization async function (lines 126-138)."""
         from unittest.mock import AsyncMock
 
-        from vtt_transcribe.api.routes.transcription import _process_diarization, jobs
+        from vtt_transcribe.api.routes.transcription import Job, _process_diarization, jobs
 
         # Create an async mock UploadFile
         test_content = b"fake audio data"
@@ -279,21 +349,21 @@ class TestTranscriptionAsyncPaths:
         mock_file.read = AsyncMock(return_value=test_content)
 
         job_id = "test-job-id"
-        jobs[job_id] = {"status": "pending", "job_id": job_id}
+        jobs.add(Job(job_id=job_id, filename="test.mp3"))
 
         # Run the async function using asyncio.run
         asyncio.run(_process_diarization(job_id, mock_file, "test-token", "cpu"))
 
         # Verify job completed
-        assert jobs[job_id]["status"] == "completed"
-        assert "result" in jobs[job_id]
+        assert jobs.get(job_id).status == "completed"
+        assert jobs.get(job_id).result is not None
 
-    def test_process_transcription_exception_path(self) -> None:
+    def test_process_transcription_exception_path(self, tmp_path) -> None:
         """Test _process_transcription exception handling (lines 161-172)."""
-        from vtt_transcribe.api.routes.transcription import _process_transcription, jobs
+        from vtt_transcribe.api.routes.transcription import Job, _process_transcription, jobs
 
         job_id = "test-exception-job"
-        jobs[job_id] = {"status": "pending", "job_id": job_id}
+        jobs.add(Job(job_id=job_id, filename="test.mp3"))
 
         # Mock VideoTranscriber to raise exception
         with patch("vtt_transcribe.api.routes.transcription.VideoTranscriber") as mock_vt:
@@ -301,27 +371,30 @@ class TestTranscriptionAsyncPaths:
             mock_instance.transcribe.side_effect = RuntimeError("Transcription failed")
             mock_vt.return_value = mock_instance
 
+            audio_path = tmp_path / "test.mp3"
+            audio_path.write_bytes(b"fake audio")
+
             # Run the async function
             asyncio.run(
                 _process_transcription(
                     job_id=job_id,
-                    content=b"fake audio",
+                    audio_path=audio_path,
                     filename="test.mp3",
                     api_key="test-key",
                 )
             )
 
             # Verify job marked as failed
-            assert jobs[job_id]["status"] == "failed"
-            assert "error" in jobs[job_id]
-            assert "Transcription failed" in jobs[job_id]["error"]
+            assert jobs.get(job_id).status == "failed"
+            assert jobs.get(job_id).error is not None
+            assert "Transcription failed" in jobs.get(job_id).error
 
-    def test_transcription_complete_success_path(self) -> None:
+    def test_transcription_complete_success_path(self, tmp_path) -> None:
         """Test successful transcription completion (lines 168-169)."""
-        from vtt_transcribe.api.routes.transcription import _process_transcription, jobs
+        from vtt_transcribe.api.routes.transcription import Job, _process_transcription, jobs
 
         job_id = "success-job"
-        jobs[job_id] = {"status": "pending", "job_id": job_id}
+        jobs.add(Job(job_id=job_id, filename="test.mp3"))
 
         # Mock VideoTranscriber to succeed
         with patch("vtt_transcribe.api.routes.transcription.VideoTranscriber") as mock_vt:
@@ -329,19 +402,159 @@ class TestTranscriptionAsyncPaths:
             mock_instance.transcribe.return_value = "[00:00 - 00:05] Test transcript"
             mock_vt.return_value = mock_instance
 
+            audio_path = tmp_path / "success.mp3"
+            audio_path.write_bytes(b"test audio content")
+
             # Run async function
             asyncio.run(
                 _process_transcription(
                     job_id=job_id,
-                    content=b"test audio content",
+                    audio_path=audio_path,
                     filename="success.mp3",
                     api_key="test-api-key",
                 )
             )
 
+            # The job owns the uploaded file and deletes it when done
+            assert not audio_path.exists()
+
             # Verify lines 168-169 executed (status completed, result set)
-            assert jobs[job_id]["status"] == "completed"
-            assert jobs[job_id]["result"] == "[00:00 - 00:05] Test transcript"
+            assert jobs.get(job_id).status == "completed"
+            assert jobs.get(job_id).result == "[00:00 - 00:05] Test transcript"
+
+    def test_transcription_blocking_calls_use_job_executor(self, tmp_path) -> None:
+        """Blocking OpenAI calls should run on the dedicated job threads, not the default pool."""
+        import threading
+
+        from vtt_transcribe.api.routes.transcription import Job, _process_transcription, jobs
+
+        job_id = "executor-job"
+        jobs.add(Job(job_id=job_id, filename="test.mp3"))
+        audio_path = tmp_path / "test.mp3"
+        audio_path.write_bytes(b"fake audio")
+        thread_names = []
+
+        def transcribe(_path):
+            thread_names.append(threading.current_thread().name)
+            return "[00:00:00 - 00:00:05] Test transcript"
+
+        with patch("vtt_transcribe.api.routes.transcription.VideoTranscriber") as mock_vt:
+            mock_vt.return_value.transcribe.side_effect = transcribe
+            asyncio.run(_process_transcription(job_id=job_id, audio_path=audio_path, filename="test.mp3", api_key="k"))
+
+        assert jobs.get(job_id).status == "completed"
+        assert thread_names[0].startswith("vtt-job")
+
+    async def test_job_slots_limit_concurrency_and_report_queued(self) -> None:
+        """Jobs beyond the concurrency limit should wait and emit a queued progress event."""
+        from vtt_transcribe.api.routes import transcription
+        from vtt_transcribe.api.routes.transcription import Job, jobs
+
+        running = 0
+        peak = 0
+        release = asyncio.Event()
+
+        async def fake_job() -> None:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await release.wait()
+            running -= 1
+
+        job_ids = [f"slot-job-{i}" for i in range(3)]
+        for job_id in job_ids:
+            jobs.add(Job(job_id=job_id, filename="test.mp3"))
+
+        with patch.object(transcription, "_get_job_semaphore", return_value=asyncio.Semaphore(2)):
+            tasks = []
+            for job_id in job_ids:
+                tasks.append(asyncio.create_task(transcription._run_with_job_slot(job_id, fake_job())))
+                await asyncio.sleep(0)
+            release.set()
+            await asyncio.gather(*tasks)
+
+        assert peak == 2
+        queued = jobs.get(job_ids[2]).progress_updates.get_nowait()
+        assert queued["type"] == "queued"
+        assert jobs.get(job_ids[0]).progress_updates.empty()
+
+    async def test_finished_jobs_expire_after_retention(self) -> None:
+        """Jobs should be dropped from memory once the retention period has passed."""
+        from vtt_transcribe.api.routes import transcription
+        from vtt_transcribe.api.routes.transcription import Job, jobs
+
+        job_id = "expiring-job"
+        jobs.add(Job(job_id=job_id, filename="test.mp3"))
+
+        async def fake_job() -> None:
+            jobs.get(job_id).update(status="completed")
+
+        with patch.object(transcription, "JOB_RETENTION_SECONDS", 0):
+            await transcription._run_with_job_slot(job_id, fake_job())
+            await asyncio.sleep(0.01)
+
+        assert jobs.get(job_id) is None
+
+    def test_registry_evicts_oldest_finished_job_when_full(self) -> None:
+        """A full registry should evict the oldest finished job, never running ones."""
+        from vtt_transcribe.api.routes import transcription
+        from vtt_transcribe.api.routes.transcription import Job, JobRegistry
+
+        registry = JobRegistry()
+        with patch.object(transcription, "MAX_RETAINED_JOBS", 3):
+            registry.add(Job(job_id="running", filename="a.mp3", status="processing"))
+            registry.add(Job(job_id="old-done", filename="b.mp3", status="completed"))
+            registry.add(Job(job_id="new-done", filename="c.mp3", status="failed"))
+            registry.add(Job(job_id="incoming", filename="d.mp3"))
+
+        assert registry.get("old-done") is None
+        assert all(registry.get(job_id) is not None for job_id in ("running", "new-done", "incoming"))
+
+    def test_registry_remove_wakes_watchers(self) -> None:
+        """Removing a job should wake its watchers and return the removed job."""
+        from vtt_transcribe.api.routes.transcription import Job, JobRegistry
+
+        registry = JobRegistry()
+        job = Job(job_id="gone", filename="a.mp3")
+        registry.add(job)
+        status_changed = job.status_changed
+
+        assert registry.remove("gone") is job
+        assert status_changed.is_set()
+        assert registry.get("gone") is None
+        assert registry.remove("gone") is None
+
+    def test_registry_evicted_job_wakes_watchers(self) -> None:
+        """Evicting a finished job should wake its watchers like an explicit removal."""
+        from vtt_transcribe.api.routes import transcription
+        from vtt_transcribe.api.routes.transcription import Job, JobRegistry
+
+        registry = JobRegistry()
+        finished = Job(job_id="done", filename="a.mp3", status="completed")
+        status_changed = finished.status_changed
+        with patch.object(transcription, "MAX_RETAINED_JOBS", 1):
+            registry.add(finished)
+            registry.add(Job(job_id="incoming", filename="b.mp3"))
+
+        assert status_changed.is_set()
+        assert registry.get("done") is None
+
+    async def test_background_jobs_are_tracked_until_done(self) -> None:
+        """Background job tasks should be strongly referenced until they complete."""
+        from vtt_transcribe.api.routes import transcription
+
+        release = asyncio.Event()
+
+        async def fake_job() -> None:
+            await release.wait()
+
+        transcription._start_background_job("tracked-job", fake_job())
+        (task,) = [t for t in transcription._background_tasks if t.get_name() == "job-tracked-job"]
+
+        release.set()
+        await task
+
+        assert task not in transcription._background_tasks
 
 
 class TestDetectLanguageEndpoint:
@@ -444,12 +657,12 @@ class TestTranscribeWithTranslation:
         response_data = response.json()
         assert "job_id" in response_data
 
-    def test_transcription_translation_async_path(self):
+    def test_transcription_translation_async_path(self, tmp_path):
         """Test async translation path in _process_transcription."""
-        from vtt_transcribe.api.routes.transcription import _process_transcription, jobs
+        from vtt_transcribe.api.routes.transcription import Job, _process_transcription, jobs
 
         job_id = "translation-job"
-        jobs[job_id] = {"status": "pending", "job_id": job_id}
+        jobs.add(Job(job_id=job_id, filename="test.mp3"))
 
         with (
             patch("vtt_transcribe.api.routes.transcription.VideoTranscriber") as mock_vt,
@@ -465,16 +678,19 @@ class TestTranscribeWithTranslation:
             mock_at_instance.translate_transcript.return_value = "[00:00 - 00:05] Texto español"
             mock_at.return_value = mock_at_instance
 
+            audio_path = tmp_path / "test.mp3"
+            audio_path.write_bytes(b"fake audio")
+
             # Run with translation
             asyncio.run(
                 _process_transcription(
-                    job_id=job_id, content=b"fake audio", filename="test.mp3", api_key="test-key", translate_to="Spanish"
+                    job_id=job_id, audio_path=audio_path, filename="test.mp3", api_key="test-key", translate_to="Spanish"
                 )
             )
 
             # Verify translation was called and result includes translation
-            assert jobs[job_id]["status"] == "completed"
-            assert "Texto español" in jobs[job_id]["result"]
+            assert jobs.get(job_id).status == "completed"
+            assert "Texto español" in jobs.get(job_id).result
             mock_at_instance.translate_transcript.assert_called_once()
 
 
@@ -519,7 +735,7 @@ class TestDetectLanguageErrorHandling:
         response = client.post("/api/detect-language", files=files, data=data)
 
         assert response.status_code == 413
-        assert "File too large" in response.json()["detail"]
+        assert "Request body too large" in response.json()["detail"]
 
     @patch("vtt_transcribe.api.routes.transcription.VideoTranscriber")
     def test_detect_language_processing_exception(self, mock_transcriber, client, sample_audio_file):
@@ -535,6 +751,144 @@ class TestDetectLanguageErrorHandling:
         assert "Language detection failed" in response.json()["detail"]
 
 
+class TestClientCache:
+    """Tests for per-API-key client caching."""
+
+    @patch("vtt_transcribe.api.routes.transcription.VideoTranscriber")
+    def test_reuses_client_per_api_key(self, mock_transcriber):
+        """Clients should be created once per API key and reused until they expire."""
+        from vtt_transcribe.api.routes import transcription
+
+        transcription._client_cache.clear()
+        mock_transcriber.side_effect = lambda key: MagicMock(api_key=key)
+
+        first = transcription._get_cached_client(transcription.VideoTranscriber, "key-a")
+        assert transcription._get_cached_client(transcription.VideoTranscriber, "key-a") is first
+        other = transcription._get_cached_client(transcription.VideoTranscriber, "key-b")
+        assert other is not first
+        assert mock_transcriber.call_count == 2
+        assert all("key-a" not in key for _, key in transcription._client_cache)
+
+        with patch.object(transcription, "CLIENT_CACHE_TTL_SECONDS", -1):
+            transcription._client_cache.clear()
+            expired = transcription._get_cached_client(transcription.VideoTranscriber, "key-a")
+            assert transcription._get_cached_client(transcription.VideoTranscriber, "key-a") is not expired
+
+        transcription._client_cache.clear()
+
+
+class TestContentLengthLimit:
+    """Tests for rejecting oversized requests before the body is read."""
+
+    @pytest.mark.parametrize("endpoint", ["/api/transcribe", "/api/detect-language", "/api/diarize"])
+    @patch("vtt_transcribe.api.routes.transcription.UploadFile.read", new_callable=AsyncMock)
+    def test_rejects_oversized_content_length(self, mock_read, client, endpoint):
+        """Upload endpoints should return 413 from Content-Length without reading the upload."""
+        from vtt_transcribe.api.routes.transcription import MAX_FILE_SIZE, MAX_REQUEST_OVERHEAD
+
+        files = {"file": ("test.mp3", io.BytesIO(b"small"), "audio/mpeg")}
+        headers = {"content-length": str(MAX_FILE_SIZE + MAX_REQUEST_OVERHEAD + 1)}
+        response = client.post(endpoint, files=files, data={"api_key": "test-api-key"}, headers=headers)
+
+        assert response.status_code == 413
+        assert response.json()["detail"].startswith("Request body too large")
+        mock_read.assert_not_called()
+
+    @pytest.mark.parametrize(
+        ("method", "endpoint", "kwargs"),
+        [
+            ("get", "/api/jobs/missing-job", {}),
+            ("post", "/api/translate", {"data": {"transcript": "x", "target_language": "es", "api_key": "key"}}),
+        ],
+    )
+    def test_non_upload_routes_skip_content_length_check(self, client, method, endpoint, kwargs):
+        """Only upload endpoints should reject requests from Content-Length alone."""
+        from vtt_transcribe.api.routes.transcription import MAX_FILE_SIZE, MAX_REQUEST_OVERHEAD
+
+        headers = {"content-length": str(MAX_FILE_SIZE + MAX_REQUEST_OVERHEAD + 1)}
+        translator = MagicMock()
+        translator.translate_transcript.return_value = "y"
+        with patch("vtt_transcribe.api.routes.transcription._get_cached_client", return_value=translator):
+            response = getattr(client, method)(endpoint, headers=headers, **kwargs)
+
+        assert response.status_code != 413
+
+    def test_rejects_invalid_content_length(self, client):
+        """A non-numeric Content-Length header should be rejected with 400."""
+        files = {"file": ("test.mp3", io.BytesIO(b"small"), "audio/mpeg")}
+        headers = {"content-length": "not-a-number"}
+        response = client.post("/api/transcribe", files=files, data={"api_key": "test-api-key"}, headers=headers)
+
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Invalid Content-Length header"
+
+
+class TestCopyUploadToTempfile:
+    """Tests for copying uploads to temporary files."""
+
+    @pytest.mark.parametrize("max_size", [1024 * 1024, 16], ids=["in-memory", "spilled-to-disk"])
+    def test_copies_upload_contents(self, max_size):
+        """Uploads should be copied byte-for-byte whether in memory or spilled to disk."""
+        import tempfile
+
+        from vtt_transcribe.api.routes.transcription import _copy_upload_to_tempfile, _get_upload_size
+
+        data = b"fake audio data " * 64
+        spooled = tempfile.SpooledTemporaryFile(max_size=max_size)  # noqa: SIM115
+        spooled.write(data)
+        upload = UploadFile(file=spooled, filename="test.mp3")
+
+        assert _get_upload_size(upload) == len(data)
+        tmp_path = _copy_upload_to_tempfile(upload, ".mp3")
+        try:
+            assert tmp_path.suffix == ".mp3"
+            assert tmp_path.read_bytes() == data
+        finally:
+            tmp_path.unlink(missing_ok=True)
+            spooled.close()
+
+    def test_copies_upload_without_file_descriptor(self):
+        """Sources without a file descriptor should be copied without touching os.sendfile."""
+        from vtt_transcribe.api.routes import transcription
+
+        data = b"fake audio data " * 64
+        upload = UploadFile(file=io.BytesIO(data), filename="test.mp3")
+
+        with patch.object(transcription.os, "sendfile") as mock_sendfile:
+            tmp_path = transcription._copy_upload_to_tempfile(upload, ".mp3")
+        try:
+            assert tmp_path.read_bytes() == data
+            mock_sendfile.assert_not_called()
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+    @pytest.mark.parametrize(("free_bytes", "expected_in_tmpfs"), [(10**12, True), (0, False)])
+    def test_uses_tmpfs_only_when_it_has_room(self, tmp_path, free_bytes, expected_in_tmpfs):
+        """Temp files should go to the tmpfs dir when it has room and to the default dir otherwise."""
+        import shutil
+
+        from vtt_transcribe.api.routes import transcription
+
+        usage = shutil.disk_usage(tmp_path)._replace(free=free_bytes)
+        with (
+            patch.object(transcription, "UPLOAD_TMPFS_DIR", str(tmp_path)),
+            patch.object(transcription.shutil, "disk_usage", return_value=usage),
+        ):
+            written = transcription._write_temp_file(b"fake audio data", ".mp3")
+        try:
+            assert (written.parent == tmp_path) is expected_in_tmpfs
+            assert written.read_bytes() == b"fake audio data"
+        finally:
+            written.unlink(missing_ok=True)
+
+    def test_missing_tmpfs_falls_back_to_default_dir(self, tmp_path):
+        """A missing tmpfs directory should fall back to tempfile's default directory."""
+        from vtt_transcribe.api.routes import transcription
+
+        with patch.object(transcription, "UPLOAD_TMPFS_DIR", str(tmp_path / "missing")):
+            assert transcription._get_upload_temp_dir(1) is None
+
+
 class TestTranslateErrorHandling:
     """Tests for error handling in /translate endpoint."""
 
@@ -581,7 +935,7 @@ class TestDownloadTranscriptEndpoint:
         # Manually set job to processing state
         from vtt_transcribe.api.routes.transcription import jobs
 
-        jobs[job_id]["status"] = "processing"
+        jobs.get(job_id).update(status="processing")
 
         # Try to download
         response = client.get(f"/api/jobs/{job_id}/download?format=txt")
@@ -591,10 +945,10 @@ class TestDownloadTranscriptEndpoint:
     def test_download_no_result_available(self, client):
         """Test download when job has no result."""
         # Create a completed job with empty result
-        from vtt_transcribe.api.routes.transcription import jobs
+        from vtt_transcribe.api.routes.transcription import Job, jobs
 
         job_id = "test-empty-job"
-        jobs[job_id] = {"status": "completed", "job_id": job_id, "result": ""}
+        jobs.add(Job(job_id=job_id, filename="test.mp3", status="completed", result=""))
 
         response = client.get(f"/api/jobs/{job_id}/download?format=txt")
         assert response.status_code == 404
@@ -602,10 +956,10 @@ class TestDownloadTranscriptEndpoint:
 
     def test_download_no_segments_parsed(self, client):
         """Test download when transcript has no valid segments."""
-        from vtt_transcribe.api.routes.transcription import jobs
+        from vtt_transcribe.api.routes.transcription import Job, jobs
 
         job_id = "test-no-segments-job"
-        jobs[job_id] = {"status": "completed", "job_id": job_id, "result": "Invalid transcript format"}
+        jobs.add(Job(job_id=job_id, filename="test.mp3", status="completed", result="Invalid transcript format"))
 
         response = client.get(f"/api/jobs/{job_id}/download?format=txt")
         assert response.status_code == 404
@@ -613,14 +967,17 @@ class TestDownloadTranscriptEndpoint:
 
     def test_download_txt_format(self, client):
         """Test downloading transcript in TXT format."""
-        from vtt_transcribe.api.routes.transcription import jobs
+        from vtt_transcribe.api.routes.transcription import Job, jobs
 
         job_id = "test-txt-job"
-        jobs[job_id] = {
-            "status": "completed",
-            "job_id": job_id,
-            "result": "[00:00:00 - 00:00:05] Hello world\n[00:00:05 - 00:00:10] How are you?",
-        }
+        jobs.add(
+            Job(
+                job_id=job_id,
+                filename="test.mp3",
+                status="completed",
+                result="[00:00:00 - 00:00:05] Hello world\n[00:00:05 - 00:00:10] How are you?",
+            )
+        )
 
         response = client.get(f"/api/jobs/{job_id}/download?format=txt")
         assert response.status_code == 200
@@ -631,14 +988,17 @@ class TestDownloadTranscriptEndpoint:
 
     def test_download_vtt_format(self, client):
         """Test downloading transcript in VTT format."""
-        from vtt_transcribe.api.routes.transcription import jobs
+        from vtt_transcribe.api.routes.transcription import Job, jobs
 
         job_id = "test-vtt-job"
-        jobs[job_id] = {
-            "status": "completed",
-            "job_id": job_id,
-            "result": "[00:00:00 - 00:00:05] Hello world",
-        }
+        jobs.add(
+            Job(
+                job_id=job_id,
+                filename="test.mp3",
+                status="completed",
+                result="[00:00:00 - 00:00:05] Hello world",
+            )
+        )
 
         response = client.get(f"/api/jobs/{job_id}/download?format=vtt")
         assert response.status_code == 200
@@ -647,14 +1007,17 @@ class TestDownloadTranscriptEndpoint:
 
     def test_download_srt_format(self, client):
         """Test downloading transcript in SRT format."""
-        from vtt_transcribe.api.routes.transcription import jobs
+        from vtt_transcribe.api.routes.transcription import Job, jobs
 
         job_id = "test-srt-job"
-        jobs[job_id] = {
-            "status": "completed",
-            "job_id": job_id,
-            "result": "[00:00:00 - 00:00:05] Hello world",
-        }
+        jobs.add(
+            Job(
+                job_id=job_id,
+                filename="test.mp3",
+                status="completed",
+                result="[00:00:00 - 00:00:05] Hello world",
+            )
+        )
 
         response = client.get(f"/api/jobs/{job_id}/download?format=srt")
         assert response.status_code == 200
@@ -662,16 +1025,88 @@ class TestDownloadTranscriptEndpoint:
         assert "1" in response.text  # SRT sequence number
         assert "-->" in response.text
 
+    def test_download_parses_transcript_once_per_result(self, client):
+        """Repeat downloads in different formats should reuse the parsed segments."""
+        from vtt_transcribe.api.routes import transcription
+        from vtt_transcribe.api.routes.transcription import Job, jobs
+
+        job_id = "test-parse-cache-job"
+        jobs.add(
+            Job(
+                job_id=job_id,
+                filename="test.mp3",
+                status="completed",
+                result="[00:00:00 - 00:00:05] Hello world",
+            )
+        )
+
+        with patch.object(
+            transcription, "_parse_transcript_segments", wraps=transcription._parse_transcript_segments
+        ) as mock_parse:
+            for fmt in ("txt", "vtt", "srt"):
+                assert client.get(f"/api/jobs/{job_id}/download?format={fmt}").status_code == 200
+            assert mock_parse.call_count == 1
+
+            jobs.get(job_id).result = "[00:00:00 - 00:00:05] Updated"
+            response = client.get(f"/api/jobs/{job_id}/download?format=txt")
+            assert response.text == "Updated"
+            assert mock_parse.call_count == 2
+
+    def test_download_vtt_streams_one_cue_per_chunk(self):
+        """The VTT generator should yield the header and then one chunk per cue."""
+        from vtt_transcribe.api.routes.transcription import _iter_vtt, _parse_transcript_segments
+
+        segments = _parse_transcript_segments(
+            "[00:00:00 - 00:00:05] Hello\n[Speaker 1] [00:00:05 - 00:00:09] World",
+        )
+        chunks = list(_iter_vtt(segments))
+
+        assert chunks[0] == "WEBVTT\n"
+        assert len(chunks) == 1 + len(segments)
+        assert "".join(chunks) == (
+            "WEBVTT\n\n1\n00:00:00.000 --> 00:00:05.000\nHello\n\n2\n00:00:05.000 --> 00:00:09.000\n<v Speaker 1>World\n"
+        )
+
+    def test_parse_segments_handles_crlf_and_indentation(self):
+        """Segments should parse from CRLF, indented and mixed speaker/no-speaker lines."""
+        from vtt_transcribe.api.routes.transcription import _parse_transcript_segments
+
+        transcript = "  [SPEAKER_00] [00:00:01 - 00:00:02]  Hi there \r\n\r\nnoise\n[00:01:00 - 00:01:05] Bye\r\n"
+
+        assert _parse_transcript_segments(transcript) == [
+            {"speaker": "SPEAKER_00", "start": 1, "end": 2, "text": "Hi there"},
+            {"start": 60, "end": 65, "text": "Bye"},
+        ]
+
+    @pytest.mark.parametrize(
+        ("seconds", "vtt", "srt"),
+        [
+            (0, "00:00:00.000", "00:00:00,000"),
+            (3661, "01:01:01.000", "01:01:01,000"),
+            (86399, "23:59:59.000", "23:59:59,000"),
+            (90061, "25:01:01.000", "25:01:01,000"),
+        ],
+    )
+    def test_timestamp_formatting(self, seconds, vtt, srt):
+        """Timestamps should format identically inside and beyond the 24h lookup table."""
+        from vtt_transcribe.api.routes.transcription import _format_srt_time, _format_vtt_time
+
+        assert _format_vtt_time(seconds) == vtt
+        assert _format_srt_time(seconds) == srt
+
     def test_download_with_empty_lines(self, client):
         """Test downloading transcript with empty lines in middle."""
-        from vtt_transcribe.api.routes.transcription import jobs
+        from vtt_transcribe.api.routes.transcription import Job, jobs
 
         job_id = "test-empty-lines-job"
-        jobs[job_id] = {
-            "status": "completed",
-            "job_id": job_id,
-            "result": "[00:00:00 - 00:00:05] First line\n\n[00:00:10 - 00:00:15] Second line",
-        }
+        jobs.add(
+            Job(
+                job_id=job_id,
+                filename="test.mp3",
+                status="completed",
+                result="[00:00:00 - 00:00:05] First line\n\n[00:00:10 - 00:00:15] Second line",
+            )
+        )
 
         response = client.get(f"/api/jobs/{job_id}/download?format=txt")
         assert response.status_code == 200
@@ -681,17 +1116,20 @@ class TestDownloadTranscriptEndpoint:
 
     def test_download_with_speaker_labels(self, client):
         """Test downloading transcript with speaker labels."""
-        from vtt_transcribe.api.routes.transcription import jobs
+        from vtt_transcribe.api.routes.transcription import Job, jobs
 
         job_id = "test-speaker-job"
-        jobs[job_id] = {
-            "status": "completed",
-            "job_id": job_id,
-            "result": (
-                "[SPEAKER_00] [00:00:00 - 00:00:05] Hello from speaker 0\n"
-                "[SPEAKER_01] [00:00:05 - 00:00:10] Hello from speaker 1"
-            ),
-        }
+        jobs.add(
+            Job(
+                job_id=job_id,
+                filename="test.mp3",
+                status="completed",
+                result=(
+                    "[SPEAKER_00] [00:00:00 - 00:00:05] Hello from speaker 0\n"
+                    "[SPEAKER_01] [00:00:05 - 00:00:10] Hello from speaker 1"
+                ),
+            )
+        )
 
         # Test TXT format with speakers
         response = client.get(f"/api/jobs/{job_id}/download?format=txt")
@@ -730,8 +1168,8 @@ class TestProgressEventsInTranscription:
         job_id = response.json()["job_id"]
 
         # Verify job has progress_updates queue
-        assert job_id in jobs
-        assert "progress_updates" in jobs[job_id]
+        assert jobs.get(job_id) is not None
+        assert isinstance(jobs.get(job_id).progress_updates, asyncio.Queue)
 
         # Give background task time to emit events
         import time
@@ -739,7 +1177,7 @@ class TestProgressEventsInTranscription:
         time.sleep(0.2)
 
         # Check if progress events were emitted
-        queue = jobs[job_id]["progress_updates"]
+        queue = jobs.get(job_id).progress_updates
         # Queue should be an asyncio.Queue
         assert isinstance(queue, asyncio.Queue)
 
@@ -781,10 +1219,10 @@ class TestProgressEventsInTranscription:
         time.sleep(0.3)
 
         # Check for language detection in progress
-        assert job_id in jobs, "Job not found"
-        assert "progress_updates" in jobs[job_id], "Progress queue not found"
+        assert jobs.get(job_id) is not None, "Job not found"
+        assert isinstance(jobs.get(job_id).progress_updates, asyncio.Queue), "Progress queue not found"
 
-        queue = jobs[job_id]["progress_updates"]
+        queue = jobs.get(job_id).progress_updates
         events = []
         while not queue.empty():
             try:
@@ -824,8 +1262,8 @@ class TestProgressEventsInTranscription:
         time.sleep(0.3)
 
         # Check for translation events in progress
-        if job_id in jobs and "progress_updates" in jobs[job_id]:
-            queue = jobs[job_id]["progress_updates"]
+        if jobs.get(job_id) is not None:
+            queue = jobs.get(job_id).progress_updates
             events = []
             while not queue.empty():
                 try:
@@ -849,9 +1287,9 @@ class TestProgressEventsInTranscription:
         job_id = response.json()["job_id"]
 
         # Verify job has progress_updates queue
-        assert job_id in jobs
-        assert "progress_updates" in jobs[job_id]
-        assert isinstance(jobs[job_id]["progress_updates"], asyncio.Queue)
+        assert jobs.get(job_id) is not None
+        assert isinstance(jobs.get(job_id).progress_updates, asyncio.Queue)
+        assert isinstance(jobs.get(job_id).progress_updates, asyncio.Queue)
 
     def test_emit_progress_function_exists(self):
         """_emit_progress function should exist and be callable."""
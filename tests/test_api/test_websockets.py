@@ -1,6 +1,8 @@
 """Tests for WebSocket real-time transcription updates."""
 
 import asyncio
+import functools
+import json
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -59,8 +61,8 @@ class TestWebSocketConnection:
             job_id = response.json()["job_id"]
 
             # Ensure job has proper serializable data
-            if job_id in jobs:
-                jobs[job_id]["status"] = "processing"
+            if jobs.get(job_id) is not None:
+                jobs.get(job_id).update(status="processing")
 
         with client.websocket_connect(f"/ws/jobs/{job_id}") as websocket:
             # Should receive status updates (may be error if serialization fails)
@@ -84,9 +86,8 @@ class TestWebSocketConnection:
             job_id = response.json()["job_id"]
 
         # Manually complete the job since TestClient doesn't run background tasks
-        if job_id in jobs:
-            jobs[job_id]["status"] = "completed"
-            jobs[job_id]["result"] = "[00:00 - 00:05] Test"
+        if jobs.get(job_id) is not None:
+            jobs.get(job_id).update(status="completed", result="[00:00 - 00:05] Test")
 
         with client.websocket_connect(f"/ws/jobs/{job_id}") as websocket:
             # Should receive completion status and then close
@@ -118,10 +119,8 @@ class TestWebSocketConnection:
             job_id = response.json()["job_id"]
 
         # Manually complete the job and add translation info
-        if job_id in jobs:
-            jobs[job_id]["status"] = "completed"
-            jobs[job_id]["result"] = "[00:00 - 00:05] Hola"
-            jobs[job_id]["translated_to"] = "es"
+        if jobs.get(job_id) is not None:
+            jobs.get(job_id).update(status="completed", result="[00:00 - 00:05] Hola", translated_to="es")
 
         with client.websocket_connect(f"/ws/jobs/{job_id}") as websocket:
             data = websocket.receive_json()
@@ -247,8 +246,8 @@ class TestWebSocketProgressUpdates:
         # Verify progress events are in queue
         from vtt_transcribe.api.routes.transcription import jobs
 
-        assert "progress_updates" in jobs[job_id]
-        queue = jobs[job_id]["progress_updates"]
+        assert isinstance(jobs.get(job_id).progress_updates, asyncio.Queue)
+        queue = jobs.get(job_id).progress_updates
         assert not queue.empty()
 
         # Drain and verify events
@@ -284,7 +283,7 @@ class TestWebSocketProgressUpdates:
         # Verify progress events are in queue
         from vtt_transcribe.api.routes.transcription import jobs
 
-        queue = jobs[job_id]["progress_updates"]
+        queue = jobs.get(job_id).progress_updates
         assert queue.qsize() >= 2
 
     def test_websocket_progress_diarization(self, client):
@@ -305,7 +304,7 @@ class TestWebSocketProgressUpdates:
         # Verify progress events are in queue
         from vtt_transcribe.api.routes.transcription import jobs
 
-        queue = jobs[job_id]["progress_updates"]
+        queue = jobs.get(job_id).progress_updates
         assert queue.qsize() >= 2
 
     def test_websocket_progress_error(self, client):
@@ -325,7 +324,7 @@ class TestWebSocketProgressUpdates:
         # Verify error progress event is in queue
         from vtt_transcribe.api.routes.transcription import jobs
 
-        queue = jobs[job_id]["progress_updates"]
+        queue = jobs.get(job_id).progress_updates
 
         # May have initial events, so drain to find error
         events = []
@@ -357,7 +356,7 @@ class TestWebSocketProgressUpdates:
         # Fill the queue (default maxsize is 0, unlimited, so patch it)
         from vtt_transcribe.api.routes.transcription import jobs
 
-        jobs[job_id]["progress_updates"] = asyncio.Queue(maxsize=2)
+        jobs.get(job_id).progress_updates = asyncio.Queue(maxsize=2)
 
         # Fill queue
         _emit_progress(job_id, "Event 1", "info")
@@ -365,7 +364,7 @@ class TestWebSocketProgressUpdates:
         # This should not raise, just log warning
         _emit_progress(job_id, "Event 3 - overflow", "info")
         # Queue should still have 2 items
-        assert jobs[job_id]["progress_updates"].qsize() == 2
+        assert jobs.get(job_id).progress_updates.qsize() == 2
 
     def test_emit_progress_nonexistent_job(self):
         """_emit_progress should handle nonexistent job gracefully."""
@@ -374,24 +373,16 @@ class TestWebSocketProgressUpdates:
         # Should not raise exception
         _emit_progress("nonexistent-job-id", "Test message", "info")
 
-    def test_emit_progress_job_without_queue(self, client):
-        """_emit_progress should handle job without progress_updates queue."""
-        from vtt_transcribe.api.routes.transcription import _emit_progress, jobs
+    def test_job_always_has_bounded_progress_queue(self):
+        """Job records should always carry their own bounded progress_updates queue."""
+        from vtt_transcribe.api.routes.transcription import MAX_PROGRESS_QUEUE_SIZE, Job
 
-        with patch("vtt_transcribe.api.routes.transcription.VideoTranscriber"):
-            response = client.post(
-                "/api/transcribe",
-                files={"file": ("test.mp3", b"fake audio", "audio/mpeg")},
-                data={"api_key": "test-key"},
-            )
-            job_id = response.json()["job_id"]
+        first = Job(job_id="job-1", filename="a.mp3")
+        second = Job(job_id="job-2", filename="b.mp3")
 
-        # Remove progress_updates from job
-        if "progress_updates" in jobs[job_id]:
-            del jobs[job_id]["progress_updates"]
-
-        # Should not raise exception
-        _emit_progress(job_id, "Test message", "info")
+        assert first.progress_updates is not second.progress_updates
+        assert first.progress_updates.maxsize == MAX_PROGRESS_QUEUE_SIZE
+        assert "progress_updates" not in first.to_dict()
 
 
 class TestAPIWebsocketsCoverage:
@@ -460,11 +451,11 @@ class TestAPIWebsocketsCoverage:
             job_id = response.json()["job_id"]
 
         # Corrupt job data to trigger exception
-        if job_id in jobs:
-            jobs[job_id] = "invalid_type"  # type: ignore[assignment]
-
         try:
-            with client.websocket_connect(f"/ws/jobs/{job_id}") as websocket:
+            with (
+                patch.object(jobs, "get", return_value="invalid_type"),
+                client.websocket_connect(f"/ws/jobs/{job_id}") as websocket,
+            ):
                 data = websocket.receive_json()
                 # Should handle the error gracefully
                 assert "error" in data or "status" in data
@@ -497,8 +488,7 @@ class TestAPIWebsocketsCoverageComplete:
         # Connect to websocket, then delete the job
         with client.websocket_connect(f"/ws/jobs/{job_id}") as websocket:
             # Delete the job while websocket is connected
-            if job_id in jobs:
-                del jobs[job_id]
+            jobs.remove(job_id)
 
             # Should receive job deleted message
             import time
@@ -559,9 +549,8 @@ class TestAPIWebsocketsCoverageComplete:
         time.sleep(0.5)
 
         # Mark as failed manually for test
-        if job_id in jobs:
-            jobs[job_id]["status"] = "failed"
-            jobs[job_id]["error"] = "Test error"
+        if jobs.get(job_id) is not None:
+            jobs.get(job_id).update(status="failed", error="Test error")
 
         with client.websocket_connect(f"/ws/jobs/{job_id}") as websocket:
             data = websocket.receive_json()
@@ -608,17 +597,13 @@ class TestWebsocketEdgeCases:
     def test_websocket_status_change_loop(self) -> None:
         """Test websocket detects status changes in polling loop (line 42)."""
         from vtt_transcribe.api import app
-        from vtt_transcribe.api.routes.transcription import jobs
+        from vtt_transcribe.api.routes.transcription import Job, jobs
 
         client = TestClient(app)
 
         # Create a pending job
         test_job_id = "status-change-test"
-        jobs[test_job_id] = {
-            "job_id": test_job_id,
-            "status": "pending",
-            "result": None,
-        }
+        jobs.add(Job(job_id=test_job_id, filename="test.mp3"))
 
         try:
             with client.websocket_connect(f"/ws/jobs/{test_job_id}") as websocket:
@@ -626,38 +611,31 @@ class TestWebsocketEdgeCases:
                 data1 = websocket.receive_json()
                 assert data1["status"] == "pending"
 
-                # Change status manually
-                jobs[test_job_id]["status"] = "processing"
-
-                # Wait for next poll (>0.5s)
-                import time
-
-                time.sleep(0.6)
+                # Change status on the app's event loop, where job updates happen
+                websocket.portal.call(functools.partial(jobs.get(test_job_id).update, status="processing"))
 
                 # Should detect status change
                 data2 = websocket.receive_json()
                 assert data2["status"] == "processing"  # Line 42 executed
-        except Exception:  # noqa: S110
-            pass  # May timeout
         finally:
             # Cleanup
-            if test_job_id in jobs:
-                del jobs[test_job_id]
+            jobs.remove(test_job_id)
 
     def test_websocket_exception_in_send(self) -> None:
         """Test exception handling in websocket loop (line 58)."""
         from vtt_transcribe.api import app
-        from vtt_transcribe.api.routes.transcription import jobs
+        from vtt_transcribe.api.routes.transcription import Job, jobs
 
         client = TestClient(app)
 
         # Create job with problematic data
         test_job_id = "exception-test"
-        jobs[test_job_id] = {
-            "job_id": test_job_id,
-            "status": "pending",
-            "bad_data": MagicMock(),  # Non-JSON-serializable
-        }
+        jobs.add(
+            Job(
+                job_id=test_job_id,
+                filename=MagicMock(),  # Non-JSON-serializable
+            )
+        )
 
         try:
             with client.websocket_connect(f"/ws/jobs/{test_job_id}") as websocket:
@@ -672,8 +650,7 @@ class TestWebsocketEdgeCases:
             pass  # Connection may fail
         finally:
             # Cleanup
-            if test_job_id in jobs:
-                del jobs[test_job_id]
+            jobs.remove(test_job_id)
 
 
 def test_websocket_job_deleted_check() -> None:
@@ -683,23 +660,19 @@ def test_websocket_job_deleted_check() -> None:
     from fastapi import WebSocket
     from starlette.websockets import WebSocketState
 
-    from vtt_transcribe.api.routes.transcription import jobs
+    from vtt_transcribe.api.routes.transcription import Job, jobs
     from vtt_transcribe.api.routes.websockets import websocket_job_updates
 
     # Create mock websocket
     mock_ws = AsyncMock(spec=WebSocket)
     mock_ws.application_state = WebSocketState.CONNECTED
     mock_ws.client_state = WebSocketState.CONNECTED
-    mock_ws.send_json = AsyncMock()
+    mock_ws.send_text = AsyncMock()
     mock_ws.close = AsyncMock()
 
     # Job starts existing, then gets deleted - should trigger lines 27-28
     job_id = "to-be-deleted-job"
-    jobs[job_id] = {
-        "job_id": job_id,
-        "status": "pending",
-        "filename": "test.mp3",
-    }
+    jobs.add(Job(job_id=job_id, filename="test.mp3"))
 
     async def run_test() -> None:
         # Start streaming in background
@@ -709,7 +682,7 @@ def test_websocket_job_deleted_check() -> None:
         await asyncio.sleep(0.1)
 
         # Delete the job to trigger lines 27-28
-        del jobs[job_id]
+        jobs.remove(job_id)
 
         # Wait for job deletion detection
         await asyncio.sleep(0.7)
@@ -728,14 +701,13 @@ def test_websocket_job_deleted_check() -> None:
     asyncio.run(run_test())
 
     # Verify it sent job deleted message (line 28)
-    calls = [call[0][0] for call in mock_ws.send_json.call_args_list]
+    calls = [json.loads(call[0][0]) for call in mock_ws.send_text.call_args_list]
     assert any("error" in msg and "deleted" in msg.get("error", "").lower() for msg in calls), (
         f"Expected 'Job deleted' error message, got calls: {calls}"
     )
 
     # Clean up
-    if job_id in jobs:
-        del jobs[job_id]
+    jobs.remove(job_id)
 
 
 def test_websocket_status_change() -> None:
@@ -743,23 +715,19 @@ def test_websocket_status_change() -> None:
     from fastapi import WebSocket
     from starlette.websockets import WebSocketState
 
-    from vtt_transcribe.api.routes.transcription import jobs
+    from vtt_transcribe.api.routes.transcription import Job, jobs
     from vtt_transcribe.api.routes.websockets import websocket_job_updates
 
     # Create mock websocket
     mock_ws = AsyncMock(spec=WebSocket)
     mock_ws.application_state = WebSocketState.CONNECTED
     mock_ws.client_state = WebSocketState.CONNECTED
-    mock_ws.send_json = AsyncMock()
+    mock_ws.send_text = AsyncMock()
     mock_ws.close = AsyncMock()
 
     # Create job
     job_id = "status-change-job"
-    jobs[job_id] = {
-        "job_id": job_id,
-        "status": "pending",
-        "filename": "test.mp3",
-    }
+    jobs.add(Job(job_id=job_id, filename="test.mp3"))
 
     async def run_test() -> None:
         # Start streaming in background
@@ -769,14 +737,13 @@ def test_websocket_status_change() -> None:
         await asyncio.sleep(0.1)
 
         # Change status to trigger line 42
-        jobs[job_id]["status"] = "processing"
+        jobs.get(job_id).update(status="processing")
 
         # Wait for status change detection
         await asyncio.sleep(0.6)
 
         # Mark as completed to close connection
-        jobs[job_id]["status"] = "completed"
-        jobs[job_id]["result"] = "Test result"
+        jobs.get(job_id).update(status="completed", result="Test result")
 
         # Wait for completion
         await asyncio.sleep(0.6)
@@ -791,11 +758,10 @@ def test_websocket_status_change() -> None:
     asyncio.run(run_test())
 
     # Verify multiple status updates were sent (line 42 executed when status changed)
-    assert mock_ws.send_json.call_count >= 2
+    assert mock_ws.send_text.call_count >= 2
 
     # Clean up
-    if job_id in jobs:
-        del jobs[job_id]
+    jobs.remove(job_id)
 
 
 def test_websocket_generic_exception() -> None:
@@ -803,7 +769,7 @@ def test_websocket_generic_exception() -> None:
     from fastapi import WebSocket, WebSocketDisconnect
     from starlette.websockets import WebSocketState
 
-    from vtt_transcribe.api.routes.transcription import jobs
+    from vtt_transcribe.api.routes.transcription import Job, jobs
     from vtt_transcribe.api.routes.websockets import websocket_job_updates
 
     # Create mock websocket
@@ -811,13 +777,13 @@ def test_websocket_generic_exception() -> None:
     mock_ws.application_state = WebSocketState.CONNECTED
     mock_ws.client_state = WebSocketState.CONNECTED
 
-    # Make send_json raise WebSocketDisconnect to trigger line 57-58
-    mock_ws.send_json = AsyncMock(side_effect=WebSocketDisconnect(code=1000))
+    # Make send_text raise WebSocketDisconnect to trigger line 57-58
+    mock_ws.send_text = AsyncMock(side_effect=WebSocketDisconnect(code=1000))
     mock_ws.close = AsyncMock()
 
     # Create job
     job_id = "websocket-disconnect-job"
-    jobs[job_id] = {"job_id": job_id, "status": "pending"}
+    jobs.add(Job(job_id=job_id, filename="test.mp3"))
 
     async def run_test() -> None:
         # This should catch WebSocketDisconnect and pass (line 58)
@@ -826,12 +792,11 @@ def test_websocket_generic_exception() -> None:
     # Run - should catch WebSocketDisconnect on line 57 and execute pass on line 58
     asyncio.run(run_test())
 
-    # Verify send_json was called (which raised WebSocketDisconnect)
-    assert mock_ws.send_json.called
+    # Verify send_text was called (which raised WebSocketDisconnect)
+    assert mock_ws.send_text.called
 
     # Clean up
-    if job_id in jobs:
-        del jobs[job_id]
+    jobs.remove(job_id)
 
 
 class TestWebSocketHelperFunctions:
@@ -839,14 +804,15 @@ class TestWebSocketHelperFunctions:
 
     def test_build_status_message_with_detected_language(self) -> None:
         """Should include detected_language when present."""
+        from vtt_transcribe.api.routes.transcription import Job
         from vtt_transcribe.api.routes.websockets import _build_status_message
 
-        current_job = {
-            "job_id": "test-123",
-            "status": "completed",
-            "filename": "test.mp3",
-            "detected_language": "en",
-        }
+        current_job = Job(
+            job_id="test-123",
+            filename="test.mp3",
+            status="completed",
+            detected_language="en",
+        )
 
         message = _build_status_message("test-123", current_job)
 
@@ -854,14 +820,15 @@ class TestWebSocketHelperFunctions:
 
     def test_build_status_message_without_detected_language(self) -> None:
         """Should handle missing detected_language (line 71-72)."""
+        from vtt_transcribe.api.routes.transcription import Job
         from vtt_transcribe.api.routes.websockets import _build_status_message
 
-        current_job = {
-            "job_id": "test-123",
-            "status": "processing",
-            "filename": "test.mp3",
-            # No detected_language key
-        }
+        current_job = Job(
+            job_id="test-123",
+            filename="test.mp3",
+            status="processing",
+            # No detected_language yet
+        )
 
         message = _build_status_message("test-123", current_job)
 
@@ -870,30 +837,79 @@ class TestWebSocketHelperFunctions:
         assert message["status"] == "processing"
 
     @pytest.mark.asyncio
-    async def test_wait_for_progress_timeout(self) -> None:
-        """Should return None on timeout."""
-        from vtt_transcribe.api.routes.websockets import _wait_for_progress_or_timeout
+    async def test_wait_for_progress_returns_none_on_status_change(self) -> None:
+        """Should stop waiting and return None when the job's status changes."""
+        from vtt_transcribe.api.routes.transcription import Job
+        from vtt_transcribe.api.routes.websockets import _wait_for_progress_or_status_change
 
-        queue: asyncio.Queue = asyncio.Queue()
+        job = Job(job_id="wait-status", filename="test.mp3")
+        status_changed = job.status_changed
 
-        # Should timeout and return None
-        result = await _wait_for_progress_or_timeout(queue, timeout=0.01)
+        waiter = asyncio.create_task(_wait_for_progress_or_status_change(job.progress_updates, status_changed))
+        await asyncio.sleep(0)
+        job.update(status="processing")
 
-        assert result is None
+        assert await asyncio.wait_for(waiter, timeout=1) is None
+        assert job.status_changed is not status_changed
+        assert not job.status_changed.is_set()
 
     @pytest.mark.asyncio
     async def test_wait_for_progress_gets_item(self) -> None:
-        """Should get item from queue (line 91)."""
-        from vtt_transcribe.api.routes.websockets import _wait_for_progress_or_timeout
+        """Should return the next queued progress update."""
+        from vtt_transcribe.api.routes.websockets import _wait_for_progress_or_status_change
 
         queue: asyncio.Queue = asyncio.Queue()
         test_item = {"test": "data"}
         queue.put_nowait(test_item)
 
-        # Should get the item
-        result = await _wait_for_progress_or_timeout(queue, timeout=0.5)
+        result = await asyncio.wait_for(_wait_for_progress_or_status_change(queue, asyncio.Event()), timeout=1)
 
         assert result == test_item
+        assert queue.empty()
+
+    @pytest.mark.asyncio
+    async def test_job_removal_wakes_watchers(self) -> None:
+        """Removing a job from the registry should wake anything waiting on it."""
+        from vtt_transcribe.api.routes.transcription import Job, jobs
+
+        job_id = "wait-removed"
+        jobs.add(Job(job_id=job_id, filename="test.mp3"))
+        status_changed = jobs.get(job_id).status_changed
+
+        jobs.remove(job_id)
+
+        assert status_changed.is_set()
+
+    @pytest.mark.asyncio
+    async def test_job_update_wakes_watchers_after_all_fields_are_set(self) -> None:
+        """Watchers woken by a status transition should see the matching result."""
+        from vtt_transcribe.api.routes.transcription import Job
+
+        job = Job(job_id="wait-update", filename="test.mp3")
+        status_changed = job.status_changed
+
+        async def watch() -> tuple[str, str | None]:
+            await status_changed.wait()
+            return job.status, job.result
+
+        watcher = asyncio.create_task(watch())
+        await asyncio.sleep(0)
+        job.update(status="completed", result="transcript")
+
+        assert await asyncio.wait_for(watcher, timeout=1) == ("completed", "transcript")
+        assert job.status_changed is not status_changed
+
+    @pytest.mark.asyncio
+    async def test_send_json_sends_compact_text_frame(self) -> None:
+        """Messages should go out as compact JSON text with non-ASCII characters intact."""
+        from vtt_transcribe.api.routes.websockets import _send_json
+
+        mock_ws = MagicMock()
+        mock_ws.send_text = AsyncMock()
+
+        await _send_json(mock_ws, {"status": "completed", "result": "[00:00:00 - 00:00:01] héllo"})
+
+        mock_ws.send_text.assert_awaited_once_with('{"status":"completed","result":"[00:00:00 - 00:00:01] héllo"}')
 
     @pytest.mark.asyncio
     async def test_drain_progress_queue_empty(self) -> None:
@@ -901,14 +917,14 @@ class TestWebSocketHelperFunctions:
         from vtt_transcribe.api.routes.websockets import _drain_progress_queue
 
         mock_ws = MagicMock()
-        mock_ws.send_json = AsyncMock()
+        mock_ws.send_text = AsyncMock()
         queue: asyncio.Queue = asyncio.Queue()  # Empty queue
 
         # Should not raise error on empty queue
         await _drain_progress_queue(mock_ws, "test-job", queue)
 
-        # send_json should not have been called
-        assert not mock_ws.send_json.called
+        # send_text should not have been called
+        assert not mock_ws.send_text.called
 
 
 class TestTranscriptionProgressEmit:
@@ -916,55 +932,64 @@ class TestTranscriptionProgressEmit:
 
     def test_emit_progress_queue_full_logs_warning(self) -> None:
         """Should log warning when progress queue is full."""
-        from vtt_transcribe.api.routes.transcription import _emit_progress, jobs
+        from vtt_transcribe.api.routes.transcription import Job, _emit_progress, jobs
 
         # Create a job with a full queue
         job_id = "test-job-123"
-        jobs[job_id] = {
-            "progress_updates": asyncio.Queue(maxsize=1),
-            "status": "processing",
-        }
-        jobs[job_id]["progress_updates"].put_nowait({"dummy": "message"})
+        jobs.add(
+            Job(
+                job_id=job_id,
+                filename="test.mp3",
+                status="processing",
+                progress_updates=asyncio.Queue(maxsize=1),
+            )
+        )
+        jobs.get(job_id).progress_updates.put_nowait({"dummy": "message"})
 
         # Try to emit when full - should log warning but not raise
         _emit_progress(job_id, "test message", "info")
         # If no exception raised, test passes
 
         # Cleanup
-        del jobs[job_id]
+        jobs.remove(job_id)
 
     def test_emit_progress_exception_handling(self) -> None:
         """Should handle other exceptions gracefully (lines 47-49)."""
-        from vtt_transcribe.api.routes.transcription import _emit_progress, jobs
+        from vtt_transcribe.api.routes.transcription import Job, _emit_progress, jobs
 
         # Create a job with a mock queue that raises an exception
         job_id = "test-job-456"
         mock_queue = MagicMock()
         mock_queue.put_nowait.side_effect = RuntimeError("Queue error")
 
-        jobs[job_id] = {
-            "progress_updates": mock_queue,
-            "status": "processing",
-        }
+        jobs.add(
+            Job(
+                job_id=job_id,
+                filename="test.mp3",
+                status="processing",
+                progress_updates=mock_queue,
+            )
+        )
 
         # Should catch exception and log warning, not raise
         _emit_progress(job_id, "test message", "info")
         # If no exception raised, test passes
 
         # Cleanup
-        del jobs[job_id]
+        jobs.remove(job_id)
 
     def test_build_status_message_with_translated_to(self) -> None:
         """Should include translated_to when present."""
+        from vtt_transcribe.api.routes.transcription import Job
         from vtt_transcribe.api.routes.websockets import _build_status_message
 
-        current_job = {
-            "job_id": "test-123",
-            "status": "completed",
-            "filename": "test.mp3",
-            "translated_to": "Spanish",
-            "result": "Translated transcript",
-        }
+        current_job = Job(
+            job_id="test-123",
+            filename="test.mp3",
+            status="completed",
+            translated_to="Spanish",
+            result="Translated transcript",
+        )
 
         message = _build_status_message("test-123", current_job)
 
@@ -38,3 +38,7 @@ class TestAudioChunker:
         assert ranges[0] == (0.0, 100.0)
         assert ranges[1] == (100.0, 200.0)
         assert ranges[2] == (200.0, 250.0)
+
+    def test_get_chunk_time_ranges_empty_audio(self) -> None:
+        """Should return no ranges for zero-length audio."""
+        assert AudioChunker.get_chunk_time_ranges(0.0, 100.0) == []
@@ -1,5 +1,6 @@
 """Tests for audio file management: force overwrite, keep/delete functionality."""
 
+import subprocess
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, cast
 from unittest.mock import MagicMock, patch
@@ -8,7 +9,7 @@ import pytest
 
 from vtt_transcribe.transcriber import VideoTranscriber
 
-# Patch moviepy for all tests in this module to avoid file operations
+# Patch ffmpeg and ffprobe for all tests in this module to avoid file operations
 pytestmark = pytest.mark.usefixtures("mock_audio_operations")
 
 
@@ -18,27 +19,10 @@ if TYPE_CHECKING:
 
 @pytest.fixture(autouse=True)
 def mock_audio_operations() -> Any:
-    """Mock AudioFileClip and VideoFileClip to avoid actual file operations."""
-    with (
-        patch("vtt_transcribe.audio_manager.AudioFileClip") as mock_audio,
-        patch("vtt_transcribe.audio_manager.VideoFileClip") as mock_video,
-    ):
-        # Setup audio mock with subclipped method
-        mock_audio_instance = MagicMock()
-        mock_audio_instance.duration = 120.0
-        mock_chunk = MagicMock()
-        mock_audio_instance.subclipped.return_value = mock_chunk
-        mock_audio_instance.__enter__.return_value = mock_audio_instance
-        mock_audio_instance.__exit__.return_value = None
-        mock_audio.return_value = mock_audio_instance
-
-        # Setup video mock
-        mock_video_instance = MagicMock()
-        mock_video_instance.audio = MagicMock()
-        mock_video_instance.__enter__.return_value = mock_video_instance
-        mock_video_instance.__exit__.return_value = None
-        mock_video.return_value = mock_video_instance
-
+    """Mock ffmpeg and ffprobe to avoid actual file operations."""
+    # ffprobe reads the duration from stdout; ffmpeg output is ignored
+    completed = subprocess.CompletedProcess(args=["ffmpeg"], returncode=0, stdout="120.0\n", stderr="")
+    with patch("vtt_transcribe.audio_manager.subprocess.run", return_value=completed):
         yield
 
 
@@ -470,18 +454,14 @@ class TestExtractAudioChunkWithCustomPath:
 
     def test_extract_chunk_with_custom_audio_path(self, tmp_path: Path) -> None:
         """Should create chunks with custom audio filename in custom directory."""
-        # Given custom audio path in subdirectory and mocked AudioFileClip
+        # Given custom audio path in subdirectory and mocked ffmpeg
         with (
             patch("vtt_transcribe.transcriber.OpenAI"),
-            patch("vtt_transcribe.audio_manager.AudioFileClip") as mock_audio_class,
+            patch(
+                "vtt_transcribe.audio_manager.subprocess.run",
+                return_value=subprocess.CompletedProcess(args=["ffmpeg"], returncode=0, stdout="", stderr=""),
+            ) as mock_run,
         ):
-            mock_audio_instance = MagicMock()
-            mock_chunk = MagicMock()
-            mock_audio_instance.subclipped.return_value = mock_chunk
-            mock_audio_instance.__enter__.return_value = mock_audio_instance
-            mock_audio_instance.__exit__.return_value = None
-            mock_audio_class.return_value = mock_audio_instance
-
             # Create custom subdirectory
             custom_dir = tmp_path / "audio_files" / "custom_location"
             custom_dir.mkdir(parents=True, exist_ok=True)
@@ -497,24 +477,20 @@ class TestExtractAudioChunkWithCustomPath:
             # Then chunk is created with custom filename in same directory
             assert chunk_path.parent == custom_dir
             assert chunk_path.name == "my_custom_audio_chunk0.mp3"
-            mock_audio_instance.subclipped.assert_called_once_with(0.0, 60.0)
-            mock_chunk.write_audiofile.assert_called_once()
+            cmd = mock_run.call_args[0][0]
+            assert cmd[cmd.index("-i") + 1] == str(audio_path)
+            assert cmd[-1] == str(chunk_path)
 
     def test_extract_multiple_chunks_with_custom_path(self, tmp_path: Path) -> None:
         """Should create sequentially numbered chunks with custom audio path."""
         # Given custom audio path and multiple chunk extractions
-        with patch("vtt_transcribe.transcriber.OpenAI"), patch("vtt_transcribe.audio_manager.AudioFileClip") as mock_audio:
-            mock_audio_instance = MagicMock()
-            mock_chunk = MagicMock()
-            mock_audio_instance.subclipped.return_value = mock_chunk
-            mock_audio.return_value = mock_audio_instance
-
-            custom_dir = tmp_path / "my_audio_output"
-            custom_dir.mkdir(parents=True, exist_ok=True)
+        custom_dir = tmp_path / "my_audio_output"
+        custom_dir.mkdir(parents=True, exist_ok=True)
 
-            audio_path = custom_dir / "transcript_audio.mp3"
-            audio_path.touch()
+        audio_path = custom_dir / "transcript_audio.mp3"
+        audio_path.touch()
 
+        with patch("vtt_transcribe.transcriber.OpenAI"):
             transcriber = VideoTranscriber("key")
 
             # When multiple chunks are extracted
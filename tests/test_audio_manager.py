@@ -1,11 +1,19 @@
 """Tests for audio_manager module."""
 
+import subprocess
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
+
+import pytest
 
 from vtt_transcribe.audio_manager import AudioFileManager
 
 
+def _ffmpeg_result(returncode: int = 0, stderr: str = "") -> subprocess.CompletedProcess[str]:
+    """Build a completed ffmpeg process result."""
+    return subprocess.CompletedProcess(args=["ffmpeg"], returncode=returncode, stdout="", stderr=stderr)
+
+
 class TestAudioFileManager:
     """Test AudioFileManager functionality."""
 
@@ -15,34 +23,70 @@ class TestAudioFileManager:
         audio_path = tmp_path / "audio.mp3"
         video_path.touch()
 
-        with patch("vtt_transcribe.audio_manager.VideoFileClip") as mock_video:
-            mock_instance = MagicMock()
-            mock_instance.audio = MagicMock()
-            mock_instance.__enter__.return_value = mock_instance
-            mock_instance.__exit__.return_value = None
-            mock_video.return_value = mock_instance
-
+        with patch("vtt_transcribe.audio_manager.subprocess.run", return_value=_ffmpeg_result()) as mock_run:
             AudioFileManager.extract_from_video(video_path, audio_path)
 
-            mock_video.assert_called_once_with(str(video_path))
-            mock_instance.audio.write_audiofile.assert_called_once()
+            cmd = mock_run.call_args[0][0]
+            assert cmd[0] == "ffmpeg"
+            assert "-nostdin" in cmd
+            assert cmd[cmd.index("-i") + 1] == str(video_path)
+            assert cmd[cmd.index("-map") + 1] == "0:a:0"
+            assert cmd[cmd.index("-acodec") + 1] == "libmp3lame"
+            assert cmd[-1] == str(audio_path)
 
     def test_get_duration(self, tmp_path: Path) -> None:
         """Should return audio duration."""
         audio_path = tmp_path / "audio.mp3"
         audio_path.touch()
 
-        with patch("vtt_transcribe.audio_manager.AudioFileClip") as mock_audio:
-            mock_instance = MagicMock()
-            mock_instance.duration = 120.5
-            mock_instance.__enter__.return_value = mock_instance
-            mock_instance.__exit__.return_value = None
-            mock_audio.return_value = mock_instance
-
+        probe = subprocess.CompletedProcess(args=["ffprobe"], returncode=0, stdout="120.500000\n", stderr="")
+        with patch("vtt_transcribe.audio_manager.subprocess.run", return_value=probe):
             duration = AudioFileManager.get_duration(audio_path)
 
             assert duration == 120.5
 
+    @pytest.mark.parametrize(
+        ("returncode", "stdout", "stderr"),
+        [(1, "", "audio.mp3: Invalid data found when processing input"), (0, "N/A\n", "")],
+    )
+    def test_get_duration_unreadable_raises(self, tmp_path: Path, returncode: int, stdout: str, stderr: str) -> None:
+        """Should raise when ffprobe fails or reports no duration."""
+        audio_path = tmp_path / "audio.mp3"
+        audio_path.touch()
+
+        probe = subprocess.CompletedProcess(args=["ffprobe"], returncode=returncode, stdout=stdout, stderr=stderr)
+        with (
+            patch("vtt_transcribe.audio_manager.subprocess.run", return_value=probe),
+            pytest.raises(RuntimeError, match="Failed to read duration"),
+        ):
+            AudioFileManager.get_duration(audio_path)
+
+    @pytest.mark.parametrize(("source_name", "codec"), [("audio.mp3", "copy"), ("audio.m4a", "libmp3lame")])
+    def test_extract_chunk_copies_mp3_and_reencodes_others(self, tmp_path: Path, source_name: str, codec: str) -> None:
+        """Should stream-copy MP3 sources and re-encode other formats to MP3."""
+        audio_path = tmp_path / source_name
+        audio_path.touch()
+
+        with patch("vtt_transcribe.audio_manager.subprocess.run", return_value=_ffmpeg_result()) as mock_run:
+            chunk_path = AudioFileManager.extract_chunk(audio_path, 60.0, 90.0, 1)
+
+        assert chunk_path == tmp_path / "audio_chunk1.mp3"
+        cmd = mock_run.call_args[0][0]
+        assert cmd[cmd.index("-ss") + 1] == "60.0"
+        assert cmd[cmd.index("-t") + 1] == "30.0"
+        assert cmd[cmd.index("-acodec") + 1] == codec
+
+    def test_extract_chunk_ffmpeg_failure_raises(self, tmp_path: Path) -> None:
+        """Should raise when ffmpeg cannot write the chunk."""
+        audio_path = tmp_path / "audio.mp3"
+        audio_path.touch()
+
+        with (
+            patch("vtt_transcribe.audio_manager.subprocess.run", return_value=_ffmpeg_result(1, "No space left on device")),
+            pytest.raises(RuntimeError, match="No space left"),
+        ):
+            AudioFileManager.extract_chunk(audio_path, 0.0, 30.0, 0)
+
     def test_find_chunks(self, tmp_path: Path) -> None:
         """Should find all chunk files."""
         audio_path = tmp_path / "audio.mp3"
@@ -55,6 +99,16 @@ class TestAudioFileManager:
         assert len(chunks) == 3
         assert all(chunk.suffix == ".mp3" for chunk in chunks)
 
+    def test_find_chunks_orders_numerically_and_skips_unrelated_files(self, tmp_path: Path) -> None:
+        """Should sort by chunk index and ignore names that only share the prefix."""
+        audio_path = tmp_path / "audio.mp3"
+        for name in ("audio_chunk10.mp3", "audio_chunk2.mp3", "audio_chunk_old.mp3", "audio_chunk1.wav", "other_chunk0.mp3"):
+            (tmp_path / name).touch()
+
+        chunks = AudioFileManager.find_chunks(audio_path)
+
+        assert chunks == [tmp_path / "audio_chunk2.mp3", tmp_path / "audio_chunk10.mp3"]
+
     def test_cleanup_files(self, tmp_path: Path) -> None:
         """Should delete audio and all chunks."""
         audio_path = tmp_path / "audio.mp3"
@@ -64,8 +118,9 @@ class TestAudioFileManager:
         chunk0.touch()
         chunk1.touch()
 
-        AudioFileManager.cleanup_files(audio_path)
+        deleted = AudioFileManager.cleanup_files(audio_path)
 
+        assert deleted == [chunk0, chunk1]
         assert not audio_path.exists()
         assert not chunk0.exists()
         assert not chunk1.exists()
@@ -93,10 +148,11 @@ def test_extract_from_video_skips_if_exists_and_not_force(tmp_path: Path) -> Non
     video_path.write_text("fake video")
     audio_path.write_text("existing audio")
 
-    with patch("vtt_transcribe.audio_manager.VideoFileClip"):
+    with patch("vtt_transcribe.audio_manager.subprocess.run") as mock_run:
         AudioFileManager.extract_from_video(video_path, audio_path, force=False)
         # Should not have been overwritten
         assert audio_path.read_text() == "existing audio"
+        mock_run.assert_not_called()
 
 
 def test_extract_from_video_no_audio_track(tmp_path: Path) -> None:
@@ -105,12 +161,22 @@ def test_extract_from_video_no_audio_track(tmp_path: Path) -> None:
     audio_path = tmp_path / "audio.mp3"
     video_path.write_text("fake video")
 
-    mock_clip = MagicMock()
-    mock_clip.__enter__ = MagicMock(return_value=mock_clip)
-    mock_clip.__exit__ = MagicMock(return_value=False)
-    mock_clip.audio = None
-
-    with patch("vtt_transcribe.audio_manager.VideoFileClip", return_value=mock_clip):
+    no_audio = _ffmpeg_result(1, "Stream map '0:a:0' matches no streams.")
+    with patch("vtt_transcribe.audio_manager.subprocess.run", return_value=no_audio):
         AudioFileManager.extract_from_video(video_path, audio_path, force=True)
         # Should not create audio file
         assert not audio_path.exists()
+
+
+def test_extract_from_video_ffmpeg_failure_raises(tmp_path: Path) -> None:
+    """Test that other ffmpeg failures are reported."""
+    video_path = tmp_path / "video.mp4"
+    audio_path = tmp_path / "audio.mp3"
+    video_path.write_text("fake video")
+
+    failed = _ffmpeg_result(1, "video.mp4: Invalid data found when processing input")
+    with (
+        patch("vtt_transcribe.audio_manager.subprocess.run", return_value=failed),
+        pytest.raises(RuntimeError, match="Invalid data found"),
+    ):
+        AudioFileManager.extract_from_video(video_path, audio_path)
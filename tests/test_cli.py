@@ -125,6 +125,21 @@ class TestCreateParser:
         args = parser.parse_args(["video.mp4", "--device", "cpu"])
         assert args.device == "cpu"
 
+    def test_parser_accepts_diarization_batch_size(self) -> None:
+        """Should parse --diarization-batch-size as an int, defaulting to None."""
+        parser = create_parser()
+
+        assert parser.parse_args(["video.mp4"]).diarization_batch_size is None
+        assert parser.parse_args(["video.mp4", "--diarization-batch-size", "8"]).diarization_batch_size == 8
+
+    @pytest.mark.parametrize("value", ["0", "-4", "eight"])
+    def test_parser_rejects_invalid_diarization_batch_size(self, value: str) -> None:
+        """Should reject batch sizes that are not positive integers."""
+        parser = create_parser()
+
+        with pytest.raises(SystemExit):
+            parser.parse_args(["video.mp4", "--diarization-batch-size", value])
+
     def test_parser_accepts_diarize_only_flag(self) -> None:
         """Should accept --diarize-only flag."""
         parser = create_parser()
@@ -314,7 +329,7 @@ class TestMainCliArgumentParsing:
                 with contextlib.suppress(SystemExit):
                     main()
 
-                mock_diarizer_class.assert_called_once_with(hf_token=None, device="auto")
+                mock_diarizer_class.assert_called_once_with(hf_token=None, device="auto", batch_size=None)
                 mock_diarizer.diarize_audio.assert_called_once()
                 mock_diarizer.apply_speakers_to_transcript.assert_called_once()
 
@@ -350,7 +365,7 @@ class TestMainCliArgumentParsing:
                 with contextlib.suppress(SystemExit):
                     main()
 
-                mock_diarizer_class.assert_called_once_with(hf_token=None, device="cuda")
+                mock_diarizer_class.assert_called_once_with(hf_token=None, device="cuda", batch_size=None)
 
     @pytest.mark.diarization
     def test_main_with_diarize_only_flag(self, tmp_path: Path) -> None:
@@ -381,7 +396,7 @@ class TestMainCliArgumentParsing:
                 with contextlib.suppress(SystemExit):
                     main()
 
-                mock_diarizer_class.assert_called_once_with(hf_token=None, device="auto")
+                mock_diarizer_class.assert_called_once_with(hf_token=None, device="auto", batch_size=None)
                 mock_diarizer.diarize_audio.assert_called_once_with(audio_path)
 
     def test_main_with_apply_diarization_flag(self, tmp_path: Path) -> None:
@@ -418,7 +433,7 @@ class TestMainCliArgumentParsing:
                 with contextlib.suppress(SystemExit):
                     main()
 
-                mock_diarizer_class.assert_called_once_with(hf_token=None, device="auto")
+                mock_diarizer_class.assert_called_once_with(hf_token=None, device="auto", batch_size=None)
                 mock_diarizer.diarize_audio.assert_called_once_with(audio_path)
                 mock_diarizer.apply_speakers_to_transcript.assert_called_once_with(
                     "[00:00:00 - 00:00:05] Hello world", [(0.0, 5.0, "SPEAKER_00")]
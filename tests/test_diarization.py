@@ -1,6 +1,7 @@
 """Tests for speaker diarization functionality."""
 
 import os
+from collections.abc import Iterator
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -15,6 +16,16 @@ pytestmark = [
 ]
 
 
+@pytest.fixture
+def mock_audio_decode() -> Iterator[MagicMock]:
+    """Stub pyannote's audio decoder so mocked pipelines can run on fake paths."""
+    with patch("vtt_transcribe.diarization.Audio") as mock_audio:
+        waveform = MagicMock(name="waveform")
+        waveform.shape = (1, 16000 * 60)
+        mock_audio.return_value.return_value = (waveform, 16000)
+        yield mock_audio
+
+
 class TestDiarizationImportHandling:
     """Test handling of missing diarization dependencies (mocked imports)."""
 
@@ -151,7 +162,7 @@ def test_speaker_diarizer_default_device_is_auto() -> None:
     assert diarizer.device == "auto"
 
 
-def test_diarize_audio_returns_speaker_segments() -> None:
+def test_diarize_audio_returns_speaker_segments(mock_audio_decode: MagicMock) -> None:
     """Test diarize_audio returns list of speaker segments."""
     from vtt_transcribe.diarization import SpeakerDiarizer
 
@@ -177,6 +188,11 @@ def test_diarize_audio_returns_speaker_segments() -> None:
         assert len(segments) == 1
         assert segments[0] == (0.0, 5.0, "SPEAKER_00")
 
+    # The file is decoded once and handed to the pipeline in memory
+    waveform, _ = mock_audio_decode.return_value.return_value
+    mock_audio_decode.return_value.assert_called_once_with("/fake/audio.mp3")
+    mock_pipeline.assert_called_once_with({"waveform": waveform, "sample_rate": 16000})
+
 
 def test_apply_speakers_to_transcript_adds_labels() -> None:
     """Test apply_speakers_to_transcript adds speaker labels to transcript."""
@@ -261,26 +277,24 @@ def test_format_diarization_output() -> None:
     assert "[01:05 - 02:05] SPEAKER_01" in result
 
 
-def test_diarize_audio_short_file_raises_error() -> None:
-    """Test that diarizing a short audio file raises a helpful error."""
+def test_diarize_audio_short_file_raises_error(mock_audio_decode: MagicMock) -> None:
+    """Test that audio shorter than 10 seconds is rejected before the pipeline runs."""
     from vtt_transcribe.diarization import SpeakerDiarizer
 
     diarizer = SpeakerDiarizer(hf_token="test_token")
-
-    # Mock the pipeline to raise the short audio error
+    mock_audio_decode.return_value.return_value[0].shape = (1, 16000 * 5)
     mock_pipeline = MagicMock()
-    mock_pipeline.return_value = MagicMock()
-    mock_pipeline.side_effect = ValueError(
-        "requested chunk [ 00:00:00.000 --> 00:00:10.000] resulted in 100 samples instead of the expected 441000 samples"
-    )
 
     with (
         patch("vtt_transcribe.diarization.Pipeline.from_pretrained", return_value=mock_pipeline),
-        pytest.raises(ValueError, match="Audio file is too short for diarization"),
+        pytest.raises(ValueError, match=r"Audio file is too short for diarization \(5\.00s\)"),
     ):
         diarizer.diarize_audio(Path("/fake/short.mp3"))
 
+    mock_pipeline.assert_not_called()
 
+
+@pytest.mark.usefixtures("mock_audio_decode")
 def test_diarize_audio_other_error_is_reraised() -> None:
     """Test that non-short-audio errors are re-raised as-is."""
     from vtt_transcribe.diarization import SpeakerDiarizer
@@ -451,33 +465,42 @@ def test_get_speaker_context_lines() -> None:
     assert "SPEAKER_01: Still speaker one" in contexts[1]
 
 
-def test_diarize_audio_sample_mismatch_error() -> None:
-    """Test that sample mismatch errors trigger WAV conversion fallback."""
-    from vtt_transcribe.diarization import SpeakerDiarizer
+def test_get_speaker_context_lines_max_contexts() -> None:
+    """Test that max_contexts stops after the requested number of segment groups."""
+    from vtt_transcribe.diarization import get_speaker_context_lines
 
-    diarizer = SpeakerDiarizer(hf_token="test_token")
+    transcript = """[00:00 - 00:05] SPEAKER_01: First
+[00:05 - 00:10] SPEAKER_00: Interruption
+[00:10 - 00:15] SPEAKER_01: Second"""
 
-    # Mock the pipeline to raise a sample mismatch error for a file > 10s
-    # Simulating a 15-second file with wrong sample count
-    # actual_samples = 500000 -> duration = 11.34s at 44.1kHz (> 10s threshold)
-    # expected_samples = 992250 for a 15s chunk
-    mock_pipeline = MagicMock()
-    mock_pipeline.return_value = MagicMock()
-    mock_pipeline.side_effect = ValueError(
-        "requested chunk [ 00:00:00.000 -->  00:00:15.000] resulted in 500000 samples instead of the expected 992250 samples"
-    )
+    contexts = get_speaker_context_lines(transcript, "SPEAKER_01", context_lines=0, max_contexts=1)
 
-    # The code will try to convert to WAV when it sees MP3 encoding issues
-    # Mock the conversion to fail (since /fake/audio.mp3 doesn't exist)
-    with (
-        patch("vtt_transcribe.diarization.Pipeline.from_pretrained", return_value=mock_pipeline),
-        pytest.raises(RuntimeError, match="Failed to convert to WAV"),
-    ):
-        diarizer.diarize_audio(Path("/fake/audio.mp3"))
+    assert contexts == ["[00:00 - 00:05] SPEAKER_01: First"]
 
 
+def test_get_first_speaker_contexts_matches_per_speaker_lookup() -> None:
+    """Test that the single-pass helper returns each speaker's first context group."""
+    from vtt_transcribe.speaker_labels import get_first_speaker_contexts, get_speaker_context_lines
+
+    transcript = """[00:00 - 00:05] SPEAKER_00: Hello world
+[00:05 - 00:10] SPEAKER_01: This is speaker one
+[00:10 - 00:15] SPEAKER_01: More from speaker one
+
+[00:15 - 00:20] SPEAKER_02: Now speaker two talking
+[00:20 - 00:25] SPEAKER_01: Back to speaker one
+[00:25 - 00:30] SPEAKER_00: Speaker zero again"""
+
+    contexts = get_first_speaker_contexts(transcript, context_lines=1)
+
+    assert list(contexts) == ["SPEAKER_00", "SPEAKER_01", "SPEAKER_02"]
+    for speaker, context in contexts.items():
+        assert [context] == get_speaker_context_lines(transcript, speaker, context_lines=1, max_contexts=1)
+    assert contexts["SPEAKER_01"] == "\n".join(transcript.split("\n")[0:4])
+
+
+@pytest.mark.usefixtures("mock_audio_decode")
 def test_diarize_audio_other_value_error() -> None:
-    """Test that non-sample-mismatch ValueError is re-raised as-is."""
+    """Test that ValueErrors from the pipeline are re-raised as-is."""
     from vtt_transcribe.diarization import SpeakerDiarizer
 
     diarizer = SpeakerDiarizer(hf_token="test_token")
@@ -641,6 +664,88 @@ def test_load_pipeline_logs_device_info() -> None:
         assert "cuda" in call_args.lower() or "device" in call_args.lower()
 
 
+def test_load_waveform_moves_to_pipeline_cuda_device(mock_audio_decode: MagicMock) -> None:
+    """Test that the decoded waveform follows the pipeline onto the GPU."""
+    import torch
+
+    from vtt_transcribe.diarization import SpeakerDiarizer
+
+    diarizer = SpeakerDiarizer(hf_token="test_token", device="cuda")
+    diarizer._pipeline_device = torch.device("cuda")
+    waveform, _ = mock_audio_decode.return_value.return_value
+
+    audio_input = diarizer._load_waveform(Path("/fake/audio.mp3"))
+
+    waveform.to.assert_called_once_with(torch.device("cuda"))
+    assert audio_input == {"waveform": waveform.to.return_value, "sample_rate": 16000}
+
+
+def test_load_pipeline_falls_back_to_cpu_device_for_waveform() -> None:
+    """Test that a failed device move leaves waveforms on the CPU."""
+    from vtt_transcribe.diarization import SpeakerDiarizer
+
+    diarizer = SpeakerDiarizer(hf_token="test_token", device="cuda")
+    mock_pipeline = MagicMock()
+    mock_pipeline.to.side_effect = RuntimeError("CUDA not available")
+
+    with patch("vtt_transcribe.diarization.Pipeline.from_pretrained", return_value=mock_pipeline):
+        diarizer._load_pipeline()
+
+    assert diarizer._pipeline_device.type == "cpu"
+
+
+def test_uses_cuda_follows_resolved_and_loaded_device() -> None:
+    """Test that uses_cuda honours DISABLE_GPU before loading and the real device after."""
+    import torch
+
+    from vtt_transcribe.diarization import SpeakerDiarizer
+
+    diarizer = SpeakerDiarizer(hf_token="test_token", device="cuda")
+    with patch.dict(os.environ, {"DISABLE_GPU": "1"}):
+        assert diarizer.uses_cuda is False
+    assert diarizer.uses_cuda is True
+
+    diarizer.pipeline = MagicMock()
+    diarizer._pipeline_device = torch.device("cpu")
+    assert diarizer.uses_cuda is False
+
+
+def test_load_pipeline_applies_batch_size() -> None:
+    """Test that a configured batch size is set on the segmentation and embedding steps."""
+    from unittest.mock import patch
+
+    from vtt_transcribe.diarization import SpeakerDiarizer
+
+    diarizer = SpeakerDiarizer(hf_token="test_token", device="cpu", batch_size=8)
+    mock_pipeline = MagicMock()
+
+    with patch("vtt_transcribe.diarization.Pipeline.from_pretrained", return_value=mock_pipeline):
+        diarizer._load_pipeline()
+
+    assert mock_pipeline.segmentation_batch_size == 8
+    assert mock_pipeline.embedding_batch_size == 8
+
+
+def test_release_pipeline_empties_cuda_cache() -> None:
+    """Test that releasing the pipeline drops it and empties the CUDA cache."""
+    from unittest.mock import patch
+
+    from vtt_transcribe.diarization import SpeakerDiarizer
+
+    diarizer = SpeakerDiarizer(hf_token="test_token", device="cuda")
+    diarizer.pipeline = MagicMock()
+
+    with (
+        patch("torch.cuda.is_available", return_value=True),
+        patch("torch.cuda.empty_cache") as mock_empty_cache,
+    ):
+        diarizer.release_pipeline()
+        diarizer.release_pipeline()
+
+    assert diarizer.pipeline is None
+    mock_empty_cache.assert_called_once()
+
+
 def test_disable_gpu_via_env_var() -> None:
     """Test that DISABLE_GPU env var forces CPU usage."""
     from vtt_transcribe.diarization import resolve_device
@@ -685,201 +790,3 @@ def test_add_speaker_label_with_hh_mm_ss_format() -> None:
     result = diarizer._process_line(line, segments)
 
     assert result == "[01:30:45 - 01:30:50] SPEAKER_00: Hello world"
-
-
-class TestWAVConversionFallback:
-    """Test automatic WAV conversion when MP3 encoding causes issues."""
-
-    def test_wav_conversion_triggered_by_sample_mismatch(self) -> None:
-        """Test that sample mismatch error with duration >= 9.5s triggers WAV conversion."""
-        import tempfile
-
-        from vtt_transcribe.diarization import SpeakerDiarizer
-
-        diarizer = SpeakerDiarizer(hf_token="test_token")
-
-        with tempfile.NamedTemporaryFile(mode="wb", suffix=".mp3", delete=False) as f:
-            audio_path = Path(f.name)
-            f.write(b"fake_mp3_data")
-
-        try:
-            # Tracks method calls
-            calls = []
-
-            def mock_internal(_self: object, path: Path) -> list:
-                calls.append(str(path))
-                # First call raises MP3 encoding error (duration >= 9.5s, so conversion triggered)
-                if len(calls) == 1:
-                    # Simulate the processed error message from _diarize_audio_internal
-                    msg = (
-                        "Audio file sample mismatch error. This usually indicates:\n"
-                        "  - MP3 encoding imprecision (metadata doesn't match exact sample count)\n"
-                        "  - File corruption or incomplete download\n"
-                        "Expected 10.00s (441000 samples), but got 9.97s (439895 samples)."
-                    )
-                    raise ValueError(msg)
-                # Second call (with WAV) succeeds
-                return [(0.0, 10.0, "SPEAKER_00")]
-
-            def mock_convert(_self: object, _input_path: Path, output_path: Path) -> None:
-                # Create the WAV file
-                output_path.write_bytes(b"fake_wav_data")
-
-            with (
-                patch.object(SpeakerDiarizer, "_diarize_audio_internal", mock_internal),
-                patch.object(SpeakerDiarizer, "_convert_to_wav", mock_convert),
-            ):
-                result = diarizer.diarize_audio(audio_path)
-
-            # Should have called internal twice: MP3 then WAV
-            assert len(calls) == 2
-            assert calls[0].endswith(".mp3")
-            assert calls[1].endswith(".wav")
-            assert result == [(0.0, 10.0, "SPEAKER_00")]
-
-            # WAV should be cleaned up
-            wav_path = audio_path.with_suffix(".wav")
-            assert not wav_path.exists()
-
-        finally:
-            if audio_path.exists():
-                audio_path.unlink()
-
-    def test_wav_conversion_cleanup_on_retry_failure(self) -> None:
-        """Test that WAV file is cleaned up even when retry fails."""
-        import tempfile
-
-        from vtt_transcribe.diarization import SpeakerDiarizer
-
-        diarizer = SpeakerDiarizer(hf_token="test_token")
-
-        with tempfile.NamedTemporaryFile(mode="wb", suffix=".mp3", delete=False) as f:
-            audio_path = Path(f.name)
-            f.write(b"fake_mp3_data")
-
-        try:
-
-            def mock_internal(_self: object, path: Path) -> list:
-                # Both calls fail
-                if str(path).endswith(".mp3"):
-                    msg = (
-                        "Audio file sample mismatch error. This usually indicates:\n"
-                        "  - MP3 encoding imprecision (metadata doesn't match exact sample count)\n"
-                        "Expected 10.00s (441000 samples), but got 9.97s (439895 samples)."
-                    )
-                    raise ValueError(msg)
-                # WAV also fails
-                msg = "WAV processing also failed"
-                raise RuntimeError(msg)
-
-            def mock_convert(_self: object, _input_path: Path, output_path: Path) -> None:
-                output_path.write_bytes(b"fake_wav_data")
-
-            with (
-                patch.object(SpeakerDiarizer, "_diarize_audio_internal", mock_internal),
-                patch.object(SpeakerDiarizer, "_convert_to_wav", mock_convert),
-                pytest.raises(RuntimeError, match="WAV processing also failed"),
-            ):
-                diarizer.diarize_audio(audio_path)
-
-            # WAV should be cleaned up even on failure
-            wav_path = audio_path.with_suffix(".wav")
-            assert not wav_path.exists()
-
-        finally:
-            if audio_path.exists():
-                audio_path.unlink()
-
-    def test_non_mp3_error_bypasses_conversion(self) -> None:
-        """Test that errors without MP3 encoding text don't trigger conversion."""
-        import tempfile
-
-        from vtt_transcribe.diarization import SpeakerDiarizer
-
-        diarizer = SpeakerDiarizer(hf_token="test_token")
-
-        with tempfile.NamedTemporaryFile(mode="wb", suffix=".mp3", delete=False) as f:
-            audio_path = Path(f.name)
-            f.write(b"fake_data")
-
-        try:
-
-            def mock_internal(_self: object, _path: Path) -> list:
-                msg = "Some other error unrelated to MP3"
-                raise ValueError(msg)
-
-            with (
-                patch.object(SpeakerDiarizer, "_diarize_audio_internal", mock_internal),
-                pytest.raises(ValueError, match="Some other error unrelated to MP3"),
-            ):
-                diarizer.diarize_audio(audio_path)
-
-        finally:
-            if audio_path.exists():
-                audio_path.unlink()
-
-    def test_convert_to_wav_success(self) -> None:
-        """Test WAV conversion using ffmpeg."""
-        import tempfile
-        from unittest.mock import Mock
-
-        from vtt_transcribe.diarization import SpeakerDiarizer
-
-        diarizer = SpeakerDiarizer(hf_token="test_token")
-
-        with (
-            tempfile.NamedTemporaryFile(mode="wb", suffix=".mp3", delete=False) as f1,
-            tempfile.NamedTemporaryFile(mode="wb", suffix=".wav", delete=False) as f2,
-        ):
-            input_path = Path(f1.name)
-            output_path = Path(f2.name)
-            f1.write(b"fake_mp3")
-
-        try:
-            # Mock subprocess to succeed
-            mock_result = Mock()
-            mock_result.returncode = 0
-            mock_result.stderr = ""
-
-            with patch("subprocess.run", return_value=mock_result):
-                diarizer._convert_to_wav(input_path, output_path)
-
-        finally:
-            if input_path.exists():
-                input_path.unlink()
-            if output_path.exists():
-                output_path.unlink()
-
-    def test_convert_to_wav_failure(self) -> None:
-        """Test WAV conversion failure handling."""
-        import tempfile
-        from unittest.mock import Mock
-
-        from vtt_transcribe.diarization import SpeakerDiarizer
-
-        diarizer = SpeakerDiarizer(hf_token="test_token")
-
-        with (
-            tempfile.NamedTemporaryFile(mode="wb", suffix=".mp3", delete=False) as f1,
-            tempfile.NamedTemporaryFile(mode="wb", suffix=".wav", delete=False) as f2,
-        ):
-            input_path = Path(f1.name)
-            output_path = Path(f2.name)
-
-        try:
-            # Mock subprocess to fail
-            mock_result = Mock()
-            mock_result.returncode = 1
-            mock_result.stderr = "ffmpeg error: invalid file"
-
-            with (
-                patch("subprocess.run", return_value=mock_result),
-                pytest.raises(RuntimeError, match="Failed to convert to WAV"),
-            ):
-                diarizer._convert_to_wav(input_path, output_path)
-
-        finally:
-            if input_path.exists():
-                input_path.unlink()
-            if output_path.exists():
-                output_path.unlink()
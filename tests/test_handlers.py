@@ -1,5 +1,11 @@
 """Tests for handler functions in vtt/handlers.py."""
 
+import os
+import subprocess
+import sys
+import textwrap
+import threading
+import time
 from pathlib import Path
 from typing import Any
 from unittest.mock import MagicMock, patch
@@ -7,6 +13,10 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from vtt_transcribe.handlers import (
+    _cached_diarize,
+    _extract_speakers_from_transcript,
+    _lazy_import_diarization,
+    _rename_speakers,
     display_result,
     handle_apply_diarization_mode,
     handle_diarize_only_mode,
@@ -61,6 +71,14 @@ class TestSaveTranscript:
         assert content == "Already has newline\n"
         assert not content.endswith("\n\n")
 
+    def test_save_transcript_writes_utf8_with_lf_newlines(self, tmp_path: Path) -> None:
+        """Test that save_transcript writes UTF-8 bytes without newline translation."""
+        output_path = tmp_path / "transcript.txt"
+
+        save_transcript(output_path, "[00:00 - 00:05] José: ¿Qué tal?\n[00:05 - 00:10] Zoë: Bien")
+
+        assert output_path.read_bytes() == "[00:00 - 00:05] José: ¿Qué tal?\n[00:05 - 00:10] Zoë: Bien\n".encode()
+
 
 class TestDisplayResult:
     """Test display_result function."""
@@ -86,6 +104,11 @@ class TestHandleDiarizeOnlyMode:
         with pytest.raises(FileNotFoundError, match="Audio file not found"):
             handle_diarize_only_mode(Path("/nonexistent/file.mp3"), "hf_token", None)
 
+    def test_handle_diarize_only_mode_rejects_directory(self, tmp_path: Path) -> None:
+        """Test that a directory is reported as a missing audio file."""
+        with pytest.raises(FileNotFoundError, match="Audio file not found"):
+            handle_diarize_only_mode(tmp_path, "hf_token", None)
+
     @pytest.mark.diarization
     def test_handle_diarize_only_mode_with_save(self, tmp_path: Path) -> None:
         """Test handle_diarize_only_mode with save_path."""
@@ -162,6 +185,141 @@ class TestHandleApplyDiarizationMode:
             assert save_path.exists()
 
 
+class TestLazyImportDiarizationCache:
+    """Test that _lazy_import_diarization resolves the diarization module once."""
+
+    def test_second_call_reuses_first_import(self) -> None:
+        """Later calls should return the cached exports without importing again."""
+        fake_module = MagicMock()
+
+        with (
+            patch("vtt_transcribe.handlers._diarization_exports", None),
+            patch.dict("sys.modules", {"vtt_transcribe.diarization": fake_module}),
+        ):
+            first = _lazy_import_diarization()
+
+            with patch.dict("sys.modules", {"vtt_transcribe.diarization": None}):
+                second = _lazy_import_diarization()
+
+        assert first[0] is fake_module.SpeakerDiarizer
+        assert second is first
+
+
+class TestCachedDiarize:
+    """Tests for the opt-in on-disk diarization cache."""
+
+    @pytest.fixture
+    def audio_file(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+        """Audio file with the cache rooted under tmp_path."""
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+        audio_path = tmp_path / "audio.mp3"
+        audio_path.write_bytes(b"fake audio")
+        return audio_path
+
+    def test_cache_disabled_by_default(self, audio_file: Path, monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+        """Without VTT_DIARIZATION_CACHE every call should run the diarizer and write nothing."""
+        monkeypatch.delenv("VTT_DIARIZATION_CACHE", raising=False)
+        diarizer = MagicMock()
+        diarizer.diarize_audio.return_value = [(0.0, 1.0, "SPEAKER_00")]
+
+        _cached_diarize(diarizer, audio_file)
+        _cached_diarize(diarizer, audio_file)
+
+        assert diarizer.diarize_audio.call_count == 2
+        assert not (tmp_path / "cache").exists()
+
+    def test_second_call_reads_segments_from_cache(self, audio_file: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """The same audio content should only be diarized once."""
+        monkeypatch.setenv("VTT_DIARIZATION_CACHE", "1")
+        diarizer = MagicMock()
+        diarizer.diarize_audio.return_value = [(0.0, 1.5, "SPEAKER_00"), (1.5, 3.0, "SPEAKER_01")]
+
+        first = _cached_diarize(diarizer, audio_file)
+        second = _cached_diarize(diarizer, audio_file)
+
+        diarizer.diarize_audio.assert_called_once_with(audio_file)
+        assert second == first == [(0.0, 1.5, "SPEAKER_00"), (1.5, 3.0, "SPEAKER_01")]
+
+    def test_changed_audio_is_diarized_again(self, audio_file: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Entries are keyed by content, so rewriting the file should miss the cache."""
+        monkeypatch.setenv("VTT_DIARIZATION_CACHE", "1")
+        diarizer = MagicMock()
+        diarizer.diarize_audio.return_value = [(0.0, 1.0, "SPEAKER_00")]
+
+        _cached_diarize(diarizer, audio_file)
+        audio_file.write_bytes(b"other audio")
+        _cached_diarize(diarizer, audio_file)
+
+        assert diarizer.diarize_audio.call_count == 2
+
+    def test_corrupt_entry_falls_back_to_diarization(
+        self, audio_file: Path, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        """An unreadable cache entry should be ignored and replaced."""
+        monkeypatch.setenv("VTT_DIARIZATION_CACHE", "1")
+        diarizer = MagicMock()
+        diarizer.diarize_audio.return_value = [(0.0, 1.0, "SPEAKER_00")]
+        _cached_diarize(diarizer, audio_file)
+        (cache_file,) = (tmp_path / "cache" / "vtt-transcribe" / "diarization").glob("*.json")
+        cache_file.write_text("not json", encoding="utf-8")
+
+        assert _cached_diarize(diarizer, audio_file) == [(0.0, 1.0, "SPEAKER_00")]
+        assert diarizer.diarize_audio.call_count == 2
+        assert cache_file.read_text(encoding="utf-8") == '[[0.0, 1.0, "SPEAKER_00"]]'
+
+
+class TestExtractSpeakersFromTranscript:
+    """Tests for _extract_speakers_from_transcript."""
+
+    def test_counts_speakers_in_order_of_appearance(self) -> None:
+        """Should count labeled lines per speaker, in first-seen order, for both timestamp formats."""
+        transcript = (
+            "[00:00:00 - 00:00:05] SPEAKER_01: Hello\n"
+            "\n"
+            "[00:05 - 00:10] SPEAKER_00 \n"
+            "[00:00:10 - 00:00:15] SPEAKER_01: Again\n"
+            "mentions SPEAKER_02 mid-line\n"
+        )
+
+        speakers = _extract_speakers_from_transcript(transcript)
+
+        assert list(speakers.items()) == [("SPEAKER_01", 2), ("SPEAKER_00", 1)]
+
+    def test_label_on_next_line_is_not_matched(self) -> None:
+        """A speaker label must be on the same line as its timestamp."""
+        assert _extract_speakers_from_transcript("[00:00:00 - 00:00:05]\nSPEAKER_00: Hello") == {}
+
+    def test_unlabeled_transcript_returns_no_speakers(self) -> None:
+        """Should return an empty list when no line carries a speaker label."""
+        assert _extract_speakers_from_transcript("[00:00:00 - 00:00:05] Hello\n[00:00:05 - 00:00:10] World") == {}
+
+
+class TestRenameSpeakers:
+    """Tests for _rename_speakers."""
+
+    def test_renames_whole_labels_in_one_pass(self) -> None:
+        """Renames should not touch longer labels or chain into each other."""
+        transcript = "[00:00 - 00:05] SPEAKER_1: Hi\n[00:05 - 00:10] SPEAKER_10: Hey\n[00:10 - 00:15] SPEAKER_2: Hello"
+
+        result = _rename_speakers(transcript, {"SPEAKER_1": "SPEAKER_2", "SPEAKER_2": "Bob"})
+
+        assert result == "[00:00 - 00:05] SPEAKER_2: Hi\n[00:05 - 00:10] SPEAKER_10: Hey\n[00:10 - 00:15] Bob: Hello"
+
+    def test_labels_embedded_in_words_are_not_renamed(self) -> None:
+        """Only standalone labels should be renamed."""
+        transcript = "[00:00 - 00:05] SPEAKER_1: see MY_SPEAKER_1 and SPEAKER_1x"
+
+        result = _rename_speakers(transcript, {"SPEAKER_1": "Alice"})
+
+        assert result == "[00:00 - 00:05] Alice: see MY_SPEAKER_1 and SPEAKER_1x"
+
+    def test_no_renames_returns_transcript_unchanged(self) -> None:
+        """An empty rename map should return the transcript as-is."""
+        transcript = "[00:00 - 00:05] SPEAKER_00: Hi"
+
+        assert _rename_speakers(transcript, {}) is transcript
+
+
 class TestHandleReviewSpeakers:
     """Test handle_review_speakers function."""
 
@@ -174,6 +332,20 @@ class TestHandleReviewSpeakers:
             mock_import.return_value = (MagicMock(), MagicMock(), MagicMock(), MagicMock())
             handle_review_speakers(input_path=None, transcript=None)
 
+    def test_handle_review_speakers_with_transcript_needs_no_diarization_deps(self) -> None:
+        """Reviewing a given transcript should not import the diarization model stack."""
+        transcript = "[00:00 - 00:05] SPEAKER_00: Hello\n[00:05 - 00:10] SPEAKER_01: Hi"
+
+        with (
+            patch("vtt_transcribe.handlers._lazy_import_diarization", side_effect=ImportError("no torch")) as mock_import,
+            patch("builtins.input", side_effect=["Alice", ""]),
+            patch("builtins.print"),
+        ):
+            result = handle_review_speakers(transcript=transcript)
+
+        mock_import.assert_not_called()
+        assert result == "[00:00 - 00:05] Alice: Hello\n[00:05 - 00:10] SPEAKER_01: Hi"
+
     def test_handle_review_speakers_with_missing_file(self) -> None:
         """Test handle_review_speakers raises error for missing input file."""
         with (  # noqa: PT012
@@ -338,6 +510,153 @@ class TestHandleStandardTranscription:
             assert "SPEAKER_00" in result
             mock_diarizer.apply_speakers_to_transcript.assert_called_once()
 
+    @staticmethod
+    def _diarize_args(input_file: Path, *, delete_audio: bool = False, force: bool = False) -> MagicMock:
+        args = MagicMock()
+        args.input_file = str(input_file)
+        args.output_audio = None
+        args.delete_audio = delete_audio
+        args.force = force
+        args.scan_chunks = False
+        args.diarize = True
+        args.hf_token = "hf_token"
+        args.device = "cpu"
+        args.no_review_speakers = True
+        args.translate = False
+        args.translate_to = None
+        return args
+
+    def test_diarization_overlaps_transcription_and_defers_cleanup(self, tmp_path: Path) -> None:
+        """Diarization should run during transcription, and audio is deleted only once both finish."""
+        audio_file = tmp_path / "test.mp3"
+        audio_file.write_bytes(b"fake audio")
+        diarization_started = threading.Event()
+
+        def diarize_audio(_path: Path) -> list[tuple[float, float, str]]:
+            diarization_started.set()
+            return [(0.0, 5.0, "SPEAKER_00")]
+
+        def transcribe(*_args: Any, **_kwargs: Any) -> str:
+            assert diarization_started.wait(timeout=5), "diarization should start before transcription returns"
+            return "[00:00:00 - 00:00:05] Hello"
+
+        mock_transcriber = MagicMock()
+        mock_transcriber.transcribe.side_effect = transcribe
+        mock_diarizer = MagicMock()
+        mock_diarizer.diarize_audio.side_effect = diarize_audio
+
+        with (
+            patch("vtt_transcribe.transcriber.VideoTranscriber", return_value=mock_transcriber) as mock_class,
+            patch("vtt_transcribe.handlers._lazy_import_diarization") as mock_import,
+            patch("builtins.print"),
+        ):
+            mock_class.SUPPORTED_AUDIO_FORMATS = (".mp3", ".wav")
+            mock_import.return_value = (MagicMock(return_value=mock_diarizer), MagicMock(), MagicMock(), MagicMock())
+
+            handle_standard_transcription(self._diarize_args(audio_file, delete_audio=True), "test_api_key")
+
+        assert mock_transcriber.transcribe.call_args.kwargs["keep_audio"] is True
+        mock_diarizer.apply_speakers_to_transcript.assert_called_once_with(
+            "[00:00:00 - 00:00:05] Hello", [(0.0, 5.0, "SPEAKER_00")]
+        )
+        mock_transcriber.cleanup_audio_files.assert_called_once_with(audio_file)
+
+    def test_transcription_error_does_not_wait_for_diarization(self, tmp_path: Path) -> None:
+        """A failed transcription should raise while a slow diarization is still running."""
+        audio_file = tmp_path / "test.mp3"
+        audio_file.write_bytes(b"fake audio")
+        diarization_started = threading.Event()
+        release_diarization = threading.Event()
+
+        def diarize_audio(_path: Path) -> list[tuple[float, float, str]]:
+            diarization_started.set()
+            release_diarization.wait(timeout=10)
+            return []
+
+        def transcribe(*_args: Any, **_kwargs: Any) -> str:
+            assert diarization_started.wait(timeout=5), "diarization should start before transcription fails"
+            msg = "API error"
+            raise RuntimeError(msg)
+
+        mock_transcriber = MagicMock()
+        mock_transcriber.transcribe.side_effect = transcribe
+        mock_diarizer = MagicMock()
+        mock_diarizer.diarize_audio.side_effect = diarize_audio
+
+        try:
+            with (
+                patch("vtt_transcribe.transcriber.VideoTranscriber", return_value=mock_transcriber) as mock_class,
+                patch("vtt_transcribe.handlers._lazy_import_diarization") as mock_import,
+                patch("builtins.print"),
+            ):
+                mock_class.SUPPORTED_AUDIO_FORMATS = (".mp3", ".wav")
+                mock_import.return_value = (MagicMock(return_value=mock_diarizer), MagicMock(), MagicMock(), MagicMock())
+
+                with pytest.raises(RuntimeError, match="API error"):
+                    handle_standard_transcription(self._diarize_args(audio_file, delete_audio=True), "test_api_key")
+
+            # The error surfaced while diarization was still blocked
+            assert not release_diarization.is_set()
+            mock_diarizer.apply_speakers_to_transcript.assert_not_called()
+            mock_transcriber.cleanup_audio_files.assert_not_called()
+        finally:
+            release_diarization.set()
+
+    def test_running_diarization_does_not_delay_process_exit(self, tmp_path: Path) -> None:
+        """An abandoned background diarization should not keep the interpreter alive at exit."""
+        script = textwrap.dedent(
+            """
+            import time
+            from pathlib import Path
+
+            from vtt_transcribe.handlers import _diarize_in_background
+
+
+            class SlowDiarizer:
+                def diarize_audio(self, _path):
+                    time.sleep(30)
+                    return []
+
+
+            _diarize_in_background(SlowDiarizer(), Path("unused.mp3"))
+            raise SystemExit(3)
+            """
+        )
+        env = {k: v for k, v in os.environ.items() if k != "VTT_DIARIZATION_CACHE"}
+
+        start = time.monotonic()
+        completed = subprocess.run(
+            [sys.executable, "-c", script], cwd=tmp_path, env=env, capture_output=True, check=False, timeout=60
+        )
+
+        assert completed.returncode == 3, completed.stderr
+        assert time.monotonic() - start < 20
+
+    def test_diarization_waits_for_forced_audio_extraction(self, tmp_path: Path) -> None:
+        """With --force on a video, diarization should wait for transcription to re-extract the audio."""
+        video_file = tmp_path / "test.mp4"
+        video_file.write_bytes(b"fake video")
+        (tmp_path / "test.mp3").write_bytes(b"stale audio")
+
+        calls: list[str] = []
+        mock_transcriber = MagicMock()
+        mock_transcriber.transcribe.side_effect = lambda *_args, **_kwargs: calls.append("transcribe") or "transcript"
+        mock_diarizer = MagicMock()
+        mock_diarizer.diarize_audio.side_effect = lambda _path: calls.append("diarize") or []
+
+        with (
+            patch("vtt_transcribe.transcriber.VideoTranscriber", return_value=mock_transcriber) as mock_class,
+            patch("vtt_transcribe.handlers._lazy_import_diarization") as mock_import,
+            patch("builtins.print"),
+        ):
+            mock_class.SUPPORTED_AUDIO_FORMATS = (".mp3", ".wav")
+            mock_import.return_value = (MagicMock(return_value=mock_diarizer), MagicMock(), MagicMock(), MagicMock())
+
+            handle_standard_transcription(self._diarize_args(video_file, force=True), "test_api_key")
+
+        assert calls == ["transcribe", "diarize"]
+        mock_diarizer.diarize_audio.assert_called_once_with(tmp_path / "test.mp3")
+
     def test_handle_standard_transcription_detects_language(self, tmp_path: Path) -> None:
         """Test that language detection is called and displayed."""
         audio_file = tmp_path / "test.mp3"
@@ -748,6 +1067,7 @@ class TestHandlersCoverage:
 
         mock_diarizer = MagicMock()
         mock_diarizer.diarize_audio.return_value = [(0.0, 5.0, "SPEAKER_00")]
+        mock_diarizer.uses_cuda = True
 
         # Mock format function
         mock_format = MagicMock(return_value="[00:00 - 00:05] SPEAKER_00")
@@ -775,6 +1095,27 @@ class TestHandlersCoverage:
             )
 
             assert "SPEAKER_00" in result
+            mock_torch.cuda.is_available.assert_called_once()
+            assert mock_torch.cuda.memory_allocated.call_count == 2
+
+    def test_diarize_only_skips_gpu_report_when_diarizer_runs_on_cpu(self, tmp_path: Path) -> None:
+        """GPU info should not be probed when the diarizer resolves to CPU (e.g. DISABLE_GPU)."""
+        audio_file = tmp_path / "test.mp3"
+        audio_file.write_bytes(b"fake audio")
+        mock_diarizer = MagicMock()
+        mock_diarizer.diarize_audio.return_value = []
+        mock_diarizer.uses_cuda = False
+
+        with (
+            patch("vtt_transcribe.handlers._lazy_import_diarization") as mock_lazy,
+            patch("vtt_transcribe.handlers._get_cuda_torch") as mock_get_cuda_torch,
+            patch("builtins.print"),
+        ):
+            mock_lazy.return_value = (MagicMock(return_value=mock_diarizer), MagicMock(return_value=""), None, None)
+
+            handle_diarize_only_mode(audio_file, hf_token="test-token", save_path=None, device="auto")
+
+        mock_get_cuda_torch.assert_not_called()
 
     def test_translate_audio_cleanup(self, tmp_path: Path) -> None:
         """Test audio cleanup in translation mode (lines 313-317)."""
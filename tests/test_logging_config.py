@@ -196,6 +196,37 @@ class TestLoggingConfigCoverage:
         assert "ValueError" in log_data["exception"]
         assert "Test exception" in log_data["exception"]
 
+    def test_json_formatter_output_is_compact_and_skips_record_attributes(self) -> None:
+        """Test JSON formatter emits only extra fields, without separator whitespace."""
+        import json
+
+        from vtt_transcribe.logging_config import JsonFormatter
+
+        record = logging.LogRecord("test_compact", logging.INFO, __file__, 1, "Hello %s", ("world",), None)
+        record.job_id = "job-1"
+
+        output = JsonFormatter().format(record)
+
+        assert ", " not in output
+        assert '": ' not in output
+        log_data = json.loads(output)
+        assert set(log_data) == {"timestamp", "level", "logger", "message", "job_id"}
+        assert log_data["message"] == "Hello world"
+
+    def test_json_formatter_serializes_non_json_extra_values_as_strings(self) -> None:
+        """Test JSON formatter falls back to str() for values json cannot encode."""
+        import json
+        from pathlib import Path
+
+        from vtt_transcribe.logging_config import JsonFormatter
+
+        record = logging.LogRecord("test_default", logging.INFO, __file__, 1, "Saved", (), None)
+        record.output_path = Path("out") / "transcript.txt"
+
+        log_data = json.loads(JsonFormatter().format(record))
+
+        assert log_data["output_path"] == str(Path("out") / "transcript.txt")
+
 
 class TestOperationContext:
     """Test operation context tracking and correlation IDs."""
@@ -233,6 +264,15 @@ class TestOperationContext:
         context = logging_config.get_operation_context()
         assert context == {}
 
+    def test_operation_context_is_read_only(self) -> None:
+        """Test that get_operation_context returns a view that cannot modify the context."""
+        with logging_config.operation_context("test_operation"):
+            context = logging_config.get_operation_context()
+            with pytest.raises(TypeError):
+                context["operation_name"] = "changed"  # type: ignore[index]
+
+            assert logging_config.get_operation_context()["operation_name"] == "test_operation"
+
     def test_nested_operation_contexts(self) -> None:
         """Test that nested operation contexts work correctly."""
         with logging_config.operation_context("outer_operation", level="outer"):
@@ -297,6 +337,9 @@ class TestOperationContext:
         # Log within operation context with extra data
         with logging_config.operation_context("test_operation", context_field="from_context"):
             logger.info("Test message", extra={"extra_field": "from_extra", "context_field": "from_extra_override"})
+            # The active context itself must not pick up the extra fields
+            assert logging_config.get_operation_context()["context_field"] == "from_context"
+            assert "extra_field" not in logging_config.get_operation_context()
 
         # Parse output
         output = stream.getvalue()
@@ -1,6 +1,7 @@
 """Comprehensive unit and integration tests for video_to_text."""
 
 import os
+import subprocess
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, cast
 from unittest.mock import MagicMock, patch
@@ -215,84 +216,91 @@ class TestExtractAudio:
 
     def test_extract_audio_file_not_exists(self, tmp_path: Path) -> None:
         """Should extract audio when file doesn't exist."""
-        # Given video file and mocked VideoFileClip
+        # Given video file and mocked ffmpeg
         video_path = tmp_path / "video.mp4"
         video_path.touch()
         audio_path = tmp_path / "audio.mp3"
 
         with (
             patch("vtt_transcribe.transcriber.OpenAI"),
-            patch("vtt_transcribe.audio_manager.VideoFileClip") as mock_video_class,
+            patch(
+                "vtt_transcribe.audio_manager.subprocess.run",
+                return_value=subprocess.CompletedProcess(args=["ffmpeg"], returncode=0, stdout="", stderr=""),
+            ) as mock_run,
         ):
-            mock_video_instance = MagicMock()
-            mock_video_instance.audio = MagicMock()
-            mock_video_instance.__enter__.return_value = mock_video_instance
-            mock_video_instance.__exit__.return_value = None
-            mock_video_class.return_value = mock_video_instance
-
             transcriber = VideoTranscriber("key")
             # When extract_audio is called with non-existent audio_path
             transcriber.extract_audio(video_path, audio_path, force=False)
 
-            # Then VideoFileClip is created and audio is written using context manager
-            mock_video_class.assert_called_once_with(str(video_path))
-            mock_video_instance.audio.write_audiofile.assert_called_once()
+            # Then ffmpeg is run from the video to the audio path
+            mock_run.assert_called_once()
+            cmd = mock_run.call_args[0][0]
+            assert cmd[0] == "ffmpeg"
+            assert cmd[cmd.index("-i") + 1] == str(video_path)
+            assert cmd[-1] == str(audio_path)
 
     def test_extract_audio_file_exists_no_force(self, tmp_path: Path) -> None:
         """Should skip extraction when file exists and force=False."""
-        # Given existing audio file and mocked VideoFileClip
+        # Given existing audio file and mocked ffmpeg
         video_path = tmp_path / "video.mp4"
         video_path.touch()
         audio_path = tmp_path / "audio.mp3"
         audio_path.write_text("dummy")
 
-        with patch("vtt_transcribe.transcriber.OpenAI"), patch("vtt_transcribe.audio_manager.VideoFileClip") as mock_video:
+        with patch("vtt_transcribe.transcriber.OpenAI"), patch("vtt_transcribe.audio_manager.subprocess.run") as mock_run:
             transcriber = VideoTranscriber("key")
             with patch("builtins.print"):
                 # When extract_audio is called with existing file and force=False
                 transcriber.extract_audio(video_path, audio_path, force=False)
 
-            # Then VideoFileClip is not called (extraction skipped)
-            mock_video.assert_not_called()
+            # Then ffmpeg is not run (extraction skipped)
+            mock_run.assert_not_called()
 
     def test_extract_audio_file_exists_with_force(self, tmp_path: Path) -> None:
         """Should extract when force=True even if file exists."""
-        # Given existing audio file and mocked VideoFileClip
+        # Given existing audio file and mocked ffmpeg
         video_path = tmp_path / "video.mp4"
         video_path.touch()
         audio_path = tmp_path / "audio.mp3"
         audio_path.write_text("dummy")
 
-        with patch("vtt_transcribe.transcriber.OpenAI"), patch("vtt_transcribe.audio_manager.VideoFileClip") as mock_video:
-            mock_video_instance = MagicMock()
-            mock_video_instance.audio = MagicMock()
-            mock_video.return_value = mock_video_instance
-
+        with (
+            patch("vtt_transcribe.transcriber.OpenAI"),
+            patch(
+                "vtt_transcribe.audio_manager.subprocess.run",
+                return_value=subprocess.CompletedProcess(args=["ffmpeg"], returncode=0, stdout="", stderr=""),
+            ) as mock_run,
+        ):
             transcriber = VideoTranscriber("key")
             # When extract_audio is called with force=True
             transcriber.extract_audio(video_path, audio_path, force=True)
 
-            # Then VideoFileClip is called despite existing file
-            mock_video.assert_called_once()
+            # Then ffmpeg is run despite existing file, overwriting it
+            mock_run.assert_called_once()
+            assert "-y" in mock_run.call_args[0][0]
 
     def test_extract_audio_no_audio_track(self, tmp_path: Path) -> None:
         """Should handle video with no audio track."""
-        # Given video file with no audio track and mocked VideoFileClip
+        # Given video file with no audio track and mocked ffmpeg
         video_path = tmp_path / "video.mp4"
         video_path.touch()
         audio_path = tmp_path / "audio.mp3"
 
-        with patch("vtt_transcribe.transcriber.OpenAI"), patch("vtt_transcribe.audio_manager.VideoFileClip") as mock_video:
-            mock_video_instance = MagicMock()
-            mock_video_instance.audio = None
-            mock_video.return_value = mock_video_instance
-
+        no_audio = subprocess.CompletedProcess(
+            args=["ffmpeg"], returncode=1, stdout="", stderr="Stream map '0:a:0' matches no streams."
+        )
+        with (
+            patch("vtt_transcribe.transcriber.OpenAI"),
+            patch("vtt_transcribe.audio_manager.subprocess.run", return_value=no_audio),
+            patch("builtins.print") as mock_print,
+        ):
             transcriber = VideoTranscriber("key")
             # When extract_audio is called on video with no audio
             transcriber.extract_audio(video_path, audio_path, force=False)
 
-            # Then write_audiofile is not called
-            mock_video_instance.write_audiofile.assert_not_called()
+            # Then a warning is printed and no audio file is created
+            assert any("No audio track" in str(call) for call in mock_print.call_args_list)
+            assert not audio_path.exists()
 
 
 class TestGetAudioDuration:
@@ -300,24 +308,24 @@ class TestGetAudioDuration:
 
     def test_get_audio_duration(self) -> None:
         """Should return audio duration in seconds."""
-        # Given mocked AudioFileClip with 120.5 second duration
+        # Given mocked ffprobe reporting a 120.5 second duration
         with (
             patch("vtt_transcribe.transcriber.OpenAI"),
-            patch("vtt_transcribe.audio_manager.AudioFileClip") as mock_audio_class,
+            patch(
+                "vtt_transcribe.audio_manager.subprocess.run",
+                return_value=subprocess.CompletedProcess(args=["ffprobe"], returncode=0, stdout="120.500000\n", stderr=""),
+            ) as mock_run,
         ):
-            mock_audio_instance = MagicMock()
-            mock_audio_instance.duration = 120.5
-            mock_audio_instance.__enter__.return_value = mock_audio_instance
-            mock_audio_instance.__exit__.return_value = None
-            mock_audio_class.return_value = mock_audio_instance
-
             transcriber = VideoTranscriber("key")
             # When get_audio_duration is called
             duration = transcriber.get_audio_duration(Path("audio.mp3"))
 
-            # Then duration is returned and AudioFileClip context manager is used
+            # Then duration is returned and ffprobe read it from the container metadata
             assert duration == 120.5
-            mock_audio_class.assert_called_once_with("audio.mp3")
+            cmd = mock_run.call_args[0][0]
+            assert cmd[0] == "ffprobe"
+            assert "format=duration" in cmd
+            assert cmd[-1] == "audio.mp3"
 
 
 class TestCalculateChunkParams:
@@ -367,18 +375,14 @@ class TestExtractAudioChunk:
 
     def test_extract_audio_chunk(self, tmp_path: Path) -> None:
         """Should extract and save audio chunk."""
-        # Given audio file and mocked AudioFileClip with time slice 0-60 seconds
+        # Given audio file and mocked ffmpeg with time slice 0-60 seconds
         with (
             patch("vtt_transcribe.transcriber.OpenAI"),
-            patch("vtt_transcribe.audio_manager.AudioFileClip") as mock_audio_class,
+            patch(
+                "vtt_transcribe.audio_manager.subprocess.run",
+                return_value=subprocess.CompletedProcess(args=["ffmpeg"], returncode=0, stdout="", stderr=""),
+            ) as mock_run,
         ):
-            mock_audio_instance = MagicMock()
-            mock_chunk = MagicMock()
-            mock_audio_instance.subclipped.return_value = mock_chunk
-            mock_audio_instance.__enter__.return_value = mock_audio_instance
-            mock_audio_instance.__exit__.return_value = None
-            mock_audio_class.return_value = mock_audio_instance
-
             audio_path = tmp_path / "audio.mp3"
             audio_path.touch()
 
@@ -386,10 +390,12 @@ class TestExtractAudioChunk:
             # When extract_audio_chunk is called with chunk index 0
             chunk_path = transcriber.extract_audio_chunk(audio_path, 0.0, 60.0, 0)
 
-            # Then chunk file is created and audio_chunk0.mp3 is generated
+            # Then ffmpeg slices 0-60 seconds into audio_chunk0.mp3
             assert chunk_path.name == "audio_chunk0.mp3"
-            mock_audio_instance.subclipped.assert_called_once_with(0.0, 60.0)
-            mock_chunk.write_audiofile.assert_called_once()
+            cmd = mock_run.call_args[0][0]
+            assert cmd[cmd.index("-ss") + 1] == "0.0"
+            assert cmd[cmd.index("-t") + 1] == "60.0"
+            assert cmd[-1] == str(chunk_path)
 
 
 class TestTranscribeAudioFile:
@@ -757,6 +763,41 @@ class TestChunkTimestampOffsetsMinute:
                 assert "[00:00:00 - 00:00:01] First minute" in result
                 assert "[00:01:00 - 00:01:01] Second minute" in result
 
+    def test_chunks_extracted_concurrently_in_order(self, tmp_path: Path) -> None:
+        """Chunks should be extracted on worker threads and transcribed in chunk order."""
+        import threading
+        import time as time_module
+
+        with patch("vtt_transcribe.transcriber.OpenAI"):
+            audio_path = tmp_path / "audio.mp3"
+            audio_path.write_text("dummy audio")
+
+            transcriber = VideoTranscriber("key")
+            calls: list[tuple[float, float, int, str]] = []
+
+            def fake_extract(_audio_path: Any, start: float, end: float, idx: int) -> Path:
+                # Later chunks finish first to show ordering does not depend on completion
+                time_module.sleep(0.01 * (3 - idx))
+                calls.append((start, end, idx, threading.current_thread().name))
+                p = tmp_path / f"chunk{idx}.mp3"
+                p.write_text("chunk")
+                return p
+
+            with (
+                patch("vtt_transcribe.transcriber.os.cpu_count", return_value=4),
+                patch.object(VideoTranscriber, "extract_audio_chunk", side_effect=fake_extract),
+                patch.object(VideoTranscriber, "_transcribe_chunk_files", return_value=[]) as mock_transcribe,
+                patch("builtins.print"),
+            ):
+                transcriber.transcribe_chunked_audio(
+                    audio_path, duration=150.0, num_chunks=3, chunk_duration=60.0, keep_chunks=True
+                )
+
+            assert sorted(call[:3] for call in calls) == [(0.0, 60.0, 0), (60.0, 120.0, 1), (120.0, 150.0, 2)]
+            assert all(call[3].startswith("vtt-chunk") for call in calls)
+            chunk_files = mock_transcribe.call_args[0][0]
+            assert chunk_files == [tmp_path / "chunk0.mp3", tmp_path / "chunk1.mp3", tmp_path / "chunk2.mp3"]
+
 
 class TestChunkTimestampOffsetsVariable:
     """Verify offsets when chunks are very short (variable lengths)."""
@@ -1,8 +1,10 @@
 """FastAPI application factory and configuration."""
 
+import asyncio
 import contextlib
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 from typing import Any
 
@@ -25,16 +27,25 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Threads backing asyncio.to_thread (upload copies and OpenAI calls made while handling requests).
+# The work is I/O-bound, so size the pool above the interpreter default of cpu_count + 4.
+DEFAULT_EXECUTOR_WORKERS = int(os.getenv("DEFAULT_EXECUTOR_WORKERS", str(min(32, (os.cpu_count() or 1) * 4))))
+
 
 @asynccontextmanager
 async def lifespan(_app: FastAPI):  # type: ignore
-    """Lifespan event handler for database initialization."""
+    """Lifespan event handler for thread pool and database initialization."""
+    # Startup: Size the default executor used by asyncio.to_thread
+    executor = ThreadPoolExecutor(max_workers=DEFAULT_EXECUTOR_WORKERS, thread_name_prefix="vtt-api")
+    asyncio.get_running_loop().set_default_executor(executor)
+
     # Startup: Initialize database tables
     with contextlib.suppress(Exception):
         # Database initialization failed, continue without DB functionality
         await init_db()
     yield
-    # Shutdown: cleanup if needed
+    # Shutdown: Drop queued to_thread work instead of holding up exit
+    executor.shutdown(wait=False, cancel_futures=True)
 
 
 app = FastAPI(
@@ -91,6 +102,7 @@ else:
 app.include_router(api_keys.router)
 app.include_router(jobs.router)
 app.include_router(transcription.router)
+app.include_router(transcription.upload_router)
 app.include_router(websockets.router)
 
 
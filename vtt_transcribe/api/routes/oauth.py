@@ -1,5 +1,6 @@
 """OAuth provider authentication routes."""
 
+import asyncio
 import logging
 import os
 import secrets
@@ -119,10 +120,19 @@ async def get_user_info_from_google(token: dict[str, object]) -> str | None:
 
 
 async def get_user_info_from_github(client: object, token: dict[str, object]) -> str | None:
-    """Fetch email from GitHub API (handles private emails)."""
+    """Fetch email from GitHub API (handles private emails).
+
+    The ``/user`` and ``/user/emails`` endpoints are independent, so both are
+    requested concurrently; the emails response is only consulted when the
+    profile email is private.
+    """
     try:
+        user_response, emails_response = await asyncio.gather(
+            client.get("https://api.github.com/user", token=token),  # type: ignore
+            client.get("https://api.github.com/user/emails", token=token),  # type: ignore
+        )
+
         # Get user data
-        user_response = await client.get("https://api.github.com/user", token=token)  # type: ignore
         if user_response.status_code not in (200, 201):
             logger.warning("GitHub user API returned status %s", user_response.status_code)
             return None
@@ -134,12 +144,8 @@ async def get_user_info_from_github(client: object, token: dict[str, object]) ->
 
         email = user_data.get("email")
 
-        # If email is private, fetch from emails endpoint
+        # If email is private, fall back to the primary address from the emails endpoint
         if not email:
-            emails_response = await client.get(  # type: ignore
-                "https://api.github.com/user/emails",
-                token=token,
-            )
             if emails_response.status_code not in (200, 201):
                 logger.warning("GitHub emails API returned status %s", emails_response.status_code)
                 return None
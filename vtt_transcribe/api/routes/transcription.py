@@ -1,26 +1,247 @@
 """Transcription API endpoints."""
 
 import asyncio
+import contextlib
+import contextvars
+import functools
+import hashlib
+import io
 import os
 import re
+import shutil
 import tempfile
 import time
 import uuid
+import weakref
+from collections.abc import Callable, Coroutine, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, fields
 from pathlib import Path
-from typing import Any
+from typing import Any, ParamSpec, TypeVar
 
-from fastapi import APIRouter, File, Form, HTTPException, Query, UploadFile
-from fastapi.responses import PlainTextResponse
+from fastapi import APIRouter, File, Form, HTTPException, Query, Request, Response, UploadFile
+from fastapi.responses import StreamingResponse
+from fastapi.routing import APIRoute
 
 from vtt_transcribe.logging_config import get_logger
 from vtt_transcribe.transcriber import VideoTranscriber
 from vtt_transcribe.translator import AudioTranslator
 
-router = APIRouter(prefix="/api", tags=["transcription"])
 logger = get_logger(__name__)
 
-# Jobs dictionary now includes progress_updates queue for each job
-jobs: dict[str, dict[str, Any]] = {}
+# Maximum file size: 100MB
+MAX_FILE_SIZE = 100 * 1024 * 1024
+
+# Allowance for multipart boundaries and form fields on top of MAX_FILE_SIZE
+MAX_REQUEST_OVERHEAD = 1024 * 1024
+
+# Maximum progress queue size (to prevent unbounded memory growth)
+# A typical transcription job emits ~10-20 progress events, so 100 is generous
+MAX_PROGRESS_QUEUE_SIZE = 100
+
+# Maximum number of transcription/diarization jobs processed at once; further jobs wait
+MAX_CONCURRENT_JOBS = int(os.getenv("MAX_CONCURRENT_JOBS", "4"))
+
+# Finished jobs (and their transcripts) are dropped from memory after this many seconds
+JOB_RETENTION_SECONDS = int(os.getenv("JOB_RETENTION_SECONDS", "3600"))
+# Upper bound on retained jobs; the oldest finished job is evicted to make room
+MAX_RETAINED_JOBS = 10_000
+FINISHED_JOB_STATUSES = frozenset({"completed", "failed"})
+
+# Buffer size for copying in-memory uploads to disk
+UPLOAD_COPY_BUFFER_SIZE = 1024 * 1024
+
+# Upload temp files go to this tmpfs when it has room, skipping a disk round-trip
+UPLOAD_TMPFS_DIR = os.getenv("UPLOAD_TMPFS_DIR", "/dev/shm")  # noqa: S108
+# Free space to leave on the tmpfs after writing an upload
+UPLOAD_TMPFS_HEADROOM = 200 * 1024 * 1024
+
+# Cached OpenAI-backed clients, keyed per API key, so jobs reuse connection pools
+CLIENT_CACHE_TTL_SECONDS = 3600
+CLIENT_CACHE_MAX_ENTRIES = 64
+
+# Supported file extensions
+SUPPORTED_EXTENSIONS = {".mp3", ".mp4", ".wav", ".m4a", ".ogg", ".mpeg", ".mpga", ".webm"}
+# Pre-rendered for error messages so rejected uploads don't re-sort the set
+SUPPORTED_EXTENSIONS_LIST = ", ".join(sorted(SUPPORTED_EXTENSIONS))
+
+
+@dataclass(slots=True)
+class Job:
+    """In-memory record of a transcription or diarization job."""
+
+    job_id: str
+    filename: str
+    status: str = "pending"
+    file_size: int | None = None
+    diarize: bool = False
+    diarize_only: bool = False
+    has_hf_token: bool = False
+    device: str | None = None
+    translate_to: str | None = None
+    detected_language: str | None = None
+    translated_to: str | None = None
+    result: str | None = None
+    error: str | None = None
+    # Bounded queue for progress updates
+    progress_updates: asyncio.Queue[dict[str, Any]] = field(
+        default_factory=lambda: asyncio.Queue(maxsize=MAX_PROGRESS_QUEUE_SIZE)
+    )
+    # Set (and replaced) on every status change or removal; watchers wait on the instance they last saw
+    status_changed: asyncio.Event = field(default_factory=asyncio.Event, init=False, repr=False, compare=False)
+    # Parsed transcript segments for downloads, paired with the result they were parsed from
+    parsed_segments: tuple[str, list[dict[str, Any]]] | None = field(default=None, init=False, repr=False, compare=False)
+
+    def update(self, **changes: Any) -> None:
+        """Apply field changes together, waking watchers once afterwards if the status changed.
+
+        Status changes must go through here so WebSocket watchers are notified, and
+        watchers woken by a transition never see the new status without the result
+        or error that goes with it.
+        """
+        for name, value in changes.items():
+            setattr(self, name, value)
+        if "status" in changes:
+            self.notify_watchers()
+
+    def notify_watchers(self) -> None:
+        """Wake everything waiting on status_changed and start a new generation."""
+        changed = self.status_changed
+        self.status_changed = asyncio.Event()
+        changed.set()
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return job data excluding internal state (progress queue, watcher signalling, parse cache)."""
+        return {name: getattr(self, name) for name in _JOB_STATUS_FIELDS}
+
+
+# Job fields exposed through the status endpoint
+_JOB_INTERNAL_FIELDS = frozenset({"progress_updates", "status_changed", "parsed_segments"})
+_JOB_STATUS_FIELDS = tuple(f.name for f in fields(Job) if f.name not in _JOB_INTERNAL_FIELDS)
+
+
+class JobRegistry:
+    """In-memory job store that wakes a job's watchers when the job is removed.
+
+    Holds at most MAX_RETAINED_JOBS jobs while older finished jobs remain to evict;
+    jobs that are still pending or processing are never evicted.
+    """
+
+    def __init__(self) -> None:
+        """Create an empty registry."""
+        self._jobs: dict[str, Job] = {}
+
+    def add(self, job: Job) -> None:
+        """Store a job under its job_id, evicting the oldest finished job if the registry is full."""
+        if job.job_id not in self._jobs and len(self._jobs) >= MAX_RETAINED_JOBS:
+            self._evict_oldest_finished()
+        self._jobs[job.job_id] = job
+
+    def get(self, job_id: str) -> Job | None:
+        """Return the job with this ID, or None if it does not exist."""
+        return self._jobs.get(job_id)
+
+    def remove(self, job_id: str) -> Job | None:
+        """Remove a job if present, waking its watchers.
+
+        Returns:
+            The removed job, or None if there was no job with this ID
+        """
+        job = self._jobs.pop(job_id, None)
+        if job is not None:
+            job.notify_watchers()
+        return job
+
+    def _evict_oldest_finished(self) -> None:
+        """Remove the oldest completed or failed job, if any."""
+        for job_id, job in self._jobs.items():
+            if job.status in FINISHED_JOB_STATUSES:
+                # Stop iterating straight away since the dict is being modified
+                self.remove(job_id)
+                return
+
+
+jobs = JobRegistry()
+# Job slots per event loop, created on first use so waiters bind to the loop running the jobs
+_job_semaphores: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = weakref.WeakKeyDictionary()
+# Dedicated threads for blocking job work, so long-running OpenAI calls cannot
+# exhaust the default executor that request handlers rely on
+_job_executor = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_JOBS, thread_name_prefix="vtt-job")
+# Strong references to running job tasks (the event loop only keeps weak ones)
+_background_tasks: set[asyncio.Task[None]] = set()
+
+
+class ContentLengthLimitRoute(APIRoute):
+    """Route that rejects oversized requests from Content-Length before the body is read.
+
+    FastAPI parses form bodies before resolving dependencies, so the check has to
+    wrap the route handler. The per-endpoint size check remains for chunked uploads
+    that carry no Content-Length.
+    """
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        """Wrap the default handler with a Content-Length check."""
+        handler = super().get_route_handler()
+        max_request_size = MAX_FILE_SIZE + MAX_REQUEST_OVERHEAD
+
+        async def content_length_limited_handler(request: Request) -> Response:
+            content_length = request.headers.get("content-length")
+            if content_length is not None:
+                try:
+                    request_size = int(content_length)
+                except ValueError:
+                    raise HTTPException(status_code=400, detail="Invalid Content-Length header") from None
+                if request_size > max_request_size:
+                    logger.warning(
+                        "Request rejected: Content-Length exceeds limit",
+                        extra={"path": request.url.path, "content_length": request_size},
+                    )
+                    raise HTTPException(
+                        status_code=413,
+                        detail=(
+                            f"Request body too large: {request_size} bytes. Maximum request size: {max_request_size} bytes"
+                        ),
+                    )
+            return await handler(request)
+
+        return content_length_limited_handler
+
+
+router = APIRouter(prefix="/api", tags=["transcription"])
+# File upload endpoints, which reject oversized requests before reading the body
+upload_router = APIRouter(prefix="/api", tags=["transcription"], route_class=ContentLengthLimitRoute)
+
+
+_ClientT = TypeVar("_ClientT", VideoTranscriber, AudioTranslator)
+_client_cache: dict[tuple[type, str], tuple[float, Any]] = {}
+
+
+def _get_cached_client(client_cls: type[_ClientT], api_key: str) -> _ClientT:
+    """Return a cached client instance for an API key, creating it on a miss.
+
+    Entries are keyed by a hash of the API key so raw keys are not kept as dict keys,
+    expire after CLIENT_CACHE_TTL_SECONDS, and the oldest entry is evicted when full.
+
+    Args:
+        client_cls: Client class to instantiate (VideoTranscriber or AudioTranslator)
+        api_key: OpenAI API key
+
+    Returns:
+        Client instance for the API key
+    """
+    cache_key = (client_cls, hashlib.sha256(api_key.encode()).hexdigest())
+    cached = _client_cache.get(cache_key)
+    if cached and cached[0] > time.monotonic():
+        client: _ClientT = cached[1]
+        return client
+
+    client = client_cls(api_key)
+    _client_cache.pop(cache_key, None)
+    if len(_client_cache) >= CLIENT_CACHE_MAX_ENTRIES:
+        # Drop the oldest entry (dicts preserve insertion order)
+        _client_cache.pop(next(iter(_client_cache)))
+    _client_cache[cache_key] = (time.monotonic() + CLIENT_CACHE_TTL_SECONDS, client)
+    return client
 
 
 def _get_hf_token(provided_token: str | None) -> str | None:
@@ -35,22 +256,161 @@ def _get_hf_token(provided_token: str | None) -> str | None:
     return provided_token or os.environ.get("HF_TOKEN")
 
 
+def _get_file_extension(filename: str) -> str:
+    """Return the lowercased extension of filename (including the dot), or "" if it has none.
+
+    Like Path.suffix, dotfiles such as ".mp3" and names ending in a bare "." have no extension.
+    """
+    stem, dot, ext = filename.rpartition(".")
+    return f".{ext.lower()}" if dot and stem and ext else ""
+
+
+def _get_upload_size(file: UploadFile) -> int:
+    """Return the size of an upload in bytes without reading it into memory."""
+    if file.size is not None:
+        return file.size
+    src = file.file
+    src.seek(0, os.SEEK_END)
+    size = src.tell()
+    src.seek(0)
+    return size
+
+
+def _get_upload_temp_dir(size: int) -> str | None:
+    """Return UPLOAD_TMPFS_DIR if it can hold size bytes plus headroom, else None (system default).
+
+    Args:
+        size: Number of bytes about to be written
+
+    Returns:
+        Directory for the temporary file, or None to use tempfile's default
+    """
+    try:
+        free = shutil.disk_usage(UPLOAD_TMPFS_DIR).free
+    except OSError:
+        return None
+    return UPLOAD_TMPFS_DIR if free >= size + UPLOAD_TMPFS_HEADROOM else None
+
+
+def _copy_upload_to_tempfile(file: UploadFile, suffix: str) -> Path:
+    """Copy an upload to a named temporary file, on tmpfs when there is room.
+
+    Uploads backed by a file descriptor are copied in the kernel with os.sendfile;
+    sources without one (e.g. io.BytesIO) fall back to shutil.copyfileobj with a large buffer.
+
+    Args:
+        file: Uploaded file to copy
+        suffix: Suffix for the temporary file
+
+    Returns:
+        Path to the temporary file (caller is responsible for deleting it)
+    """
+    temp_dir = _get_upload_temp_dir(_get_upload_size(file))
+    src = file.file
+    src.seek(0)
+    with tempfile.NamedTemporaryFile(delete=False, suffix=suffix, dir=temp_dir) as tmp:
+        tmp_path = Path(tmp.name)
+        try:
+            src_fd = None
+            if hasattr(os, "sendfile"):
+                # An in-memory SpooledTemporaryFile rolls over to disk here, which costs at most its spool size
+                with contextlib.suppress(AttributeError, io.UnsupportedOperation, OSError, ValueError):
+                    src_fd = src.fileno()
+
+            if src_fd is None:
+                shutil.copyfileobj(src, tmp, length=UPLOAD_COPY_BUFFER_SIZE)
+            else:
+                remaining = os.fstat(src_fd).st_size
+                offset = 0
+                while remaining > 0:
+                    sent = os.sendfile(tmp.fileno(), src_fd, offset, remaining)
+                    if sent == 0:
+                        break
+                    offset += sent
+                    remaining -= sent
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+    return tmp_path
+
+
+def _get_job_semaphore() -> asyncio.Semaphore:
+    """Return the running loop's MAX_CONCURRENT_JOBS semaphore, creating it on first use."""
+    loop = asyncio.get_running_loop()
+    semaphore = _job_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = _job_semaphores[loop] = asyncio.Semaphore(MAX_CONCURRENT_JOBS)
+    return semaphore
+
+
+async def _run_with_job_slot(job_id: str, job_coro: Coroutine[Any, Any, None]) -> None:
+    """Run a job coroutine once one of the MAX_CONCURRENT_JOBS slots is free.
+
+    The job is removed from memory JOB_RETENTION_SECONDS after it finishes.
+
+    Args:
+        job_id: Job identifier
+        job_coro: Job processing coroutine to run
+    """
+    job_semaphore = _get_job_semaphore()
+    if job_semaphore.locked():
+        _emit_progress(job_id, "Waiting for an available worker", "queued")
+    try:
+        async with job_semaphore:
+            await job_coro
+    finally:
+        # No-op once the job has run; avoids a "never awaited" warning if cancelled while queued
+        job_coro.close()
+        asyncio.get_running_loop().call_later(JOB_RETENTION_SECONDS, jobs.remove, job_id)
+
+
+_P = ParamSpec("_P")
+_R = TypeVar("_R")
+
+
+async def _run_in_job_executor(func: Callable[_P, _R], /, *args: _P.args, **kwargs: _P.kwargs) -> _R:
+    """Run a blocking call on the job executor (asyncio.to_thread, but off the default pool)."""
+    loop = asyncio.get_running_loop()
+    ctx = contextvars.copy_context()
+    return await loop.run_in_executor(_job_executor, functools.partial(ctx.run, func, *args, **kwargs))
+
+
+def _start_background_job(job_id: str, job_coro: Coroutine[Any, Any, None]) -> None:
+    """Schedule a job coroutine and keep a reference to it until it finishes.
+
+    Args:
+        job_id: Job identifier
+        job_coro: Job processing coroutine to run
+    """
+    task = asyncio.create_task(_run_with_job_slot(job_id, job_coro), name=f"job-{job_id}")
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+
+def _write_temp_file(content: bytes, suffix: str) -> Path:
+    """Write content to a new named temporary file and return its path."""
+    with tempfile.NamedTemporaryFile(delete=False, suffix=suffix, dir=_get_upload_temp_dir(len(content))) as tmp:
+        tmp.write(content)
+        return Path(tmp.name)
+
+
 def _emit_progress(job_id: str, message: str, progress_type: str = "info") -> None:
     """Emit a progress update for a job.
 
     Args:
         job_id: Job identifier
         message: Progress message
-        progress_type: Type of progress update (info, chunk, diarization, language, translation)
+        progress_type: Type of progress update (info, chunk, diarization, language, translation, queued)
     """
-    if job_id in jobs and "progress_updates" in jobs[job_id]:
+    job = jobs.get(job_id)
+    if job is not None:
         update = {
             "type": progress_type,
             "message": message,
             "timestamp": time.time(),
         }
         try:
-            jobs[job_id]["progress_updates"].put_nowait(update)
+            job.progress_updates.put_nowait(update)
         except asyncio.QueueFull:
             # Log but don't fail if queue is full - oldest events will be consumed first
             logger.warning(
@@ -69,18 +429,7 @@ def _emit_progress(job_id: str, message: str, progress_type: str = "info") -> No
             )
 
 
-# Maximum file size: 100MB
-MAX_FILE_SIZE = 100 * 1024 * 1024
-
-# Maximum progress queue size (to prevent unbounded memory growth)
-# A typical transcription job emits ~10-20 progress events, so 100 is generous
-MAX_PROGRESS_QUEUE_SIZE = 100
-
-# Supported file extensions
-SUPPORTED_EXTENSIONS = {".mp3", ".mp4", ".wav", ".m4a", ".ogg", ".mpeg", ".mpga", ".webm"}
-
-
-@router.post("/transcribe")
+@upload_router.post("/transcribe")
 async def create_transcription_job(
     file: UploadFile = File(...),
     api_key: str = Form(...),
@@ -141,7 +490,7 @@ async def create_transcription_job(
         )
 
     # Validate file extension
-    file_ext = Path(file.filename).suffix.lower()
+    file_ext = _get_file_extension(file.filename)
     if file_ext not in SUPPORTED_EXTENSIONS:
         logger.warning(
             "Job creation failed: unsupported file type",
@@ -149,26 +498,30 @@ async def create_transcription_job(
         )
         raise HTTPException(
             status_code=400,
-            detail=f"Unsupported file type: {file_ext}. Supported types: {', '.join(sorted(SUPPORTED_EXTENSIONS))}",
+            detail=f"Unsupported file type: {file_ext}. Supported types: {SUPPORTED_EXTENSIONS_LIST}",
         )
 
-    # Read and validate file size
-    content = await file.read()
-    if len(content) > MAX_FILE_SIZE:
+    # Validate file size without reading the upload into memory
+    file_size = await asyncio.to_thread(_get_upload_size, file)
+    if file_size > MAX_FILE_SIZE:
         max_mb = MAX_FILE_SIZE // (1024 * 1024)
         logger.warning(
             "Job creation failed: file too large",
             extra={
                 "file_name": file.filename,
-                "file_size_bytes": len(content),
+                "file_size_bytes": file_size,
                 "max_size_bytes": MAX_FILE_SIZE,
             },
         )
         raise HTTPException(
             status_code=413,
-            detail=f"File too large: {len(content)} bytes. Maximum size: {MAX_FILE_SIZE} bytes ({max_mb}MB)",
+            detail=f"File too large: {file_size} bytes. Maximum size: {MAX_FILE_SIZE} bytes ({max_mb}MB)",
         )
 
+    # Copy the upload to disk before responding (the upload is closed once the request ends);
+    # the background job owns and deletes the temporary file
+    tmp_path = await asyncio.to_thread(_copy_upload_to_tempfile, file, file_ext)
+
     job_id = str(uuid.uuid4())
 
     logger.info(
@@ -176,27 +529,28 @@ async def create_transcription_job(
         extra={
             "job_id": job_id,
             "file_name": file.filename,
-            "file_size_mb": round(len(content) / (1024 * 1024), 2),
+            "file_size_mb": round(file_size / (1024 * 1024), 2),
         },
     )
 
-    jobs[job_id] = {
-        "job_id": job_id,
-        "status": "pending",
-        "filename": file.filename,
-        "file_size": len(content),
-        "diarize": diarize,
-        "has_hf_token": bool(hf_token) if diarize else False,
-        "device": device if diarize else None,
-        "translate_to": translate_to,
-        # Bounded queue for progress updates
-        "progress_updates": asyncio.Queue(maxsize=MAX_PROGRESS_QUEUE_SIZE),
-    }
+    jobs.add(
+        Job(
+            job_id=job_id,
+            filename=file.filename,
+            file_size=file_size,
+            diarize=diarize,
+            has_hf_token=bool(hf_token) if diarize else False,
+            device=device if diarize else None,
+            translate_to=translate_to,
+        )
+    )
 
-    task = asyncio.create_task(
-        _process_transcription(job_id, content, file.filename or "audio.mp3", api_key, diarize, hf_token, device, translate_to)
+    _start_background_job(
+        job_id,
+        _process_transcription(
+            job_id, tmp_path, file.filename or "audio.mp3", api_key, diarize, hf_token, device, translate_to
+        ),
     )
-    _ = task
 
     return {
         "job_id": job_id,
@@ -208,14 +562,14 @@ async def create_transcription_job(
 @router.get("/jobs/{job_id}")
 async def get_job_status(job_id: str) -> dict[str, Any]:
     """Get status of a transcription job."""
-    if job_id not in jobs:
+    job = jobs.get(job_id)
+    if job is None:
         raise HTTPException(status_code=404, detail="Job not found")
 
-    # Return job data excluding progress_updates queue (not JSON serializable)
-    return {k: v for k, v in jobs[job_id].items() if k != "progress_updates"}
+    return job.to_dict()
 
 
-@router.post("/detect-language")
+@upload_router.post("/detect-language")
 async def detect_language(
     file: UploadFile = File(...),
     api_key: str = Form(...),
@@ -233,29 +587,27 @@ async def detect_language(
         raise HTTPException(status_code=422, detail="File must have a filename")
 
     # Validate file extension
-    file_ext = Path(file.filename).suffix.lower()
+    file_ext = _get_file_extension(file.filename)
     if file_ext not in SUPPORTED_EXTENSIONS:
         raise HTTPException(
             status_code=400,
-            detail=f"Unsupported file type: {file_ext}. Supported types: {', '.join(sorted(SUPPORTED_EXTENSIONS))}",
+            detail=f"Unsupported file type: {file_ext}. Supported types: {SUPPORTED_EXTENSIONS_LIST}",
         )
 
-    # Read and validate file size
-    content = await file.read()
-    if len(content) > MAX_FILE_SIZE:
+    # Validate file size
+    file_size = await asyncio.to_thread(_get_upload_size, file)
+    if file_size > MAX_FILE_SIZE:
         max_mb = MAX_FILE_SIZE // (1024 * 1024)
         raise HTTPException(
             status_code=413,
-            detail=f"File too large: {len(content)} bytes. Maximum size: {MAX_FILE_SIZE} bytes ({max_mb}MB)",
+            detail=f"File too large: {file_size} bytes. Maximum size: {MAX_FILE_SIZE} bytes ({max_mb}MB)",
         )
 
     try:
-        with tempfile.NamedTemporaryFile(delete=False, suffix=Path(file.filename).suffix) as tmp:
-            tmp.write(content)
-            tmp_path = Path(tmp.name)
+        tmp_path = await asyncio.to_thread(_copy_upload_to_tempfile, file, file_ext)
 
         try:
-            transcriber = VideoTranscriber(api_key)
+            transcriber = _get_cached_client(VideoTranscriber, api_key)
             language_code = await asyncio.to_thread(transcriber.detect_language, tmp_path)
 
             return {
@@ -289,7 +641,7 @@ async def translate_transcript(
         Translated transcript
     """
     try:
-        translator = AudioTranslator(api_key)
+        translator = _get_cached_client(AudioTranslator, api_key)
         translated = await asyncio.to_thread(
             translator.translate_transcript, transcript, target_language, preserve_timestamps=preserve_timestamps
         )
@@ -304,7 +656,7 @@ async def translate_transcript(
         raise HTTPException(status_code=500, detail=f"Translation failed: {e!s}") from e
 
 
-@router.post("/diarize")
+@upload_router.post("/diarize")
 async def create_diarization_job(
     file: UploadFile = File(...),
     hf_token: str | None = Form(None),
@@ -337,19 +689,17 @@ async def create_diarization_job(
 
     job_id = str(uuid.uuid4())
 
-    jobs[job_id] = {
-        "job_id": job_id,
-        "status": "pending",
-        "filename": file.filename,
-        "diarize_only": True,
-        "has_hf_token": True,
-        "device": device,
-        # Bounded queue for progress updates
-        "progress_updates": asyncio.Queue(maxsize=MAX_PROGRESS_QUEUE_SIZE),
-    }
+    jobs.add(
+        Job(
+            job_id=job_id,
+            filename=file.filename,
+            diarize_only=True,
+            has_hf_token=True,
+            device=device,
+        )
+    )
 
-    task = asyncio.create_task(_process_diarization(job_id, file, hf_token, device))
-    _ = task
+    _start_background_job(job_id, _process_diarization(job_id, file, hf_token, device))
 
     return {
         "job_id": job_id,
@@ -361,15 +711,17 @@ async def create_diarization_job(
 async def _process_diarization(job_id: str, file: UploadFile, _hf_token: str, _device: str | None = None) -> None:
     """Process diarization-only job asynchronously."""
     # Note: hf_token and device will be used when integrating pyannote.audio
+    job = jobs.get(job_id)
+    if job is None:
+        # Job was removed before its runner started
+        return
     try:
-        jobs[job_id]["status"] = "processing"
+        job.update(status="processing")
         _emit_progress(job_id, "Starting diarization", "diarization")
 
         filename = file.filename or "audio.mp3"
-        with tempfile.NamedTemporaryFile(delete=False, suffix=Path(filename).suffix) as tmp:
-            content = await file.read()
-            tmp.write(content)
-            tmp_path = Path(tmp.name)
+        content = await file.read()
+        tmp_path = await asyncio.to_thread(_write_temp_file, content, _get_file_extension(filename))
 
         try:
             # Note: Actual diarization logic would go here
@@ -377,22 +729,20 @@ async def _process_diarization(job_id: str, file: UploadFile, _hf_token: str, _d
             _emit_progress(job_id, "Processing audio for speaker segments", "diarization")
             result = f"Diarization result for {filename}"
 
-            jobs[job_id]["status"] = "completed"
-            jobs[job_id]["result"] = result
+            job.update(status="completed", result=result)
             _emit_progress(job_id, "Diarization complete", "diarization")
 
         finally:
             await asyncio.to_thread(tmp_path.unlink, missing_ok=True)
 
     except Exception as e:
-        jobs[job_id]["status"] = "failed"
-        jobs[job_id]["error"] = str(e)
+        job.update(status="failed", error=str(e))
         _emit_progress(job_id, f"Diarization failed: {e}", "error")
 
 
 async def _process_transcription(
     job_id: str,
-    content: bytes,
+    audio_path: Path,
     filename: str,
     api_key: str,
     _diarize: bool = False,  # noqa: FBT001, FBT002
@@ -400,7 +750,10 @@ async def _process_transcription(
     _device: str | None = None,
     translate_to: str | None = None,
 ) -> None:
-    """Process transcription job asynchronously."""
+    """Process transcription job asynchronously.
+
+    Takes ownership of audio_path and deletes it when the job finishes.
+    """
     start_time = time.time()
 
     logger.info(
@@ -413,40 +766,39 @@ async def _process_transcription(
     )
 
     # Note: diarize, hf_token, device will be used when integrating diarization
+    job = jobs.get(job_id)
+    if job is None:
+        # Job was removed before its runner started
+        return
     try:
-        jobs[job_id]["status"] = "processing"
+        job.update(status="processing")
         _emit_progress(job_id, "Starting transcription", "info")
 
-        with tempfile.NamedTemporaryFile(delete=False, suffix=Path(filename).suffix) as tmp:
-            tmp.write(content)
-            tmp_path = Path(tmp.name)
-
         try:
-            transcriber = VideoTranscriber(api_key)
+            transcriber = _get_cached_client(VideoTranscriber, api_key)
 
             # Detect language before transcription
             _emit_progress(job_id, "Detecting language", "language")
-            detected_language = await asyncio.to_thread(transcriber.detect_language, tmp_path)
-            jobs[job_id]["detected_language"] = detected_language
+            detected_language = await _run_in_job_executor(transcriber.detect_language, audio_path)
+            job.detected_language = detected_language
             _emit_progress(job_id, f"Detected language: {detected_language}", "language")
 
             # Transcribe audio
             _emit_progress(job_id, "Transcribing audio", "info")
-            result = await asyncio.to_thread(transcriber.transcribe, tmp_path)
+            result = await _run_in_job_executor(transcriber.transcribe, audio_path)
             _emit_progress(job_id, "Transcription complete", "info")
 
             # If translation requested, translate the transcript
             if translate_to:
                 _emit_progress(job_id, f"Translating to {translate_to}", "translation")
-                translator = AudioTranslator(api_key)
-                result = await asyncio.to_thread(
+                translator = _get_cached_client(AudioTranslator, api_key)
+                result = await _run_in_job_executor(
                     translator.translate_transcript, result, translate_to, preserve_timestamps=True
                 )
-                jobs[job_id]["translated_to"] = translate_to
+                job.translated_to = translate_to
                 _emit_progress(job_id, f"Translation to {translate_to} complete", "translation")
 
-            jobs[job_id]["status"] = "completed"
-            jobs[job_id]["result"] = result
+            job.update(status="completed", result=result)
             _emit_progress(job_id, "Job completed successfully", "info")
 
             duration = time.time() - start_time
@@ -460,7 +812,7 @@ async def _process_transcription(
             )
 
         finally:
-            await asyncio.to_thread(tmp_path.unlink, missing_ok=True)
+            await asyncio.to_thread(audio_path.unlink, missing_ok=True)
 
     except Exception as e:
         duration = time.time() - start_time
@@ -472,11 +824,20 @@ async def _process_transcription(
                 "error": str(e),
             },
         )
-        jobs[job_id]["status"] = "failed"
-        jobs[job_id]["error"] = str(e)
+        job.update(status="failed", error=str(e))
         _emit_progress(job_id, f"Transcription failed: {e}", "error")
 
 
+# One transcript line: optional [Speaker], then [HH:MM:SS - HH:MM:SS] and the text.
+# [^\S\n] is whitespace that cannot run past the end of the line.
+_SEGMENT_PATTERN = re.compile(
+    r"^[^\S\n]*(?:\[(?P<speaker>[^\]\n]+)\][^\S\n]*)?"
+    r"\[(?P<sh>\d{2}):(?P<sm>\d{2}):(?P<ss>\d{2})[^\S\n]*-[^\S\n]*(?P<eh>\d{2}):(?P<em>\d{2}):(?P<es>\d{2})\]"
+    r"[^\S\n]*(?P<text>\S.*?)[^\S\n]*$",
+    re.MULTILINE,
+)
+
+
 def _parse_transcript_segments(transcript: str) -> list[dict[str, Any]]:
     """Parse transcript text into segments with timestamps.
 
@@ -486,107 +847,80 @@ def _parse_transcript_segments(transcript: str) -> list[dict[str, Any]]:
     Returns:
         List of segment dictionaries with start, end, text, and optional speaker
     """
-    segments = []
-    lines = transcript.split("\n")
-
-    for line in lines:
-        line = line.strip()
-        if not line:
-            continue
-
-        # Try to match format with speaker: [Speaker] [HH:MM:SS - HH:MM:SS] text
-        speaker_match = re.match(r"^\[([^\]]+)\]\s*\[(\d{2}):(\d{2}):(\d{2})\s*-\s*(\d{2}):(\d{2}):(\d{2})\]\s*(.+)$", line)
-        if speaker_match:
-            speaker, start_h, start_m, start_s, end_h, end_m, end_s, text = speaker_match.groups()
-            segments.append(
-                {
-                    "speaker": speaker,
-                    "start": int(start_h) * 3600 + int(start_m) * 60 + int(start_s),
-                    "end": int(end_h) * 3600 + int(end_m) * 60 + int(end_s),
-                    "text": text.strip(),
-                }
-            )
-            continue
-
-        # Try to match format without speaker: [HH:MM:SS - HH:MM:SS] text
-        no_speaker_match = re.match(r"^\[(\d{2}):(\d{2}):(\d{2})\s*-\s*(\d{2}):(\d{2}):(\d{2})\]\s*(.+)$", line)
-        if no_speaker_match:
-            start_h, start_m, start_s, end_h, end_m, end_s, text = no_speaker_match.groups()
-            segments.append(
-                {
-                    "start": int(start_h) * 3600 + int(start_m) * 60 + int(start_s),
-                    "end": int(end_h) * 3600 + int(end_m) * 60 + int(end_s),
-                    "text": text.strip(),
-                }
-            )
+    segments: list[dict[str, Any]] = []
+
+    for match in _SEGMENT_PATTERN.finditer(transcript):
+        speaker = match["speaker"]
+        start_h, start_m, start_s, end_h, end_m, end_s = map(int, match.group("sh", "sm", "ss", "eh", "em", "es"))
+        segment: dict[str, Any] = {"speaker": speaker} if speaker is not None else {}
+        segment["start"] = start_h * 3600 + start_m * 60 + start_s
+        segment["end"] = end_h * 3600 + end_m * 60 + end_s
+        segment["text"] = match["text"]
+        segments.append(segment)
 
     return segments
 
 
-def _format_as_txt(segments: list[dict[str, Any]]) -> str:
-    """Format segments as plain text."""
-    lines = []
-    for seg in segments:
+def _iter_txt(segments: list[dict[str, Any]]) -> Iterator[str]:
+    """Yield segments as plain text, one line at a time."""
+    for i, seg in enumerate(segments):
+        separator = "\n" if i else ""
         speaker_prefix = f"[{seg['speaker']}] " if seg.get("speaker") else ""
-        lines.append(f"{speaker_prefix}{seg['text']}")
-    return "\n".join(lines)
+        yield f"{separator}{speaker_prefix}{seg['text']}"
 
 
-def _format_as_vtt(segments: list[dict[str, Any]]) -> str:
-    """Format segments as WebVTT."""
-    lines = ["WEBVTT", ""]
+def _iter_vtt(segments: list[dict[str, Any]]) -> Iterator[str]:
+    """Yield segments as WebVTT, one cue at a time."""
+    yield "WEBVTT\n"
 
     for i, seg in enumerate(segments, 1):
         start_time = _format_vtt_time(seg["start"])
         end_time = _format_vtt_time(seg["end"])
-        lines.append(str(i))
-        lines.append(f"{start_time} --> {end_time}")
-        if seg.get("speaker"):
-            lines.append(f"<v {seg['speaker']}>{seg['text']}")
-        else:
-            lines.append(seg["text"])
-        lines.append("")
-
-    return "\n".join(lines)
+        text = f"<v {seg['speaker']}>{seg['text']}" if seg.get("speaker") else seg["text"]
+        yield f"\n{i}\n{start_time} --> {end_time}\n{text}\n"
 
 
-def _format_as_srt(segments: list[dict[str, Any]]) -> str:
-    """Format segments as SRT."""
-    lines = []
-
+def _iter_srt(segments: list[dict[str, Any]]) -> Iterator[str]:
+    """Yield segments as SRT, one cue at a time."""
     for i, seg in enumerate(segments, 1):
+        separator = "\n" if i > 1 else ""
         start_time = _format_srt_time(seg["start"])
         end_time = _format_srt_time(seg["end"])
-        lines.append(str(i))
-        lines.append(f"{start_time} --> {end_time}")
         speaker_prefix = f"[{seg['speaker']}] " if seg.get("speaker") else ""
-        lines.append(f"{speaker_prefix}{seg['text']}")
-        lines.append("")
+        yield f"{separator}{i}\n{start_time} --> {end_time}\n{speaker_prefix}{seg['text']}\n"
+
 
-    return "\n".join(lines)
+# Lazily built "HH:MM:SS" strings for every second of a day, indexed by seconds
+_HMS_TABLE: list[str] = []
+_SECONDS_PER_DAY = 24 * 3600
+
+
+def _format_hms(seconds: int) -> str:
+    """Format seconds as HH:MM:SS, using a lookup table for the first 24 hours."""
+    if 0 <= seconds < _SECONDS_PER_DAY:
+        if not _HMS_TABLE:
+            _HMS_TABLE.extend(f"{h:02d}:{m:02d}:{s:02d}" for h in range(24) for m in range(60) for s in range(60))
+        return _HMS_TABLE[seconds]
+    minutes, secs = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d}"
 
 
 def _format_vtt_time(seconds: int) -> str:
     """Format seconds as VTT timestamp (HH:MM:SS.mmm)."""
-    hours = seconds // 3600
-    minutes = (seconds % 3600) // 60
-    secs = seconds % 60
-    return f"{hours:02d}:{minutes:02d}:{secs:02d}.000"
+    return _format_hms(seconds) + ".000"
 
 
 def _format_srt_time(seconds: int) -> str:
     """Format seconds as SRT timestamp (HH:MM:SS,mmm)."""
-    hours = seconds // 3600
-    minutes = (seconds % 3600) // 60
-    secs = seconds % 60
-    return f"{hours:02d}:{minutes:02d}:{secs:02d},000"
+    return _format_hms(seconds) + ",000"
 
 
 @router.get("/jobs/{job_id}/download")
 async def download_transcript(
     job_id: str,
     format: str = Query("txt", pattern="^(txt|vtt|srt)$"),  # noqa: A002
-) -> PlainTextResponse:
+) -> StreamingResponse:
     """Download transcript in specified format.
 
     Args:
@@ -596,38 +930,42 @@ async def download_transcript(
     Returns:
         Formatted transcript file
     """
-    if job_id not in jobs:
+    job = jobs.get(job_id)
+    if job is None:
         raise HTTPException(status_code=404, detail="Job not found")
 
-    job = jobs[job_id]
-
-    if job["status"] != "completed":
-        raise HTTPException(status_code=400, detail=f"Job not completed. Status: {job['status']}")
+    if job.status != "completed":
+        raise HTTPException(status_code=400, detail=f"Job not completed. Status: {job.status}")
 
-    result = job.get("result", "")
+    result = job.result
     if not result:
         raise HTTPException(status_code=404, detail="No transcript available")
 
-    # Parse transcript into segments
-    segments = _parse_transcript_segments(result)
+    # Parse transcript into segments once per result; repeat downloads reuse them
+    cached = job.parsed_segments
+    if cached is not None and cached[0] is result:
+        segments = cached[1]
+    else:
+        segments = _parse_transcript_segments(result)
+        job.parsed_segments = (result, segments)
 
     if not segments:
         raise HTTPException(status_code=404, detail="No segments found in transcript")
 
-    # Format based on requested type
+    # Format based on requested type, streaming one cue at a time
     if format == "txt":
-        content = _format_as_txt(segments)
+        chunks = _iter_txt(segments)
         media_type = "text/plain"
     elif format == "vtt":
-        content = _format_as_vtt(segments)
+        chunks = _iter_vtt(segments)
         media_type = "text/vtt"
     else:  # srt
-        content = _format_as_srt(segments)
+        chunks = _iter_srt(segments)
         media_type = "application/x-subrip"
 
     filename = f"transcript.{format}"
-    return PlainTextResponse(
-        content=content,
+    return StreamingResponse(
+        (chunk.encode() for chunk in chunks),
         media_type=media_type,
         headers={"Content-Disposition": f'attachment; filename="{filename}"'},
     )
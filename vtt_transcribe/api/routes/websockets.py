@@ -4,55 +4,76 @@ import asyncio
 from typing import Any
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+from pydantic_core import to_json
 
-from vtt_transcribe.api.routes.transcription import jobs
+from vtt_transcribe.api.routes.transcription import FINISHED_JOB_STATUSES, Job, jobs
 from vtt_transcribe.logging_config import get_logger
 
 router = APIRouter(tags=["websockets"])
 logger = get_logger(__name__)
 
 
-def _build_status_message(job_id: str, current_job: dict[str, Any]) -> dict[str, Any]:
+async def _send_json(websocket: WebSocket, message: dict[str, Any]) -> None:
+    """Send a message as a JSON text frame.
+
+    Encodes with pydantic-core, which is several times faster than the stdlib
+    json module used by WebSocket.send_json on completed jobs' full transcripts.
+    """
+    await websocket.send_text(to_json(message).decode())
+
+
+def _build_status_message(job_id: str, current_job: Job) -> dict[str, Any]:
     """Build status update message from job data."""
-    current_status = current_job.get("status")
+    current_status = current_job.status
     message: dict[str, Any] = {
         "job_id": job_id,
         "status": current_status,
-        "filename": current_job.get("filename"),
+        "filename": current_job.filename,
     }
 
     # Include optional fields if available
-    if "detected_language" in current_job:
-        message["detected_language"] = current_job["detected_language"]
-    if "translated_to" in current_job:
-        message["translated_to"] = current_job["translated_to"]
+    if current_job.detected_language is not None:
+        message["detected_language"] = current_job.detected_language
+    if current_job.translated_to is not None:
+        message["translated_to"] = current_job.translated_to
 
     # Include result/error based on status
     if current_status == "completed":
-        message["result"] = current_job.get("result")
+        message["result"] = current_job.result
     elif current_status == "failed":
-        message["error"] = current_job.get("error")
+        message["error"] = current_job.error
 
     return message
 
 
-async def _wait_for_progress_or_timeout(
-    progress_queue: asyncio.Queue[dict[str, Any]], timeout: float = 0.5
+async def _wait_for_progress_or_status_change(
+    progress_queue: asyncio.Queue[dict[str, Any]], status_changed: asyncio.Event
 ) -> dict[str, Any] | None:
-    """Wait for a progress update from queue with timeout.
+    """Wait for the next progress update, returning early if the job's status changes.
 
     Args:
         progress_queue: Queue to wait on
-        timeout: Timeout in seconds
+        status_changed: Job event that is set when its status changes or it is removed
 
     Returns:
-        Progress update dict or None if timeout
+        Progress update dict, or None if the status changed first
     """
-    try:
-        return await asyncio.wait_for(progress_queue.get(), timeout=timeout)
-    except asyncio.TimeoutError:
+    if status_changed.is_set():
         return None
 
+    get_task = asyncio.ensure_future(progress_queue.get())
+    changed_task = asyncio.ensure_future(status_changed.wait())
+    try:
+        await asyncio.wait({get_task, changed_task}, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        changed_task.cancel()
+        if not get_task.done():
+            get_task.cancel()
+
+    if get_task.done() and not get_task.cancelled():
+        return get_task.result()
+    return None
+
 
 async def _drain_progress_queue(websocket: WebSocket, job_id: str, progress_queue: asyncio.Queue[dict[str, Any]]) -> None:
     """Drain all pending progress updates from the queue and send to WebSocket.
@@ -62,53 +83,49 @@ async def _drain_progress_queue(websocket: WebSocket, job_id: str, progress_queu
         job_id: Job identifier to add to progress messages
         progress_queue: Queue containing progress updates
     """
-    while not progress_queue.empty():
+    while True:
         try:
             progress_update = progress_queue.get_nowait()
-            # Add job_id to progress message
-            progress_update["job_id"] = job_id
-            await websocket.send_json(progress_update)
         except asyncio.QueueEmpty:
             break
+        # Add job_id to progress message
+        progress_update["job_id"] = job_id
+        await _send_json(websocket, progress_update)
 
 
 async def _handle_status_change(
     websocket: WebSocket,
     job_id: str,
-    current_job: dict[str, Any],
+    current_job: Job,
     current_status: str | None,
 ) -> bool:
     """Handle status change and send update. Returns True if should terminate connection."""
     message = _build_status_message(job_id, current_job)
-    await websocket.send_json(message)
+    await _send_json(websocket, message)
 
     # Drain any final progress events before closing
-    if current_status in ["completed", "failed"]:
+    if current_status in FINISHED_JOB_STATUSES:
         # Give a moment for final progress events to be queued
         await asyncio.sleep(0.1)
         # Drain any remaining progress events
-        if "progress_updates" in current_job:
-            await _drain_progress_queue(websocket, job_id, current_job["progress_updates"])
+        await _drain_progress_queue(websocket, job_id, current_job.progress_updates)
         await websocket.close()
         return True
     return False
 
 
-async def _process_progress_updates(websocket: WebSocket, job_id: str, current_job: dict[str, Any]) -> None:
+async def _process_progress_updates(
+    websocket: WebSocket, job_id: str, current_job: Job, status_changed: asyncio.Event
+) -> None:
     """Process and stream progress updates from job queue."""
-    if "progress_updates" not in current_job:
-        # No progress queue, sleep briefly to avoid busy loop
-        await asyncio.sleep(0.1)
-        return
-
     # Drain immediately available progress updates
-    await _drain_progress_queue(websocket, job_id, current_job["progress_updates"])
+    await _drain_progress_queue(websocket, job_id, current_job.progress_updates)
 
-    # Wait for next progress update or timeout
-    progress_update = await _wait_for_progress_or_timeout(current_job["progress_updates"], timeout=0.5)
+    # Wait for the next progress update or status change
+    progress_update = await _wait_for_progress_or_status_change(current_job.progress_updates, status_changed)
     if progress_update:
         progress_update["job_id"] = job_id
-        await websocket.send_json(progress_update)
+        await _send_json(websocket, progress_update)
 
 
 @router.websocket("/ws/jobs/{job_id}")
@@ -130,25 +147,28 @@ async def websocket_job_updates(websocket: WebSocket, job_id: str) -> None:
         extra={"job_id": job_id},
     )
 
-    if job_id not in jobs:
+    current_job = jobs.get(job_id)
+    if current_job is None:
         logger.warning(
             "WebSocket connection for unknown job",
             extra={"job_id": job_id},
         )
-        await websocket.send_json({"error": "Job not found", "job_id": job_id})
+        await _send_json(websocket, {"error": "Job not found", "job_id": job_id})
         await websocket.close(code=1008)
         return
 
+    # Jobs are updated in place, so the same record is watched for the whole connection
     try:
         last_status = None
 
         while True:
-            if job_id not in jobs:
-                await websocket.send_json({"error": "Job deleted"})
+            if jobs.get(job_id) is not current_job:
+                await _send_json(websocket, {"error": "Job deleted"})
                 break
 
-            current_job = jobs[job_id]
-            current_status = current_job.get("status")
+            # Take the event before reading the status so a change in between still wakes us
+            status_changed = current_job.status_changed
+            current_status = current_job.status
 
             # Send status update if changed
             if current_status != last_status:
@@ -157,8 +177,8 @@ async def websocket_job_updates(websocket: WebSocket, job_id: str) -> None:
                 if should_terminate:
                     break
 
-            # Process progress updates
-            await _process_progress_updates(websocket, job_id, current_job)
+            # Process progress updates until the status changes
+            await _process_progress_updates(websocket, job_id, current_job, status_changed)
 
     except WebSocketDisconnect:
         logger.info(
@@ -170,5 +190,5 @@ async def websocket_job_updates(websocket: WebSocket, job_id: str) -> None:
             "WebSocket error",
             extra={"job_id": job_id, "error": str(e)},
         )
-        await websocket.send_json({"error": str(e)})
+        await _send_json(websocket, {"error": str(e)})
         await websocket.close(code=1011)
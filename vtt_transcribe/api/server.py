@@ -1,15 +1,24 @@
 """Development server entry point for FastAPI application."""
 
+import os
+
 import uvicorn
 
 
 def main() -> None:
-    """Run the FastAPI application with uvicorn."""
+    """Run the FastAPI application with uvicorn.
+
+    Auto-reload is only enabled in development, since the reloader runs the app
+    in a watched subprocess. uvicorn already picks uvloop and httptools when the
+    ``uvicorn[standard]`` extras are installed. A single worker is used because
+    jobs are tracked in process memory.
+    """
+    environment = os.getenv("ENVIRONMENT", "development").lower()
     uvicorn.run(
         "vtt_transcribe.api.app:app",
         host="0.0.0.0",  # noqa: S104
         port=8000,
-        reload=True,
+        reload=environment == "development",
     )
 
 
@@ -47,12 +47,12 @@ class AudioChunker:
         Returns:
             List of (start_time, end_time) tuples in seconds.
         """
-        chunks = []
-        start = 0.0
+        if duration_seconds <= 0:
+            return []
 
-        while start < duration_seconds:
-            end = min(start + chunk_duration, duration_seconds)
-            chunks.append((start, end))
-            start = end
-
-        return chunks
+        num_chunks = math.ceil(duration_seconds / chunk_duration)
+        # Only the last chunk can be shorter than chunk_duration
+        last_start = (num_chunks - 1) * chunk_duration
+        ranges = [(i * chunk_duration, (i + 1) * chunk_duration) for i in range(num_chunks - 1)]
+        ranges.append((last_start, duration_seconds))
+        return ranges
@@ -1,20 +1,33 @@
 """Audio file management utilities for video transcription."""
 
+import os
+import subprocess
 import time
 from pathlib import Path
 
-from moviepy.audio.io.AudioFileClip import AudioFileClip
-from moviepy.video.io.VideoFileClip import VideoFileClip
-
 from vtt_transcribe.logging_config import get_logger
 
 # Constants
 AUDIO_EXTENSION = ".mp3"
 AUDIO_CODEC = "libmp3lame"
+# ffmpeg error when the stream map selects nothing, i.e. the input has no audio track
+NO_AUDIO_STREAM_ERROR = "matches no streams"
 
 logger = get_logger(__name__)
 
 
+def _run_ffmpeg(args: list[str]) -> subprocess.CompletedProcess[str]:
+    """Run ffmpeg non-interactively with the given arguments, capturing its output."""
+    cmd = ["ffmpeg", "-nostdin", "-hide_banner", "-loglevel", "error", *args]
+    return subprocess.run(cmd, capture_output=True, text=True, check=False)  # noqa: S603
+
+
+def _run_ffprobe(args: list[str]) -> subprocess.CompletedProcess[str]:
+    """Run ffprobe quietly with the given arguments, capturing its output."""
+    cmd = ["ffprobe", "-v", "error", *args]
+    return subprocess.run(cmd, capture_output=True, text=True, check=False)  # noqa: S603
+
+
 class AudioFileManager:
     """Manage audio file operations including extraction and cleanup."""
 
@@ -26,6 +39,9 @@ class AudioFileManager:
             video_path: Path to input video file.
             audio_path: Path where audio file will be saved.
             force: If True, overwrite existing audio file.
+
+        Raises:
+            RuntimeError: If ffmpeg fails for any reason other than a missing audio track.
         """
         logger.info(
             "Starting audio extraction", extra={"video_path": str(video_path), "audio_path": str(audio_path), "force": force}
@@ -36,15 +52,20 @@ class AudioFileManager:
             print(f"Audio file already exists: {audio_path}")
             return
 
+        print(f"Extracting audio from {video_path} to {audio_path}...")
         start_time = time.time()
-        with VideoFileClip(str(video_path)) as video_clip:
-            if video_clip.audio is None:
+        # Map only the first audio track so ffmpeg never decodes the video stream
+        result = _run_ffmpeg(
+            ["-y", "-i", str(video_path), "-map", "0:a:0", "-acodec", AUDIO_CODEC, "-threads", "0", str(audio_path)]
+        )
+        if result.returncode != 0:
+            if NO_AUDIO_STREAM_ERROR in result.stderr:
                 logger.warning("No audio track found in video", extra={"video_path": str(video_path)})
                 print(f"Warning: No audio track found in {video_path}")
                 return
-
-            print(f"Extracting audio from {video_path} to {audio_path}...")
-            video_clip.audio.write_audiofile(str(audio_path), codec=AUDIO_CODEC, logger=None)
+            logger.error("Audio extraction failed", extra={"error": result.stderr})
+            msg = f"Failed to extract audio from {video_path}: {result.stderr.strip()}"
+            raise RuntimeError(msg)
 
         duration = time.time() - start_time
         audio_size = audio_path.stat().st_size if audio_path.exists() else 0
@@ -66,10 +87,23 @@ class AudioFileManager:
 
         Returns:
             Duration in seconds.
+
+        Raises:
+            RuntimeError: If ffprobe fails or reports no duration.
         """
         logger.debug("Getting audio duration", extra={"audio_path": str(audio_path)})
-        with AudioFileClip(str(audio_path)) as audio_clip:
-            duration = float(audio_clip.duration)
+        # Read the duration from container metadata rather than opening the audio stream
+        result = _run_ffprobe(
+            ["-show_entries", "format=duration", "-of", "default=noprint_wrappers=1:nokey=1", str(audio_path)]
+        )
+        if result.returncode != 0:
+            msg = f"Failed to read duration of {audio_path}: {result.stderr.strip()}"
+            raise RuntimeError(msg)
+        try:
+            duration = float(result.stdout.strip())
+        except ValueError as e:
+            msg = f"Failed to read duration of {audio_path}: ffprobe reported {result.stdout.strip()!r}"
+            raise RuntimeError(msg) from e
         logger.debug("Audio duration retrieved", extra={"duration_seconds": duration})
         return duration
 
@@ -85,6 +119,9 @@ class AudioFileManager:
 
         Returns:
             Path to the extracted chunk file.
+
+        Raises:
+            RuntimeError: If ffmpeg fails to write the chunk.
         """
         chunk_path = audio_path.parent / f"{audio_path.stem}_chunk{chunk_index}{AUDIO_EXTENSION}"
         logger.debug(
@@ -98,9 +135,28 @@ class AudioFileManager:
         )
 
         extract_start = time.time()
-        with AudioFileClip(str(audio_path)) as audio_clip:
-            chunk = audio_clip.subclipped(start_time, end_time)
-            chunk.write_audiofile(str(chunk_path), codec=AUDIO_CODEC, logger=None)
+        # Chunks are always MP3, so MP3 sources are sliced without re-encoding
+        codec = "copy" if audio_path.suffix.lower() == AUDIO_EXTENSION else AUDIO_CODEC
+        result = _run_ffmpeg(
+            [
+                "-y",
+                "-ss",
+                str(start_time),
+                "-i",
+                str(audio_path),
+                "-t",
+                str(end_time - start_time),
+                "-map",
+                "0:a:0",
+                "-acodec",
+                codec,
+                str(chunk_path),
+            ]
+        )
+        if result.returncode != 0:
+            logger.error("Audio chunk extraction failed", extra={"chunk_index": chunk_index, "error": result.stderr})
+            msg = f"Failed to extract chunk {chunk_index} from {audio_path}: {result.stderr.strip()}"
+            raise RuntimeError(msg)
 
         extract_duration = time.time() - extract_start
         chunk_size = chunk_path.stat().st_size if chunk_path.exists() else 0
@@ -126,21 +182,32 @@ class AudioFileManager:
         Returns:
             List of chunk file paths, sorted by chunk index.
         """
-        if not audio_path.parent.exists():
+        prefix = f"{audio_path.stem}_chunk"
+        chunks: list[tuple[int, Path]] = []
+        try:
+            with os.scandir(audio_path.parent) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if not (name.startswith(prefix) and name.endswith(AUDIO_EXTENSION)):
+                        continue
+                    index = name[len(prefix) : -len(AUDIO_EXTENSION)]
+                    if index.isdecimal():
+                        chunks.append((int(index), audio_path.parent / name))
+        except FileNotFoundError:
             return []
 
-        pattern = f"{audio_path.stem}_chunk*{AUDIO_EXTENSION}"
-        return sorted(
-            audio_path.parent.glob(pattern),
-            key=lambda p: int(p.stem.split("_chunk")[1]),
-        )
+        chunks.sort()
+        return [chunk for _, chunk in chunks]
 
     @staticmethod
-    def cleanup_files(audio_path: Path) -> None:
+    def cleanup_files(audio_path: Path) -> list[Path]:
         """Delete audio file and all its chunks.
 
         Args:
             audio_path: Path to main audio file.
+
+        Returns:
+            The chunk files that were deleted.
         """
         chunks = AudioFileManager.find_chunks(audio_path)
         logger.info("Starting audio cleanup", extra={"audio_path": str(audio_path), "chunk_count": len(chunks)})
@@ -151,17 +218,21 @@ class AudioFileManager:
             logger.debug("Deleted main audio file", extra={"path": str(audio_path)})
 
         # Delete all chunks
-        for chunk in AudioFileManager.find_chunks(audio_path):
-            if chunk.exists():
-                chunk.unlink()
+        for chunk in chunks:
+            chunk.unlink(missing_ok=True)
+        return chunks
 
     @staticmethod
-    def cleanup_chunks_only(audio_path: Path) -> None:
+    def cleanup_chunks_only(audio_path: Path) -> list[Path]:
         """Delete only chunk files, keeping main audio file.
 
         Args:
             audio_path: Path to main audio file.
+
+        Returns:
+            The chunk files that were deleted.
         """
-        for chunk in AudioFileManager.find_chunks(audio_path):
-            if chunk.exists():
-                chunk.unlink()
+        chunks = AudioFileManager.find_chunks(audio_path)
+        for chunk in chunks:
+            chunk.unlink(missing_ok=True)
+        return chunks
@@ -5,6 +5,18 @@ import argparse
 from vtt_transcribe import __version__
 
 
+def _positive_int(value: str) -> int:
+    """Parse a command-line value as an integer greater than zero."""
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        msg = f"must be a positive integer, got {value!r}"
+        raise argparse.ArgumentTypeError(msg)
+    return number
+
+
 def create_parser() -> argparse.ArgumentParser:
     """Create and configure the argument parser."""
     parser = argparse.ArgumentParser(
@@ -141,6 +153,15 @@ Environment Variables:
             " Set DISABLE_GPU=1 to force CPU."
         ),
     )
+    diarize_group.add_argument(
+        "--diarization-batch-size",
+        type=_positive_int,
+        metavar="N",
+        help=(
+            "Batch size for diarization segmentation and embedding (default: pyannote's)."
+            " Lower it if the GPU runs out of memory."
+        ),
+    )
     diarize_group.add_argument(
         "--diarize-only",
         action="store_true",
@@ -6,25 +6,33 @@ Timestamp Format:
     compatibility with the legacy MM:SS format for parsing existing transcripts.
 """
 
+import gc
 import os
 import re
-import sys
 import time
 import warnings
 from pathlib import Path
+from typing import Any
 
 import torch
-from pyannote.audio import Pipeline
+from pyannote.audio import Audio, Pipeline
 
 from vtt_transcribe.logging_config import get_logger
+from vtt_transcribe.speaker_labels import (  # noqa: F401 - re-exported for existing callers
+    format_diarization_output,
+    get_speaker_context_lines,
+    get_unique_speakers,
+)
 
 logger = get_logger(__name__)
 
 
 # Constants
 DEFAULT_DIARIZATION_MODEL = "pyannote/speaker-diarization-3.1"
-# Default sample rate used by pyannote.audio v3.x
-PYANNOTE_DEFAULT_SAMPLE_RATE = 44100
+# The pipeline's segmentation and embedding models run on 16 kHz mono audio
+PIPELINE_SAMPLE_RATE = 16000
+# Shortest audio the pyannote.audio model can diarize
+MIN_DIARIZATION_SECONDS = 10
 
 
 def resolve_device(device: str) -> str:
@@ -55,12 +63,13 @@ def resolve_device(device: str) -> str:
 class SpeakerDiarizer:
     """Speaker diarization using pyannote.audio."""
 
-    def __init__(self, hf_token: str | None = None, device: str = "auto") -> None:
+    def __init__(self, hf_token: str | None = None, device: str = "auto", batch_size: int | None = None) -> None:
         """Initialize diarizer with Hugging Face token.
 
         Args:
             hf_token: Hugging Face token for model access. If None, uses HF_TOKEN env var.
             device: Device to use ("auto", "cuda", or "cpu"). Default is "auto".
+            batch_size: Segmentation and embedding batch size. If None, uses the pipeline default.
 
         Raises:
             ValueError: If no token is provided and HF_TOKEN env var is not set.
@@ -70,7 +79,21 @@ class SpeakerDiarizer:
             msg = "Hugging Face token not provided. Use --hf-token or set HF_TOKEN environment variable."
             raise ValueError(msg)
         self.device = device
+        self.batch_size = batch_size
         self.pipeline: Pipeline | None = None
+        # Device the loaded pipeline actually runs on, after any fallback to CPU
+        self._pipeline_device: torch.device = torch.device("cpu")
+
+    @property
+    def uses_cuda(self) -> bool:
+        """Whether diarization runs on CUDA.
+
+        Once the pipeline is loaded this reflects where it actually ended up, including a
+        fallback to CPU; before that it is the device the pipeline will be moved to.
+        """
+        if self.pipeline is not None:
+            return bool(self._pipeline_device.type == "cuda")
+        return resolve_device(self.device) == "cuda"
 
     def _load_pipeline(self) -> Pipeline:
         """Lazy load the diarization pipeline and move to device."""
@@ -88,6 +111,10 @@ class SpeakerDiarizer:
                 DEFAULT_DIARIZATION_MODEL,
                 token=self.hf_token,
             )
+            # Smaller batches avoid running out of memory, and thrashing, on mid-range GPUs
+            if self.batch_size is not None:
+                self.pipeline.segmentation_batch_size = self.batch_size
+                self.pipeline.embedding_batch_size = self.batch_size
             # Resolve and set device
             resolved_device = resolve_device(self.device)
             device = torch.device(resolved_device)
@@ -95,9 +122,11 @@ class SpeakerDiarizer:
             logger.info("Loading diarization pipeline on device: %s", resolved_device)
 
             # Move pipeline to device using its .to() method
+            self._pipeline_device = torch.device("cpu")
             try:
                 assert self.pipeline is not None
                 self.pipeline.to(device)
+                self._pipeline_device = device
                 logger.info("Successfully moved diarization pipeline to %s", resolved_device)
 
                 # Verify device placement by checking if GPU memory was allocated
@@ -115,6 +144,19 @@ class SpeakerDiarizer:
         assert self.pipeline is not None
         return self.pipeline
 
+    def release_pipeline(self) -> None:
+        """Drop the loaded pipeline and return its cached GPU memory to the driver.
+
+        The pipeline is loaded again on the next diarize_audio() call.
+        """
+        if self.pipeline is None:
+            return
+        self.pipeline = None
+        # Model tensors can sit in reference cycles, so collect before emptying the CUDA cache
+        gc.collect()
+        if torch.cuda.is_available():
+            torch.cuda.empty_cache()
+
     def diarize_audio(self, audio_path: Path) -> list[tuple[float, float, str]]:
         """Run speaker diarization on an audio file.
 
@@ -131,8 +173,8 @@ class SpeakerDiarizer:
             The pyannote.audio model requires audio files to be at least 10 seconds long.
             For shorter audio files, consider padding with silence or using a different model.
 
-            If MP3 encoding causes sample mismatch errors, the audio will be automatically
-            converted to WAV format for more reliable processing.
+            The file is decoded once into an in-memory 16 kHz mono waveform before the
+            pipeline runs, so compressed formats such as MP3 need no conversion to WAV.
         """
         start_time = time.time()
 
@@ -151,7 +193,7 @@ class SpeakerDiarizer:
             },
         )
 
-        result = self._diarize_with_fallback(audio_path)
+        result = self._diarize_audio_internal(audio_path)
 
         duration = time.time() - start_time
         logger.info(
@@ -165,71 +207,17 @@ class SpeakerDiarizer:
 
         return result
 
-    def _diarize_with_fallback(self, audio_path: Path) -> list[tuple[float, float, str]]:
-        """Try diarization, falling back to WAV conversion if MP3 has sample mismatch."""
-        try:
-            return self._diarize_audio_internal(audio_path)
-        except ValueError as e:
-            error_str = str(e)
-            # Check if it's an MP3 sample mismatch that we can fix
-            if "MP3 encoding imprecision" in error_str:
-                print(
-                    "\nMP3 encoding issue detected. Converting to WAV for more reliable processing...",
-                    file=sys.stderr,
-                )
-                # Convert to WAV and retry
-                wav_path = audio_path.with_suffix(".wav")
-                try:
-                    self._convert_to_wav(audio_path, wav_path)
-                    result = self._diarize_audio_internal(wav_path)
-                    # Clean up WAV file
-                    wav_path.unlink()
-                    return result
-                except Exception as wav_error:
-                    # Clean up WAV file if it exists
-                    if wav_path.exists():
-                        wav_path.unlink()
-                    raise wav_error from e
-            # Not a fixable MP3 issue, re-raise
-            raise
-
-    def _convert_to_wav(self, input_path: Path, output_path: Path) -> None:
-        """Convert audio file to WAV format using ffmpeg."""
-        import subprocess
-
-        logger.info(
-            "Converting audio to WAV format",
-            extra={
-                "input_path": str(input_path),
-                "output_path": str(output_path),
-            },
-        )
-
-        cmd = [
-            "ffmpeg",
-            "-loglevel",
-            "error",
-            "-i",
-            str(input_path),
-            "-acodec",
-            "pcm_s16le",
-            "-ar",
-            "16000",
-            "-ac",
-            "1",
-            "-y",  # Overwrite output file
-            str(output_path),
-        ]
-        result = subprocess.run(cmd, capture_output=True, text=True, check=False)  # noqa: S603
-        if result.returncode != 0:
-            logger.error(
-                "WAV conversion failed",
-                extra={"error": result.stderr},
-            )
-            msg = f"Failed to convert to WAV: {result.stderr}"
-            raise RuntimeError(msg)
+    def _load_waveform(self, audio_path: Path) -> dict[str, Any]:
+        """Decode an audio file once into the in-memory input pyannote pipelines accept.
 
-        logger.info("WAV conversion successful")
+        Given a path, pyannote re-opens and decodes the file for every window it crops.
+        The waveform is placed on the pipeline's device so windows are not copied to the
+        GPU one batch at a time.
+        """
+        waveform, sample_rate = Audio(sample_rate=PIPELINE_SAMPLE_RATE, mono="downmix")(str(audio_path))
+        if self._pipeline_device.type == "cuda":
+            waveform = waveform.to(self._pipeline_device)
+        return {"waveform": waveform, "sample_rate": sample_rate}
 
     def _diarize_audio_internal(self, audio_path: Path) -> list[tuple[float, float, str]]:
         """Internal diarization implementation."""
@@ -238,43 +226,15 @@ class SpeakerDiarizer:
         # Suppress the torch pooling warning about degrees of freedom
         with warnings.catch_warnings():
             warnings.filterwarnings("ignore", message=".*degrees of freedom.*", category=UserWarning)
-            try:
-                diarization = pipeline(str(audio_path))
-            except ValueError as e:
-                error_str = str(e)
-                # Check if it's a sample mismatch error from pyannote
-                if "requested chunk" in error_str and "samples" in error_str and "instead of the expected" in error_str:
-                    # This is a pyannote error - could be file corruption, metadata issues, or truly too short
-                    # Extract sample counts to provide better error message
-                    match = re.search(r"resulted in (\d+) samples instead of the expected (\d+) samples", error_str)
-                    if match:
-                        actual_samples = int(match.group(1))
-                        expected_samples = int(match.group(2))
-                        actual_duration = actual_samples / PYANNOTE_DEFAULT_SAMPLE_RATE
-                        expected_duration = expected_samples / PYANNOTE_DEFAULT_SAMPLE_RATE
-
-                        # If actual duration < 9.5 seconds, it's genuinely too short
-                        # We allow some tolerance (0.5s) for MP3 encoding imprecision
-                        if actual_duration < 9.5:
-                            msg = (
-                                f"Audio file is too short for diarization ({actual_duration:.2f}s). "
-                                f"The pyannote.audio model requires at least 10 seconds of audio."
-                            )
-                            raise ValueError(msg) from e
-                        # File is long enough but has sample mismatch - likely metadata/encoding issue
-                        msg = (
-                            f"Audio file sample mismatch error. This usually indicates:\n"
-                            f"  - MP3 encoding imprecision (metadata doesn't match exact sample count)\n"
-                            f"  - File corruption or incomplete download\n"
-                            f"  - Unusual encoding that pyannote can't handle properly\n"
-                            f"Expected {expected_duration:.2f}s ({expected_samples} samples), "
-                            f"but got {actual_duration:.2f}s ({actual_samples} samples).\n\n"
-                            f"Try re-encoding to WAV format (more compatible but larger file):\n"
-                            f"  ffmpeg -i input.mp3 -acodec pcm_s16le -ar 16000 -ac 1 output.wav"
-                        )
-                        raise ValueError(msg) from e
-                # Other ValueError - just re-raise
-                raise
+            audio = self._load_waveform(audio_path)
+            duration = audio["waveform"].shape[-1] / audio["sample_rate"]
+            if duration < MIN_DIARIZATION_SECONDS:
+                msg = (
+                    f"Audio file is too short for diarization ({duration:.2f}s). "
+                    f"The pyannote.audio model requires at least {MIN_DIARIZATION_SECONDS} seconds of audio."
+                )
+                raise ValueError(msg)
+            diarization = pipeline(audio)
 
         segments = []
         for turn, _, speaker in diarization.speaker_diarization.itertracks(yield_label=True):
@@ -389,98 +349,3 @@ class SpeakerDiarizer:
             if start <= time <= end:
                 return speaker
         return None
-
-
-def format_diarization_output(segments: list[tuple[float, float, str]]) -> str:
-    """Format diarization segments into human-readable output.
-
-    Args:
-        segments: List of (start_time, end_time, speaker_label) tuples.
-
-    Returns:
-        Formatted string with [MM:SS - MM:SS] Speaker format.
-    """
-
-    def format_time(seconds: float) -> str:
-        total_seconds = int(seconds)
-        minutes = total_seconds // 60
-        secs = total_seconds % 60
-        return f"{minutes:02d}:{secs:02d}"
-
-    lines = []
-    for start, end, speaker in segments:
-        start_str = format_time(start)
-        end_str = format_time(end)
-        lines.append(f"[{start_str} - {end_str}] {speaker}")
-
-    return "\n".join(lines)
-
-
-def get_unique_speakers(segments: list[tuple[float, float, str]]) -> list[str]:
-    """Extract unique speaker labels from segments in order of first appearance.
-
-    Args:
-        segments: List of (start_time, end_time, speaker_label) tuples.
-
-    Returns:
-        List of unique speaker labels in order of first appearance.
-    """
-    seen = set()
-    speakers = []
-    for _, _, speaker in segments:
-        if speaker not in seen:
-            seen.add(speaker)
-            speakers.append(speaker)
-    return speakers
-
-
-def get_speaker_context_lines(
-    transcript: str,
-    speaker_label: str,
-    context_lines: int = 5,
-) -> list[str]:
-    """Extract context lines for a specific speaker's segments from transcript.
-
-    Args:
-        transcript: Transcript with [HH:MM:SS - HH:MM:SS] SPEAKER_XX: text format.
-                   Also accepts legacy [MM:SS - MM:SS] format for backward compatibility.
-        speaker_label: Speaker label to extract contexts for.
-        context_lines: Number of lines to show before and after each speaker segment group.
-
-    Returns:
-        List of context strings, one per continuous segment group for the speaker.
-    """
-    # Split transcript into lines
-    lines = transcript.split("\n")
-
-    # Build a mapping of line index to speaker label by parsing the line
-    line_to_speaker = {}
-    for i, line in enumerate(lines):
-        # Match pattern: [HH:MM:SS - HH:MM:SS] SPEAKER_XX: text
-        # The optional (?:\d{2}:)? group provides backward compatibility with legacy [MM:SS - MM:SS] format
-        match = re.match(r"\[(?:\d{2}:)?\d{2}:\d{2} - (?:\d{2}:)?\d{2}:\d{2}\]\s+(SPEAKER_\d+):?", line)
-        if match:
-            line_to_speaker[i] = match.group(1)
-
-    # Find groups of continuous segments for the speaker
-    speaker_groups = []
-    current_group = []
-    for i in range(len(lines)):
-        if line_to_speaker.get(i) == speaker_label:
-            current_group.append(i)
-        elif current_group:
-            # End of a group
-            speaker_groups.append(current_group)
-            current_group = []
-    if current_group:
-        speaker_groups.append(current_group)
-
-    # Extract context for each group
-    contexts = []
-    for group in speaker_groups:
-        start_idx = max(0, group[0] - context_lines)
-        end_idx = min(len(lines), group[-1] + context_lines + 1)
-        context = "\n".join(lines[start_idx:end_idx])
-        contexts.append(context)
-
-    return contexts
@@ -1,12 +1,19 @@
 """Handler functions for different transcription and diarization workflows."""
 
+import hashlib
+import json
+import os
 import re
 import sys
+import tempfile
+import threading
 import time
+from concurrent.futures import Future
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from vtt_transcribe.logging_config import get_logger
+from vtt_transcribe.speaker_labels import SPEAKER_LINE_PATTERN, get_first_speaker_contexts
 from vtt_transcribe.translator import AudioTranslator
 
 logger = get_logger(__name__)
@@ -17,6 +24,8 @@ if TYPE_CHECKING:
 
 AUDIO_EXTENSION = ".mp3"
 TRANSCRIPT_EXTENSION = ".txt"
+# Input extensions loaded as existing transcripts instead of being diarized
+TRANSCRIPT_INPUT_EXTENSIONS = frozenset({".txt", ".srt", ".vtt"})
 
 # Error message for missing diarization dependencies
 DIARIZATION_DEPS_ERROR_MSG = (
@@ -25,24 +34,37 @@ DIARIZATION_DEPS_ERROR_MSG = (
     "or: uv pip install vtt-transcribe[diarization]"
 )
 
+# Any standalone speaker label in the transcript, used to apply renames in one pass
+_SPEAKER_LABEL_PATTERN = re.compile(r"\bSPEAKER_\d+\b")
+
+# Set to cache diarization segments on disk, keyed by the SHA-256 of the audio file
+DIARIZATION_CACHE_ENV = "VTT_DIARIZATION_CACHE"
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+# Diarization exports, resolved by the first successful _lazy_import_diarization() call
+_diarization_exports: tuple | None = None
+
 
 def save_transcript(output_path: Path, transcript: str) -> None:
     """Save transcript to a file, ensuring .txt extension and trailing newline."""
     # Ensure output path has .txt extension
     if output_path.suffix.lower() != ".txt":
         output_path = output_path.with_suffix(TRANSCRIPT_EXTENSION)
-    if not transcript.endswith("\n"):
-        transcript += "\n"
+    needs_newline = not transcript.endswith("\n")
 
     logger.info(
         "Saving transcript to file",
         extra={
             "output_path": str(output_path),
-            "transcript_length": len(transcript),
+            "transcript_length": len(transcript) + needs_newline,
         },
     )
 
-    output_path.write_text(transcript)
+    # Write the trailing newline separately rather than copying the transcript to append it
+    with output_path.open("w", encoding="utf-8", newline="\n") as transcript_file:
+        transcript_file.write(transcript)
+        if needs_newline:
+            transcript_file.write("\n")
     print(f"\nTranscript saved to: {output_path}")
 
 
@@ -54,7 +76,20 @@ def display_result(transcript: str) -> None:
     print(transcript)
 
 
-def handle_diarize_only_mode(input_path: Path, hf_token: str | None, save_path: Path | None, device: str = "auto") -> str:
+def _get_cuda_torch() -> Any | None:
+    """Return the torch module if CUDA is available, otherwise None.
+
+    Only called after _lazy_import_diarization(), which has already loaded torch,
+    so the import here is a sys.modules lookup.
+    """
+    import torch
+
+    return torch if torch.cuda.is_available() else None
+
+
+def handle_diarize_only_mode(
+    input_path: Path, hf_token: str | None, save_path: Path | None, device: str = "auto", batch_size: int | None = None
+) -> str:
     """Handle --diarize-only mode: run diarization without transcription.
 
     Returns:
@@ -71,7 +106,7 @@ def handle_diarize_only_mode(input_path: Path, hf_token: str | None, save_path:
         },
     )
 
-    if not input_path.exists():
+    if not input_path.is_file():
         msg = f"Audio file not found: {input_path}"
         raise FileNotFoundError(msg)
 
@@ -79,23 +114,19 @@ def handle_diarize_only_mode(input_path: Path, hf_token: str | None, save_path:
     print(f"Running speaker diarization on: {input_path}")
     print(f"Using device: {device}")
 
-    # Show GPU info if using CUDA
-    gpu_memory_after: float | None = None
-    torch_module = None
-    if device in ("cuda", "auto"):
-        import torch
+    diarizer = SpeakerDiarizer(hf_token=hf_token, device=device, batch_size=batch_size)
 
-        torch_module = torch
-        if torch.cuda.is_available():
-            print(f"GPU: {torch.cuda.get_device_name(0)}")
-            print(f"GPU memory before: {torch.cuda.memory_allocated(0) / 1024**2:.2f} MB")
+    # Show GPU info if the diarizer will run on CUDA (honours DISABLE_GPU and "auto")
+    cuda_torch = _get_cuda_torch() if diarizer.uses_cuda else None
+    if cuda_torch is not None:
+        print(f"GPU: {cuda_torch.cuda.get_device_name(0)}")
+        print(f"GPU memory before: {cuda_torch.cuda.memory_allocated(0) / 1024**2:.2f} MB")
 
-    diarizer = SpeakerDiarizer(hf_token=hf_token, device=device)
-    segments = diarizer.diarize_audio(input_path)
+    segments = _cached_diarize(diarizer, input_path)
 
-    # Show GPU memory after if using CUDA
-    if device in ("cuda", "auto") and torch_module is not None and torch_module.cuda.is_available():
-        gpu_memory_after = torch_module.cuda.memory_allocated(0) / 1024**2
+    # Show GPU memory after if the pipeline actually ran on CUDA
+    if cuda_torch is not None and diarizer.uses_cuda:
+        gpu_memory_after = cuda_torch.cuda.memory_allocated(0) / 1024**2
         print(f"GPU memory after: {gpu_memory_after:.2f} MB")
 
     result = format_diarization_output(segments)
@@ -118,7 +149,12 @@ def handle_diarize_only_mode(input_path: Path, hf_token: str | None, save_path:
 
 
 def handle_apply_diarization_mode(
-    input_path: Path, transcript_path: Path, hf_token: str | None, save_path: Path | None, device: str = "auto"
+    input_path: Path,
+    transcript_path: Path,
+    hf_token: str | None,
+    save_path: Path | None,
+    device: str = "auto",
+    batch_size: int | None = None,
 ) -> str:
     """Handle --apply-diarization mode: apply diarization to existing transcript.
 
@@ -137,23 +173,23 @@ def handle_apply_diarization_mode(
         },
     )
 
-    if not transcript_path.exists():
+    if not transcript_path.is_file():
         msg = f"Transcript file not found: {transcript_path}"
         raise FileNotFoundError(msg)
 
-    if not input_path.exists():
+    if not input_path.is_file():
         msg = f"Audio file not found: {input_path}"
         raise FileNotFoundError(msg)
 
     # Load transcript
     logger.info("Loading transcript file", extra={"path": str(transcript_path)})
-    transcript = transcript_path.read_text()
+    transcript = transcript_path.read_text(encoding="utf-8")
 
     # Run diarization
     SpeakerDiarizer, _, _, _ = _lazy_import_diarization()  # noqa: N806
-    diarizer = SpeakerDiarizer(hf_token=hf_token, device=device)
+    diarizer = SpeakerDiarizer(hf_token=hf_token, device=device, batch_size=batch_size)
     print(f"Running speaker diarization on: {input_path}")
-    segments = diarizer.diarize_audio(input_path)
+    segments = _cached_diarize(diarizer, input_path)
 
     # Apply speakers to transcript
     print("Applying speaker labels to transcript...")
@@ -176,62 +212,119 @@ def handle_apply_diarization_mode(
     return result
 
 
-def _load_transcript_from_input(input_path: Path, hf_token: str | None, device: str) -> str:
+def _diarization_cache_dir() -> Path:
+    """Return the directory holding cached diarization segments."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "vtt-transcribe" / "diarization"
+
+
+def _cached_diarize(diarizer: "SpeakerDiarizer", audio_path: Path) -> list[tuple[float, float, str]]:
+    """Diarize audio, reusing segments cached on disk when VTT_DIARIZATION_CACHE is set.
+
+    Segments are keyed by the audio content, so re-running a workflow on the same file
+    (e.g. iterating on speaker review) skips the pipeline entirely. Cache read and write
+    failures fall back to running diarization.
+
+    Args:
+        diarizer: Diarizer used when the segments are not cached.
+        audio_path: Path to the audio file.
+
+    Returns:
+        List of (start_time, end_time, speaker_label) tuples in seconds.
+    """
+    if not os.environ.get(DIARIZATION_CACHE_ENV):
+        return diarizer.diarize_audio(audio_path)
+
+    digest = hashlib.sha256()
+    with audio_path.open("rb") as audio_file:
+        while chunk := audio_file.read(_HASH_CHUNK_SIZE):
+            digest.update(chunk)
+    cache_dir = _diarization_cache_dir()
+    cache_file = cache_dir / f"{digest.hexdigest()}.json"
+
+    try:
+        cached = json.loads(cache_file.read_text(encoding="utf-8"))
+        segments = [(float(start), float(end), str(speaker)) for start, end, speaker in cached]
+    except FileNotFoundError:
+        pass
+    except (OSError, TypeError, ValueError) as e:
+        logger.warning("Ignoring unreadable diarization cache entry", extra={"path": str(cache_file), "error": str(e)})
+    else:
+        logger.info("Using cached diarization segments", extra={"path": str(cache_file), "num_segments": len(segments)})
+        return segments
+
+    segments = diarizer.diarize_audio(audio_path)
+
+    # Write to a temporary file first so concurrent runs never read a partial entry
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=cache_dir, suffix=".tmp", delete=False) as tmp_file:
+            json.dump(segments, tmp_file)
+        os.replace(tmp_file.name, cache_file)
+    except OSError as e:
+        logger.warning("Could not write diarization cache entry", extra={"path": str(cache_file), "error": str(e)})
+
+    return segments
+
+
+def _load_transcript_from_input(input_path: Path, hf_token: str | None, device: str, batch_size: int | None) -> str:
     """Load or generate transcript from input path."""
-    is_transcript = input_path.suffix.lower() in [".txt", ".srt", ".vtt"]
+    is_transcript = input_path.suffix.lower() in TRANSCRIPT_INPUT_EXTENSIONS
 
     if is_transcript:
         print(f"Loading transcript from: {input_path}")
-        return input_path.read_text()
+        return input_path.read_text(encoding="utf-8")
 
     # Run diarization on audio file
     SpeakerDiarizer, format_diarization_output, _, _ = _lazy_import_diarization()  # noqa: N806
-    diarizer = SpeakerDiarizer(hf_token=hf_token, device=device)
+    diarizer = SpeakerDiarizer(hf_token=hf_token, device=device, batch_size=batch_size)
     print(f"Running speaker diarization on: {input_path}")
-    segments = diarizer.diarize_audio(input_path)
+    segments = _cached_diarize(diarizer, input_path)
     return format_diarization_output(segments)
 
 
-def _extract_speakers_from_transcript(transcript: str) -> list[str]:
-    """Extract unique speaker labels from transcript in order of appearance."""
-    speakers = []
-    seen = set()
-    for line in transcript.split("\n"):
-        # Match pattern: [HH:MM:SS - HH:MM:SS] or [MM:SS - MM:SS] SPEAKER_XX: text (with colon)
-        # or [HH:MM:SS - HH:MM:SS] / [MM:SS - MM:SS] SPEAKER_XX (without colon, from diarization-only output)
-        match = re.match(r"\[(?:\d{2}:)?\d{2}:\d{2} - (?:\d{2}:)?\d{2}:\d{2}\]\s+(SPEAKER_\d+):?", line)
-        if match:
-            speaker = match.group(1)
-            if speaker not in seen:
-                seen.add(speaker)
-                speakers.append(speaker)
-    return speakers
+def _extract_speakers_from_transcript(transcript: str) -> dict[str, int]:
+    """Count labeled lines per speaker, keyed in order of first appearance."""
+    speaker_counts: dict[str, int] = {}
+    # Every match contains the literal label prefix, so unlabeled transcripts skip the regex
+    if "SPEAKER_" not in transcript:
+        return speaker_counts
+    for match in SPEAKER_LINE_PATTERN.finditer(transcript):
+        speaker = match.group(1)
+        speaker_counts[speaker] = speaker_counts.get(speaker, 0) + 1
+    return speaker_counts
+
+
+def _rename_speakers(transcript: str, renames: dict[str, str]) -> str:
+    """Apply all speaker renames in a single pass over the transcript.
+
+    Whole labels are matched, so renaming SPEAKER_1 leaves SPEAKER_10 untouched.
+    """
+    if not renames:
+        return transcript
+    return _SPEAKER_LABEL_PATTERN.sub(lambda match: renames.get(match.group(0), match.group(0)), transcript)
 
 
-def _review_speaker_interactively(speaker: str, transcript: str, get_speaker_context_lines: Any) -> tuple[str, str | None]:
+def _review_speaker_interactively(speaker: str, speaker_count: int, context: str | None) -> str | None:
     """Review a single speaker and prompt for renaming.
 
     Returns:
-        Tuple of (updated_transcript, new_name_or_none)
+        The new name entered for the speaker, or None to keep the label
     """
-    contexts = get_speaker_context_lines(transcript, speaker, context_lines=5)
-
     print(f"\n{'=' * 50}")
     print(f"Speaker: {speaker}")
     print(f"{'=' * 50}")
-    speaker_count = transcript.count(speaker)
     print(f"Number of occurrences: {speaker_count}")
     print("\nContext (showing first occurrence):")
-    if contexts:
-        print(contexts[0])
+    if context:
+        print(context)
 
     new_name = input(f"\nEnter name for {speaker} (or press Enter to keep): ").strip()
     if new_name:
-        transcript = transcript.replace(speaker, new_name)
         print(f"Renamed {speaker} -> {new_name}")
-        return transcript, new_name
+        return new_name
 
-    return transcript, None
+    return None
 
 
 def handle_review_speakers(
@@ -240,6 +333,7 @@ def handle_review_speakers(
     save_path: Path | None = None,
     device: str = "auto",
     transcript: str | None = None,
+    batch_size: int | None = None,
 ) -> str:
     """Handle interactive speaker review and renaming for diarization workflows.
 
@@ -253,6 +347,7 @@ def handle_review_speakers(
         save_path: Optional path to save final transcript.
         device: Device to use for diarization (auto/cuda/cpu).
         transcript: Pre-computed transcript string. If provided, skips diarization step.
+        batch_size: Diarization batch size (None for the pipeline default).
 
     Returns:
         Final transcript with speaker labels applied.
@@ -268,27 +363,31 @@ def handle_review_speakers(
         },
     )
 
-    _, _, _get_unique_speakers, get_speaker_context_lines = _lazy_import_diarization()
-
     # Determine final transcript source
     if transcript is not None:
         final_transcript = transcript
     elif input_path is None:
         msg = "Either input_path or transcript must be provided"
         raise ValueError(msg)
-    elif not input_path.exists():
+    elif not input_path.is_file():
         msg = f"Input file not found: {input_path}"
         raise FileNotFoundError(msg)
     else:
-        final_transcript = _load_transcript_from_input(input_path, hf_token, device)
+        final_transcript = _load_transcript_from_input(input_path, hf_token, device, batch_size)
 
     # Extract and review speakers
     speakers = _extract_speakers_from_transcript(final_transcript)
     print(f"\nFound {len(speakers)} speakers: {', '.join(speakers)}")
     print("\nReviewing speakers...")
 
-    for speaker in speakers:
-        final_transcript, _ = _review_speaker_interactively(speaker, final_transcript, get_speaker_context_lines)
+    # Renames are collected and applied together so each speaker is shown the original labels
+    contexts = get_first_speaker_contexts(final_transcript, context_lines=5)
+    renames: dict[str, str] = {}
+    for speaker, speaker_count in speakers.items():
+        new_name = _review_speaker_interactively(speaker, speaker_count, contexts.get(speaker))
+        if new_name:
+            renames[speaker] = new_name
+    final_transcript = _rename_speakers(final_transcript, renames)
 
     display_result(final_transcript)
 
@@ -309,6 +408,10 @@ def handle_review_speakers(
 
 def _lazy_import_diarization() -> tuple:
     """Lazy import diarization module to avoid loading torch on --help."""
+    global _diarization_exports
+    if _diarization_exports is not None:
+        return _diarization_exports
+
     try:
         from vtt_transcribe.diarization import (
             SpeakerDiarizer,
@@ -357,7 +460,8 @@ def _lazy_import_diarization() -> tuple:
         else:  # pragma: no cover
             # Should never reach here, but re-raise just in case
             raise
-    return SpeakerDiarizer, format_diarization_output, get_unique_speakers, get_speaker_context_lines
+    _diarization_exports = (SpeakerDiarizer, format_diarization_output, get_unique_speakers, get_speaker_context_lines)
+    return _diarization_exports
 
 
 def _detect_or_override_language(args: Any, transcriber: Any, input_path: Path) -> tuple[str | None, str | None]:
@@ -368,7 +472,7 @@ def _detect_or_override_language(args: Any, transcriber: Any, input_path: Path)
         - detected_language: The detected language code (or None if manually specified)
         - language_to_use: The language to pass to transcription (or None to let Whisper detect)
     """
-    if hasattr(args, "language") and args.language:
+    if getattr(args, "language", None):
         # Manual override
         print(f"Using manually specified language: {args.language}", file=sys.stderr)
         return None, args.language
@@ -392,6 +496,92 @@ def _detect_or_override_language(args: Any, transcriber: Any, input_path: Path)
     return detected_language, None  # Let Whisper detect it during transcription too
 
 
+def _diarize_in_background(diarizer: "SpeakerDiarizer", audio_path: Path) -> Future[list[tuple[float, float, str]]]:
+    """Start diarizing audio_path on a daemon thread and return a future for its segments.
+
+    concurrent.futures joins its worker threads at interpreter exit, so a failed or
+    interrupted transcription would still wait for pyannote to finish. A daemon thread
+    is abandoned instead, letting the CLI exit straight away.
+    """
+    future: Future[list[tuple[float, float, str]]] = Future()
+    future.set_running_or_notify_cancel()
+
+    def run() -> None:
+        try:
+            future.set_result(_cached_diarize(diarizer, audio_path))
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=run, name="vtt-diarize", daemon=True).start()
+    return future
+
+
+def _transcribe_and_diarize(
+    args: Any,
+    transcriber: Any,
+    input_path: Path,
+    audio_path: Path | None,
+    *,
+    keep_audio: bool,
+    language: str | None,
+) -> str:
+    """Transcribe the input and label the transcript with diarized speakers.
+
+    Diarization runs locally while transcription mostly waits on the OpenAI API, so when the
+    audio file is already in place it is diarized in a worker thread during transcription.
+
+    Returns:
+        The transcript with speaker labels applied.
+    """
+    from vtt_transcribe.transcriber import VideoTranscriber
+
+    SpeakerDiarizer, _, _, _ = _lazy_import_diarization()  # noqa: N806
+    diarizer = SpeakerDiarizer(hf_token=args.hf_token, device=args.device, batch_size=args.diarization_batch_size)
+
+    # Determine the audio path used for transcription
+    is_audio_input = input_path.suffix.lower() in VideoTranscriber.SUPPORTED_AUDIO_FORMATS
+    if is_audio_input:
+        # Input was audio, it was used directly
+        actual_audio_path = input_path
+    elif audio_path:
+        # Custom audio output path was specified
+        actual_audio_path = audio_path
+    else:
+        # Default audio path (video name with .mp3 extension)
+        actual_audio_path = input_path.with_suffix(AUDIO_EXTENSION)
+
+    # Only overlap when transcribe() will not re-extract the file the diarizer is reading
+    segments_future = None
+    if actual_audio_path.exists() and (is_audio_input or not args.force):
+        print("\nRunning speaker diarization alongside transcription...")
+        segments_future = _diarize_in_background(diarizer, actual_audio_path)
+
+    # Audio cleanup waits until diarization has read the file
+    result = transcriber.transcribe(
+        input_path,
+        audio_path,
+        force=args.force,
+        keep_audio=True,
+        scan_chunks=args.scan_chunks,
+        language=language,
+    )
+
+    if segments_future is None:
+        print("\nRunning speaker diarization...")
+        segments = _cached_diarize(diarizer, actual_audio_path)
+    else:
+        segments = segments_future.result()
+
+    result = diarizer.apply_speakers_to_transcript(result, segments)
+    # Free the model before the interactive review, which can stay open for a long time
+    diarizer.release_pipeline()
+
+    if not keep_audio:
+        transcriber.cleanup_audio_files(actual_audio_path)
+
+    return result
+
+
 def handle_standard_transcription(args: Any, api_key: str) -> str:
     """Handle standard transcription workflow with optional diarization and translation.
 
@@ -404,10 +594,10 @@ def handle_standard_transcription(args: Any, api_key: str) -> str:
         "Starting standard transcription workflow",
         extra={
             "input_file": args.input_file,
-            "translate": args.translate if hasattr(args, "translate") else False,
-            "diarize": args.diarize if hasattr(args, "diarize") else False,
-            "translate_to": args.translate_to if hasattr(args, "translate_to") else None,
-            "language": args.language if hasattr(args, "language") else None,
+            "translate": getattr(args, "translate", False),
+            "diarize": getattr(args, "diarize", False),
+            "translate_to": getattr(args, "translate_to", None),
+            "language": getattr(args, "language", None),
         },
     )
 
@@ -450,34 +640,10 @@ def handle_standard_transcription(args: Any, api_key: str) -> str:
     # Detect or use manual language override
     _detected_language, language_to_use = _detect_or_override_language(args, transcriber, input_path)
 
-    result = transcriber.transcribe(
-        input_path,
-        audio_path,
-        force=args.force,
-        keep_audio=keep_audio,
-        scan_chunks=args.scan_chunks,
-        language=language_to_use,
-    )
-
-    # Apply diarization if requested
     if args.diarize:
-        SpeakerDiarizer, _, _, _ = _lazy_import_diarization()  # noqa: N806
-        diarizer = SpeakerDiarizer(hf_token=args.hf_token, device=args.device)
-        # Determine the audio path used for transcription
-        # After transcribe() has run, the audio file should exist at the expected location
-        if input_path.suffix.lower() in VideoTranscriber.SUPPORTED_AUDIO_FORMATS:
-            # Input was audio, it was used directly
-            actual_audio_path = input_path
-        elif audio_path:
-            # Custom audio output path was specified
-            actual_audio_path = audio_path
-        else:
-            # Default audio path (video name with .mp3 extension)
-            actual_audio_path = input_path.with_suffix(AUDIO_EXTENSION)
-
-        print("\nRunning speaker diarization...")
-        segments = diarizer.diarize_audio(actual_audio_path)
-        result = diarizer.apply_speakers_to_transcript(result, segments)
+        result = _transcribe_and_diarize(
+            args, transcriber, input_path, audio_path, keep_audio=keep_audio, language=language_to_use
+        )
 
         # Run speaker review unless disabled
         if not args.no_review_speakers:
@@ -488,6 +654,15 @@ def handle_standard_transcription(args: Any, api_key: str) -> str:
                 device=args.device,
                 transcript=result,
             )
+    else:
+        result = transcriber.transcribe(
+            input_path,
+            audio_path,
+            force=args.force,
+            keep_audio=keep_audio,
+            scan_chunks=args.scan_chunks,
+            language=language_to_use,
+        )
 
     # Apply text translation if requested
     if args.translate_to:
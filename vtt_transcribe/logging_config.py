@@ -10,14 +10,44 @@ import logging.handlers
 import os
 import sys
 import uuid
-from collections.abc import Generator, MutableMapping
+from collections.abc import Generator, Mapping, MutableMapping
 from contextlib import contextmanager
 from contextvars import ContextVar
 from pathlib import Path
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any
 
 # Context variables for tracking operations across async boundaries
 _context_data: ContextVar[dict[str, Any] | None] = ContextVar("context_data", default=None)
+_EMPTY_CONTEXT: Mapping[str, Any] = MappingProxyType({})
+
+# Built-in LogRecord attributes; anything else on a record came from extra={} or the context
+_STANDARD_LOGRECORD_ATTRS = frozenset(
+    {
+        "name",
+        "msg",
+        "args",
+        "created",
+        "msecs",
+        "levelname",
+        "levelno",
+        "pathname",
+        "filename",
+        "module",
+        "exc_info",
+        "exc_text",
+        "stack_info",
+        "lineno",
+        "funcName",
+        "processName",
+        "process",
+        "threadName",
+        "thread",
+        "taskName",
+        "relativeCreated",
+        "message",
+    }
+)
 
 
 @contextmanager
@@ -69,14 +99,15 @@ def operation_context(operation_name: str, *, operation_id: str | None = None, *
         _context_data.reset(token_context)
 
 
-def get_operation_context() -> dict[str, Any]:
+def get_operation_context() -> Mapping[str, Any]:
     """Get the current operation context data.
 
     Returns:
-        Dictionary with current operation context, empty if no context set
+        Read-only view of the current operation context, empty if no context set.
+        Use dict(...) for a writable snapshot.
     """
     context = _context_data.get()
-    return context.copy() if context is not None else {}
+    return MappingProxyType(context) if context is not None else _EMPTY_CONTEXT
 
 
 if TYPE_CHECKING:
@@ -99,13 +130,13 @@ class ContextualLoggerAdapter(_LoggerAdapterBase):
         Returns:
             Tuple of (message, updated kwargs)
         """
-        # Get current context
-        context = get_operation_context()
+        # Read the context without copying it; the merge below builds the only new dict
+        context = _context_data.get()
 
         if context:
             # Merge context with any existing extra data
-            extra = kwargs.get("extra", {})
-            kwargs["extra"] = {**context, **extra}
+            extra = kwargs.get("extra")
+            kwargs["extra"] = {**context, **extra} if extra else context
 
         return msg, kwargs
 
@@ -176,10 +207,10 @@ def setup_logging(
     # Create or get logger
     logger = logging.getLogger("vtt_transcribe")
 
-    # Close and remove existing handlers to avoid duplicates and resource leaks
-    for handler in logger.handlers[:]:
+    # Detach existing handlers in one step, then close them to avoid duplicates and resource leaks
+    old_handlers, logger.handlers = logger.handlers, []
+    for handler in old_handlers:
         _safely_flush_and_close_handler(handler)
-        logger.removeHandler(handler)
 
     # Set log level based on mode
     logger.setLevel(logging.DEBUG if dev_mode else logging.INFO)
@@ -281,29 +312,9 @@ class JsonFormatter(logging.Formatter):
         # Add extra fields from record
         # Preserve custom fields passed via extra={} in log calls
         for key, value in record.__dict__.items():
-            if key not in (
-                "name",
-                "msg",
-                "args",
-                "created",
-                "msecs",
-                "levelname",
-                "levelno",
-                "pathname",
-                "filename",
-                "module",
-                "exc_info",
-                "exc_text",
-                "stack_info",
-                "lineno",
-                "funcName",
-                "processName",
-                "process",
-                "threadName",
-                "thread",
-                "taskName",
-                "relativeCreated",
-            ):
+            if key not in _STANDARD_LOGRECORD_ATTRS:
                 log_data[key] = value
 
-        return json.dumps(log_data)
+        # Compact separators keep each log line short for the log sink; default=str
+        # serializes values such as Path or UUID passed via extra={} instead of failing
+        return json.dumps(log_data, separators=(",", ":"), default=str)
@@ -54,7 +54,9 @@ def handle_diarization_modes(args: Namespace) -> bool:
                 "no_review_speakers": args.no_review_speakers,
             },
         )
-        diarization_result = handle_diarize_only_mode(Path(args.input_file), args.hf_token, save_path, args.device)
+        diarization_result = handle_diarize_only_mode(
+            Path(args.input_file), args.hf_token, save_path, args.device, args.diarization_batch_size
+        )
 
         # Run review unless disabled
         if not args.no_review_speakers:
@@ -79,7 +81,12 @@ def handle_diarization_modes(args: Namespace) -> bool:
             },
         )
         apply_result = handle_apply_diarization_mode(
-            Path(args.input_file), Path(args.apply_diarization), args.hf_token, save_path, args.device
+            Path(args.input_file),
+            Path(args.apply_diarization),
+            args.hf_token,
+            save_path,
+            args.device,
+            args.diarization_batch_size,
         )
 
         # Run review unless disabled
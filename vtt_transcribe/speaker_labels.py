@@ -0,0 +1,136 @@
+"""Speaker label helpers for diarized transcripts.
+
+These functions only work on text and segment tuples, so unlike
+vtt_transcribe.diarization they do not import torch or pyannote.audio.
+"""
+
+import re
+
+# Speaker label at the start of a transcript line: [HH:MM:SS - HH:MM:SS] or [MM:SS - MM:SS]
+# followed by SPEAKER_XX, with a colon (transcript lines) or without (diarization-only output).
+# MULTILINE lets finditer scan a whole transcript while .match still works on single lines;
+# the whitespace class excludes newlines so a match never spans two lines.
+SPEAKER_LINE_PATTERN = re.compile(r"^\[(?:\d{2}:)?\d{2}:\d{2} - (?:\d{2}:)?\d{2}:\d{2}\][^\S\n]+(SPEAKER_\d+):?", re.MULTILINE)
+
+
+def format_diarization_output(segments: list[tuple[float, float, str]]) -> str:
+    """Format diarization segments into human-readable output.
+
+    Args:
+        segments: List of (start_time, end_time, speaker_label) tuples.
+
+    Returns:
+        Formatted string with [MM:SS - MM:SS] Speaker format.
+    """
+
+    def format_time(seconds: float) -> str:
+        total_seconds = int(seconds)
+        minutes = total_seconds // 60
+        secs = total_seconds % 60
+        return f"{minutes:02d}:{secs:02d}"
+
+    lines = []
+    for start, end, speaker in segments:
+        start_str = format_time(start)
+        end_str = format_time(end)
+        lines.append(f"[{start_str} - {end_str}] {speaker}")
+
+    return "\n".join(lines)
+
+
+def get_unique_speakers(segments: list[tuple[float, float, str]]) -> list[str]:
+    """Extract unique speaker labels from segments in order of first appearance.
+
+    Args:
+        segments: List of (start_time, end_time, speaker_label) tuples.
+
+    Returns:
+        List of unique speaker labels in order of first appearance.
+    """
+    # dict keys keep insertion order, so this de-duplicates in one pass
+    return list(dict.fromkeys(speaker for _, _, speaker in segments))
+
+
+def get_speaker_context_lines(
+    transcript: str,
+    speaker_label: str,
+    context_lines: int = 5,
+    max_contexts: int | None = None,
+) -> list[str]:
+    """Extract context lines for a specific speaker's segments from transcript.
+
+    Args:
+        transcript: Transcript with [HH:MM:SS - HH:MM:SS] SPEAKER_XX: text format.
+                   Also accepts legacy [MM:SS - MM:SS] format for backward compatibility.
+        speaker_label: Speaker label to extract contexts for.
+        context_lines: Number of lines to show before and after each speaker segment group.
+        max_contexts: Stop scanning once this many segment groups are found (None for all).
+
+    Returns:
+        List of context strings, one per continuous segment group for the speaker.
+    """
+    # Split transcript into lines
+    lines = transcript.split("\n")
+
+    # Find groups of continuous segments for the speaker
+    speaker_groups = []
+    current_group: list[int] = []
+    for i, line in enumerate(lines):
+        match = SPEAKER_LINE_PATTERN.match(line)
+        if match and match.group(1) == speaker_label:
+            current_group.append(i)
+        elif current_group:
+            # End of a group
+            speaker_groups.append(current_group)
+            current_group = []
+            if max_contexts is not None and len(speaker_groups) >= max_contexts:
+                break
+    if current_group:
+        speaker_groups.append(current_group)
+
+    # Extract context for each group
+    contexts = []
+    for group in speaker_groups:
+        start_idx = max(0, group[0] - context_lines)
+        end_idx = min(len(lines), group[-1] + context_lines + 1)
+        context = "\n".join(lines[start_idx:end_idx])
+        contexts.append(context)
+
+    return contexts
+
+
+def get_first_speaker_contexts(transcript: str, context_lines: int = 5) -> dict[str, str]:
+    """Extract the context around every speaker's first segment group in one pass.
+
+    Equivalent to calling get_speaker_context_lines(..., max_contexts=1) for each
+    speaker, without splitting and scanning the transcript once per speaker.
+
+    Args:
+        transcript: Transcript with [HH:MM:SS - HH:MM:SS] SPEAKER_XX: text format.
+                   Also accepts legacy [MM:SS - MM:SS] format for backward compatibility.
+        context_lines: Number of lines to show before and after each speaker segment group.
+
+    Returns:
+        Dict mapping each speaker label to its first context, in order of first appearance.
+    """
+    lines = transcript.split("\n")
+
+    # (first, last) line index of each speaker's first continuous group
+    first_groups: dict[str, tuple[int, int]] = {}
+    open_speaker = None
+    for i, line in enumerate(lines):
+        match = SPEAKER_LINE_PATTERN.match(line)
+        speaker = match.group(1) if match else None
+        if speaker is not None and speaker == open_speaker:
+            first_groups[speaker] = (first_groups[speaker][0], i)
+            continue
+        # Any other line ends the open group; only a speaker's first group is tracked
+        open_speaker = None
+        if speaker is not None and speaker not in first_groups:
+            first_groups[speaker] = (i, i)
+            open_speaker = speaker
+
+    return {
+        speaker: "\n".join(lines[max(0, first - context_lines) : last + context_lines + 1])
+        for speaker, (first, last) in first_groups.items()
+    }
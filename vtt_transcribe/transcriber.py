@@ -1,5 +1,8 @@
 import contextlib
+import os
 import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -25,7 +28,7 @@ class VideoTranscriber:
     """Transcribe video audio using OpenAI's Whisper model."""
 
     MAX_SIZE_MB = MAX_FILE_SIZE_MB
-    SUPPORTED_AUDIO_FORMATS = (".mp3", ".wav", ".ogg", ".m4a")
+    SUPPORTED_AUDIO_FORMATS = frozenset({".mp3", ".wav", ".ogg", ".m4a"})
 
     def __init__(self, api_key: str) -> None:
         """Initialize transcriber with API key."""
@@ -137,11 +140,8 @@ class VideoTranscriber:
 
     def cleanup_audio_files(self, audio_path: Path) -> None:
         """Delete audio file and chunks (delegates to AudioFileManager)."""
-        # Find chunks before deleting
-        chunks = AudioFileManager.find_chunks(audio_path)
-
         # Delete everything
-        AudioFileManager.cleanup_files(audio_path)
+        chunks = AudioFileManager.cleanup_files(audio_path)
 
         # Report what was deleted
         logger.info("Deleted audio file", extra={"audio_path": str(audio_path), "chunks": len(chunks)})
@@ -151,8 +151,7 @@ class VideoTranscriber:
 
     def cleanup_audio_chunks(self, audio_path: Path) -> None:
         """Delete only chunk files (delegates to AudioFileManager)."""
-        chunks = AudioFileManager.find_chunks(audio_path)
-        AudioFileManager.cleanup_chunks_only(audio_path)
+        chunks = AudioFileManager.cleanup_chunks_only(audio_path)
         if chunks:
             print(f"Deleted {len(chunks)} chunk files")
 
@@ -302,14 +301,16 @@ class VideoTranscriber:
                     "expected_count": num_chunks,
                 },
             )
-            chunk_files = []
-            for i in range(num_chunks):
-                start_time: float = i * chunk_duration
-                end_time: float = min((i + 1) * chunk_duration, duration)
-
-                # Extract chunk file
-                chunk_path: Path = self.extract_audio_chunk(audio_path, start_time, end_time, i)
-                chunk_files.append(chunk_path)
+            start_times = [i * chunk_duration for i in range(num_chunks)]
+            end_times = [min((i + 1) * chunk_duration, duration) for i in range(num_chunks)]
+
+            # Each chunk is an independent ffmpeg run, so extract them concurrently;
+            # map() keeps the results in chunk order
+            max_workers = max(1, min(num_chunks, os.cpu_count() or 1))
+            with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="vtt-chunk") as executor:
+                chunk_files = list(
+                    executor.map(self.extract_audio_chunk, repeat(audio_path), start_times, end_times, range(num_chunks))
+                )
 
         transcripts = self._transcribe_chunk_files(chunk_files, chunk_duration, keep_chunks=keep_chunks, language=language)
 